@@ -5,10 +5,11 @@ from kivy import Logger
 
 from kivy.cache import Cache
 
-from kivy.core.image import Image, ImageLoaderBase, ImageLoader, Texture
+from kivy.core.image import Image, ImageData, ImageLoaderBase, ImageLoader, Texture
 from mpf.core.assets import AssetPool
 
 from mpfmc.assets.mc_asset import McAsset
+from mpfmc.core.asset_cache import CachedBlock
 
 # This module has extra comments since it's what we tell people to use as an
 # example of an Asset implementation.
@@ -158,6 +159,26 @@ class LazyZipImageLoader(ImageLoaderBase):
         return (self.width, self.height)
 
 
+class CachedImageLoader(ImageLoaderBase):
+
+    """Image loader for already decoded frames from the asset cache."""
+
+    @staticmethod
+    def save(*largs, **kwargs):
+        raise AssertionError("Not supported")
+
+    def __init__(self, filename, frames, **kwargs):
+        self._frames = frames
+        super().__init__(filename, **kwargs)
+
+    def load(self, filename):
+        """Return the decoded frames."""
+        del filename
+        frames = self._frames
+        self._frames = None
+        return frames
+
+
 class KivyImageLoaderPatch:
 
     """Patch Kivy zip loader."""
@@ -220,7 +241,14 @@ class ImageAsset(McAsset):
             # lazy loading for zip file image sequences
             ImageLoader.zip_loader = KivyImageLoaderPatch.lazy_zip_loader
 
-        self._image = Image(self.config['file'],
+        image = self.config['file']
+        if self.machine.asset_cache and not (
+                image.endswith('.zip') and self.machine.machine_config['mpf-mc']['zip_lazy_loading']):
+            # skip decoding if the frames are in the asset cache
+            image = CachedImageLoader(self.config['file'], self._load_frames(),
+                                      keep_data=False, mipmap=False, nocache=True)
+
+        self._image = Image(image,
                             keep_data=False,
                             scale=1.0,
                             mipmap=False,
@@ -229,6 +257,22 @@ class ImageAsset(McAsset):
 
         self._image.anim_reset(False)
 
+    def _load_frames(self):
+        """Return the decoded frames from the asset cache or decode them."""
+        cache = self.machine.asset_cache
+        blocks = cache.read(self.config['file'], 'img')
+        if blocks:
+            return [ImageData(block.width, block.height, block.fmt, block.data,
+                              flip_vertical=block.flip_vertical, rowlength=block.rowlength)
+                    for block in blocks]
+
+        # pylint: disable-msg=protected-access
+        frames = ImageLoader.load(self.config['file'], keep_data=True, mipmap=False, nocache=True)._data
+        cache.write(self.config['file'], 'img',
+                    [CachedBlock(frame.width, frame.height, frame.rowlength or 0, frame.fmt,
+                                 frame.flip_vertical, frame.data) for frame in frames])
+        return frames
+
     def _do_unload(self):
         # This is the method that's called to unload the asset. It's called by
         # the main thread so you don't have to worry about thread
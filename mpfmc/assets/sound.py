@@ -14,6 +14,7 @@ from mpf.core.utility_functions import Util
 from mpfmc.core.audio.audio_interface import AudioInterface
 
 from mpfmc.assets.mc_asset import McAsset
+from mpfmc.core.asset_cache import CachedBlock
 from mpfmc.core.audio.audio_exception import AudioException
 
 
@@ -592,6 +593,9 @@ class SoundAsset(McAsset):
             if self.streaming:
                 self.log.debug("Sound %s loading for streaming", self.name)
                 self._container = self.machine.sound_system.audio_interface.load_sound_file_for_streaming(self.file)
+            elif self.machine.asset_cache:
+                self.log.debug("Sound %s loading to memory using the asset cache", self.name)
+                self._container = self._load_from_cache()
             else:
                 self.log.debug("Sound %s loading to memory", self.name)
                 self._container = self.machine.sound_system.audio_interface.load_sound_file_to_memory(self.file)
@@ -612,6 +616,23 @@ class SoundAsset(McAsset):
         #        raise
         #
 
+    def _load_from_cache(self):
+        """Load the decoded samples from the asset cache or decode and cache them."""
+        audio_interface = self.machine.sound_system.audio_interface
+        # samples are decoded to the output format so it is part of the cache key
+        settings = audio_interface.get_settings()
+        output_format = '{sample_rate}|{audio_channels}|{audio_format}'.format(**settings)
+
+        blocks = self.machine.asset_cache.read(self.file, 'pcm', output_format)
+        if blocks:
+            return audio_interface.load_sound_file_to_memory(self.file, blocks[0].data)
+
+        container = audio_interface.load_sound_file_to_memory(self.file)
+        self.machine.asset_cache.write(self.file, 'pcm',
+                                       [CachedBlock(0, 0, 0, 'pcm', False, container.get_sample_data())],
+                                       output_format)
+        return container
+
     def _do_unload(self):
         """Unloads the asset from memory"""
         self.log.debug("Sound %s unloading", self.name)
@@ -53,6 +53,12 @@ class Command:
                             action="store_false", dest="bcp", default=True,
                             help="Do not set up the BCP server threads")
 
+        parser.add_argument("--record-bcp",
+                            action="store", dest="bcp_record_file", default=None,
+                            metavar='session_file',
+                            help="Record all incoming BCP commands to this file for "
+                                 "replays and benchmarks")
+
         parser.add_argument("-c",
                             action="store", dest="configfile",
                             default="config", metavar='config_file(s)',
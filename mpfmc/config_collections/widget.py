@@ -6,6 +6,7 @@ from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 from mpf.core.utility_functions import Util
 from mpf.core.placeholder_manager import TextTemplate
 from mpfmc.core.config_collection import ConfigCollection
+from mpfmc.core.frozen_config import freeze
 from mpfmc.uix.widget import magic_events
 
 MYPY = False
@@ -36,7 +37,7 @@ class WidgetCollection(ConfigCollection):
         for widget in config:
             widget_list.append(self.process_widget(widget))
 
-        return widget_list
+        return freeze(widget_list)
 
     def _load_widget_by_name(self, config) -> dict:
         # Replace placeholders
@@ -104,7 +105,8 @@ class WidgetCollection(ConfigCollection):
                 "'target: default' is valid and will add the widget to the "
                 "default display on top of any slides.\n".format(config))
 
-        return config
+        # widgets only create overlays of their validated config
+        return freeze(config)
 
     def _register_trigger(self, event_name: str, **kwargs) -> None:
         del kwargs
@@ -1,14 +1,8 @@
-from functools import partial
-
-from kivy.graphics.instructions import Callback
-from kivy.uix.relativelayout import RelativeLayout
-
 from kivy.clock import Clock
-from kivy.graphics.fbo import Fbo
-from kivy.graphics.opengl import glReadPixels, GL_RGBA, GL_UNSIGNED_BYTE
-from kivy.graphics.texture import Texture
 
 from mpfmc.core.bcp_config_player import BcpConfigPlayer
+from mpfmc.core.display_capture import get_display_capture
+from mpfmc.core.light_sampler import LightMapSampler
 
 
 class McDisplayLightPlayer(BcpConfigPlayer):
@@ -22,7 +16,6 @@ class McDisplayLightPlayer(BcpConfigPlayer):
     def __init__(self, machine):
         super().__init__(machine)
         self._scheduled = False
-        self._last_color = {}
 
     # pylint: disable-msg=too-many-arguments
     def play_element(self, settings, element, context, calling_context, priority=0, **kwargs):
@@ -32,43 +25,29 @@ class McDisplayLightPlayer(BcpConfigPlayer):
                 self._scheduled = True
                 Clock.schedule_interval(self._tick, 0)
             if element not in context_dict:
-                context_dict[element] = self._setup_fbo(element, settings, context)
+                context_dict[element] = self._setup_capture(element, settings)
             else:
-                context_dict[element][5] = True
+                context_dict[element][4] = True
         elif settings['action'] == "stop":
             try:
-                context_dict[element][5] = False
+                context_dict[element][4] = False
             except IndexError:
                 pass
         else:
             raise AssertionError("Unknown action {}".format(settings['action']))
 
-    def _setup_fbo(self, element, settings, context):
-        """Setup FBO for a display."""
+    def _setup_capture(self, element, settings):
+        """Register with the shared capture of a display."""
         if element not in self.machine.displays:
             raise AssertionError("Display {} not found. Please create it to use display_light_player.".format(element))
         source = self.machine.displays[element]
 
-        # put the widget canvas on a Fbo
-        texture = Texture.create(size=source.size, colorfmt='rgba')
-        fbo = Fbo(size=source.size, texture=texture)
-
-        effect_widget = RelativeLayout()
-
-        effect_widget.size = source.size
+        capture = get_display_capture(self.machine, source)
+        rendering = self.machine.machine_config['mpf-mc']['display_light_rendering']
+        sampler = LightMapSampler(capture, settings['light_map'], rendering['readback_latency'],
+                                  rendering['gpu_sampling'])
 
-        fbo.add(effect_widget.canvas)
-        with source.canvas:
-            callback = Callback(partial(self._trigger_render, context, element))
-
-        return [fbo, effect_widget, source, settings, True, True, True, callback]
-
-    def _trigger_render(self, context, element, *args):
-        del args
-        context_dict = self._get_instance_dict(context)
-        if element not in context_dict:
-            return
-        context_dict[element][6] = True
+        return [capture, sampler, settings, True, True]
 
     def _tick(self, dt) -> None:
         del dt
@@ -79,69 +58,31 @@ class McDisplayLightPlayer(BcpConfigPlayer):
         del dt
         for context, instances in self.instances.items():
             for element, instance in instances.items():
-                if not element[5] or not element[6]:
-                    continue
-                self._render(instance, element, context)
+                if instance[4]:
+                    self._render(instance, element, context)
 
-    # pylint: disable-msg=too-many-locals
     def _render(self, instance, element, context):
-        fbo, effect_widget, source, settings, first, _, _, _ = instance
-        instance[4] = False
-        instance[6] = False
-
-        # detach the widget from the parent
-        parent = source.parent
-        if parent and hasattr(parent, "remove_display_source"):
-            parent.remove_display_source(source)
-
-        effect_widget.add_widget(source.container)
-
-        fbo.draw()
-
-        fbo.bind()
-        data = glReadPixels(0, 0, source.native_size[0], source.native_size[1],
-                            GL_RGBA, GL_UNSIGNED_BYTE)
-
-        fbo.release()
-
-        effect_widget.remove_widget(source.container)
-
-        # reattach to the parent
-        if parent and hasattr(parent, "add_display_source"):
-            parent.add_display_source(source)
-
-        if not first:
-            # for some reasons we got garbage in the first buffer. we just skip it for now
-            values = {}
-            width = source.native_size[0]
-            height = source.native_size[1]
-            for x, y, name in settings['light_map']:
-                x_pixel = int(x * width)
-                y_pixel = height - int(y * height)
-                if (data[width * y_pixel * 4 + x_pixel * 4 + 3]) == 0:
-                    # pixel is transparent
-                    value = -1
-                else:
-                    value = (
-                        data[width * y_pixel * 4 + x_pixel * 4],
-                        data[width * y_pixel * 4 + x_pixel * 4 + 1],
-                        data[width * y_pixel * 4 + x_pixel * 4 + 2])
-
-                if name not in self._last_color or self._last_color[name] != value:
-                    self._last_color[name] = value
-                    values[name] = value
-
-            self.machine.bcp_processor.send("trigger", name="display_light_player_apply", context=context,
-                                            values=values, element=element, _silent=True)
-        # clear the fbo background
-        fbo.bind()
-        fbo.clear_buffer()
-        fbo.release()
+        capture, sampler = instance[0:2]
+
+        # renders the display if it changed unless another consumer did already
+        capture.update()
+
+        for sample in sampler.sample():
+            if instance[3]:
+                # for some reasons we got garbage in the first buffer. we just skip it for now
+                instance[3] = False
+                continue
+
+            values = sampler.get_changes(sample)
+            if values:
+                # only changes are sent. merge them if the previous ones are still queued
+                self.machine.bcp_processor.send("trigger", name="display_light_player_apply", context=context,
+                                                values=values, element=element, _silent=True,
+                                                stream_key="display_light_player_apply:{}:{}".format(
+                                                    context, element),
+                                                merge="values")
 
     def clear_context(self, context):
-        context_dict = self._get_instance_dict(context)
-        for _, instance in context_dict.items():
-            instance[2].canvas.remove(instance[7])
         self._reset_instance_dict(context)
 
 
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from mpfmc.core.frozen_config import overlay
 from mpfmc.core.mc_config_player import McConfigPlayer
 
 
@@ -112,8 +112,7 @@ class McSlidePlayer(McConfigPlayer):
                     continue
                 slide = slide.name
 
-            s = deepcopy(s)
-            s.update(kwargs)
+            s = overlay(s, kwargs)
 
             if s.get("slide"):
                 slide = s['slide']
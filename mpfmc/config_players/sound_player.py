@@ -1,7 +1,7 @@
 """Contains the sound config player class"""
 
-from copy import deepcopy
 from mpf.core.config_validator import ConfigValidator
+from mpfmc.core.frozen_config import overlay
 from mpfmc.core.mc_config_player import McConfigPlayer
 
 
@@ -77,12 +77,12 @@ Here are several various examples:
 
         """
         del calling_context
-        settings = deepcopy(settings)
 
         if 'sounds' in settings:
             settings = settings['sounds']
 
         for sound_name, s in settings.items():
+            s = overlay(s)
 
             try:
                 s['priority'] += priority
@@ -1,7 +1,7 @@
 """Widget player which can add and remove widgets from slides."""
 
-from copy import deepcopy
 from mpf.core.events import EventHandlerKey
+from mpfmc.core.frozen_config import overlay
 from mpfmc.core.mc_config_player import McConfigPlayer
 from mpfmc.uix.widget import create_widget_objects_from_library
 
@@ -49,8 +49,10 @@ class McWidgetPlayer(McConfigPlayer):
     def _action_add(self, s, instance_dict, widget, context, play_kwargs):
         if not s['key']:
             try:
-                s['key'] = s['widget_settings'].pop('key')
-            except (KeyError, AttributeError):
+                widget_settings = overlay(s['widget_settings'])
+                s['key'] = widget_settings.pop('key')
+                s['widget_settings'] = widget_settings
+            except (KeyError, TypeError):
                 s['key'] = context + "-" + widget
 
         if s.get('target'):
@@ -143,13 +145,13 @@ class McWidgetPlayer(McConfigPlayer):
         # **kwargs since this is an event callback
         del priority
         del calling_context
-        settings = deepcopy(settings)
         instance_dict = self._get_instance_dict(context)
 
         if 'widgets' in settings:
             settings = settings['widgets']
 
         for widget, s in settings.items():
+            s = overlay(s)
             action = s.pop('action')
             assert action in ('add', 'remove', 'update')
 
@@ -165,6 +167,9 @@ class McWidgetPlayer(McConfigPlayer):
 
     def _remove_widget_by_key(self, key):
         """Remove widget by key."""
+        if not self.machine.widget_index.get(key):
+            return
+
         for target in self.machine.targets.values():
             target.remove_widgets_by_key(key)
 
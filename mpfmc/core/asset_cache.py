@@ -0,0 +1,147 @@
+"""On-disk cache of decoded asset data.
+
+Decoding PNGs, GIFs, WAVs and OGGs is the slowest part of booting a machine
+with many assets. The cache stores the decoded pixel data of images and the
+PCM samples of sounds in a flat binary file per asset. On the next boot the
+file is memory mapped and copied into the asset without decoding it again.
+
+Entries are keyed by the absolute path, mtime and size of the asset file plus
+an optional extra string (e.g. the audio output format of sounds). Changed
+assets get a new key so stale entries are never used. Entries which are no
+longer used are not removed. Delete the cache folder to clean it up.
+
+Every file starts with a header followed by a table of blocks and the data of
+all blocks::
+
+    0   magic (8 bytes) b'MPFMCAST'
+    8   version (uint32)
+    12  number of blocks (uint32)
+    16  block table. per block: width (uint32), height (uint32),
+        row length (uint32), length (uint64), format (16 bytes, ascii),
+        flip vertical (bool)
+
+All values are little endian. Images have one block per frame. Sounds have a
+single block with the format "pcm" and zero width, height and row
+length.
+"""
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections import namedtuple
+from typing import List, Optional
+
+MAGIC = b'MPFMCAST'
+VERSION = 1
+HEADER = struct.Struct('<8sII')
+BLOCK = struct.Struct('<IIIQ16s?')
+
+CachedBlock = namedtuple('CachedBlock', ['width', 'height', 'rowlength', 'fmt', 'flip_vertical', 'data'])
+
+
+def get_default_cache_path() -> str:
+    """Return the folder used if mpf-mc: asset_cache: path is empty."""
+    return os.path.join(tempfile.gettempdir(), 'mpfmc_asset_cache')
+
+
+class AssetCache:
+
+    """Cache of decoded asset data in a folder.
+
+    The cache is used by the asset loader threads so all methods are thread
+    safe.
+
+    Args:
+        path: Folder of the cache. It is created if it does not exist.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        """Create the cache folder."""
+        self.log = logging.getLogger('AssetCache')
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+
+    def get_filename(self, file: str, kind: str, extra: str = '') -> str:
+        """Return the cache file of an asset file.
+
+        Args:
+            file: The asset file.
+            kind: Extension of the cache file, e.g. "img" or "pcm".
+            extra: Additional settings which change the decoded data.
+        """
+        stat = os.stat(file)
+        key = '{}|{}|{}|{}'.format(os.path.abspath(file), stat.st_mtime_ns, stat.st_size, extra)
+        return os.path.join(self.path, '{}.{}'.format(hashlib.sha1(key.encode()).hexdigest(), kind))
+
+    def read(self, file: str, kind: str, extra: str = '') -> Optional[List[CachedBlock]]:
+        """Return the cached blocks of an asset file or None.
+
+        The data of every block is copied out of the mapped file so the
+        cache file can be replaced while the asset is loaded.
+        """
+        try:
+            filename = self.get_filename(file, kind, extra)
+            with open(filename, 'rb') as cache_file:
+                with mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ) as cache_map:
+                    blocks = self._parse(cache_map)
+        except (OSError, ValueError, struct.error):
+            blocks = None
+
+        with self._lock:
+            if blocks is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return blocks
+
+    @staticmethod
+    def _parse(cache_map) -> List[CachedBlock]:
+        magic, version, count = HEADER.unpack_from(cache_map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not an asset cache file of version {}".format(VERSION))
+
+        table_offset = HEADER.size
+        data_offset = table_offset + count * BLOCK.size
+        blocks = []
+        for _ in range(count):
+            width, height, rowlength, length, fmt, flip_vertical = BLOCK.unpack_from(cache_map, table_offset)
+            table_offset += BLOCK.size
+            if data_offset + length > len(cache_map):
+                raise ValueError("Truncated asset cache file")
+
+            blocks.append(CachedBlock(width, height, rowlength, fmt.rstrip(b'\0').decode(), flip_vertical,
+                                      cache_map[data_offset:data_offset + length]))
+            data_offset += length
+
+        return blocks
+
+    def write(self, file: str, kind: str, blocks: List[CachedBlock], extra: str = '') -> None:
+        """Store the decoded blocks of an asset file.
+
+        The file is written under a temporary name and renamed so other
+        processes never see a partial file. Errors are logged and ignored
+        since the asset is loaded anyway.
+        """
+        try:
+            filename = self.get_filename(file, kind, extra)
+            temp_filename = '{}.{}.tmp'.format(filename, threading.get_ident())
+            with open(temp_filename, 'wb') as cache_file:
+                cache_file.write(HEADER.pack(MAGIC, VERSION, len(blocks)))
+                for block in blocks:
+                    cache_file.write(BLOCK.pack(block.width, block.height, block.rowlength, len(block.data),
+                                                block.fmt.encode(), block.flip_vertical))
+                for block in blocks:
+                    cache_file.write(block.data)
+
+            os.replace(temp_filename, filename)
+        except OSError as e:
+            self.log.warning("Could not write cache file for %s: %s", file, e)
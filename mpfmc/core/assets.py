@@ -1,6 +1,7 @@
 """Threaded Asset Loader for MC."""
 import logging
 import threading
+import time
 import traceback
 from queue import PriorityQueue, Queue, Empty
 
@@ -11,25 +12,58 @@ from mpf.core.assets import BaseAssetManager
 
 class ThreadedAssetManager(BaseAssetManager):
 
-    """AssetManager which uses the Threading module."""
+    """AssetManager which uses the Threading module.
+
+    A pool of loader threads (mpf-mc: asset_loader: threads) takes assets
+    from one PriorityQueue so the highest priority asset is always loaded
+    next. Most decoders (SDL2 image, SDL_mixer) release the GIL so several
+    assets load in parallel.
+    """
 
     def __init__(self, machine):
-        """Initialise queues and start loader thread."""
+        """Initialise queues and start loader threads."""
         super().__init__(machine)
         self.loader_queue = PriorityQueue()  # assets for to the loader thread
         self.loaded_queue = Queue()  # assets loaded from the loader thread
         self.loader_thread = None
+        self.loader_threads = []
+        self.load_times = dict()
+        """Asset class name -> [count, total seconds, max seconds]."""
         self._loaded_watcher = False
+        self._start_time = time.perf_counter()
+
+        config = self.machine.machine_config['mpf-mc']['asset_loader']
+        for _ in range(max(int(config['threads']), 1)):
+            self._start_loader_thread()
 
-        self._start_loader_thread()
+        self.machine.events.add_handler('init_done', self._report_load_times)
 
     def _start_loader_thread(self):
-        self.loader_thread = AssetLoader(loader_queue=self.loader_queue,
-                                         loaded_queue=self.loaded_queue,
-                                         exception_queue=self.machine.crash_queue,
-                                         thread_stopper=self.machine.thread_stopper)
-        self.loader_thread.daemon = True
-        self.loader_thread.start()
+        loader_thread = AssetLoader(loader_queue=self.loader_queue,
+                                    loaded_queue=self.loaded_queue,
+                                    exception_queue=self.machine.crash_queue,
+                                    thread_stopper=self.machine.thread_stopper)
+        loader_thread.name = 'asset_loader_{}'.format(len(self.loader_threads))
+        loader_thread.daemon = True
+        loader_thread.start()
+
+        if not self.loader_thread:
+            self.loader_thread = loader_thread
+        self.loader_threads.append(loader_thread)
+
+    def _report_load_times(self, **kwargs):
+        """Log how long each asset class took to load until init_done."""
+        del kwargs
+        self.machine.log.info("Assets loaded in %.2fs with %s loader thread(s)",
+                              time.perf_counter() - self._start_time, len(self.loader_threads))
+        for class_name, (count, total, maximum) in sorted(self.load_times.items()):
+            self.machine.log.info("  %s: %s assets, %.2fs total, %.1fms average, %.1fms max",
+                                  class_name, count, total, total / count * 1000, maximum * 1000)
+
+        asset_cache = getattr(self.machine, 'asset_cache', None)
+        if asset_cache:
+            self.machine.log.info("  Asset cache %s: %s hits, %s misses",
+                                  asset_cache.path, asset_cache.hits, asset_cache.misses)
 
     def load_asset(self, asset):
         """Put asset in loader queue."""
@@ -56,8 +90,9 @@ class ThreadedAssetManager(BaseAssetManager):
         # checks the loaded queue and updates loading stats
         try:
             while not self.loaded_queue.empty():
-                asset, loaded = self.loaded_queue.get()
+                asset, loaded, seconds = self.loaded_queue.get()
                 if loaded:
+                    self._add_load_time(asset, seconds)
                     asset.is_loaded()
                 self.num_assets_loaded += 1
                 self._post_loading_event()
@@ -70,6 +105,19 @@ class ThreadedAssetManager(BaseAssetManager):
             self.machine.clock.unschedule(self._loaded_watcher)
             self._loaded_watcher = None
 
+    def _add_load_time(self, asset, seconds):
+        """Add the load time of an asset to the statistics of its class."""
+        class_name = asset.__class__.__name__
+        try:
+            times = self.load_times[class_name]
+        except KeyError:
+            times = self.load_times[class_name] = [0, 0.0, 0.0]
+
+        times[0] += 1
+        times[1] += seconds
+        if seconds > times[2]:
+            times[2] = seconds
+
 
 class AssetLoader(threading.Thread):
 
@@ -80,8 +128,9 @@ class AssetLoader(threading.Thread):
             holds assets waiting to be loaded. Items are automatically sorted
             in reverse order by priority, then creation ID.
         loaded_queue: A reference to the asset manager's loaded_queue which
-            holds assets that have just been loaded. Entries are Asset
-            instances.
+            holds assets that have just been loaded. Entries are tuples of
+            the Asset instance, whether it has been loaded by this thread and
+            the load time in seconds.
         exception_queue: Send a reference to self.machine.crash_queue. This way if
             the asset loader crashes, it will write the crash to that queue and
             cause an exception in the main thread. Otherwise it fails silently
@@ -111,10 +160,11 @@ class AssetLoader(threading.Thread):
                 if asset:
                     with asset.lock:
                         if not asset.loaded:
+                            start = time.perf_counter()
                             asset.do_load()
-                            self.loaded_queue.put((asset, True))
+                            self.loaded_queue.put((asset, True, time.perf_counter() - start))
                         else:
-                            self.loaded_queue.put((asset, False))
+                            self.loaded_queue.put((asset, False, 0))
 
             return
 
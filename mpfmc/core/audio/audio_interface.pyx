@@ -400,6 +400,7 @@ cdef class AudioInterface:
         if self.enabled:
             return {'sample_rate': self.audio_callback_data.sample_rate,
                     'audio_channels': self.audio_callback_data.channels,
+                    'audio_format': self.audio_callback_data.format,
                     'buffer_samples': self.audio_callback_data.buffer_samples,
                     'buffer_size': self.audio_callback_data.buffer_size
                     }
@@ -675,18 +676,22 @@ cdef class AudioInterface:
         except KeyError:
             return None
 
-    def load_sound_file_to_memory(self, str file_name):
+    def load_sound_file_to_memory(self, str file_name, object sample_data=None):
         """
         Loads an audio file into a SoundMemoryFile wrapper object for use in a Sound object.
         Used in asset loading for Sound objects.
         Args:
             file_name: The audio file name to load.
+            sample_data: Optional buffer with the already decoded samples of the file in the
+                current sample output format (e.g. from the asset cache). The file is not
+                decoded when it is set.
 
         Returns:
             A SoundMemoryFile wrapper object containing a pointer to the sound sample
             data in memory.  An exception is thrown if the sound is unable to be loaded.
         """
-        return SoundMemoryFile(file_name, pycapsule.PyCapsule_New(&self.audio_callback_data, NULL, NULL))
+        return SoundMemoryFile(file_name, pycapsule.PyCapsule_New(&self.audio_callback_data, NULL, NULL),
+                               sample_data)
 
     def load_sound_file_for_streaming(self, str file_name):
         """
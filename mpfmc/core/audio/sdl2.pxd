@@ -120,6 +120,7 @@ cdef extern from "SDL.h" nogil:
                                                 Uint32 len, int volume)
     SDL_AudioSpec* SDL_LoadWAV(const char* file, SDL_AudioSpec* spec, Uint8** audio_buf, Uint32* audio_len)
     void SDL_FreeWAV(Uint8* audio_buf)
+    void *SDL_malloc(size_t size)
     void SDL_free(void *ptr)
 
     Uint32 SDL_GetTicks()
@@ -600,6 +600,7 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include "gst/gst.h"
 #include "glib.h"
 #include "gstreamer_helper.h"
+#include <string.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -614,7 +615,7 @@ typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* enc
 #define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
 #define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 1
 #define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
-#define __PYX_DEFAULT_STRING_ENCODING "utf-8"
+#define __PYX_DEFAULT_STRING_ENCODING "utf8"
 #define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
 #define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
 #define __Pyx_uchar_cast(c) ((unsigned char)c)
@@ -808,7 +809,7 @@ static const char *__pyx_filename;
 
 
 static const char *__pyx_f[] = {
-  "mpfmc\\core\\audio\\sound_file.pyx",
+  "mpfmc/core/audio/sound_file.pyx",
   "stringsource",
 };
 /* NoFastGil.proto */
@@ -833,7 +834,7 @@ union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16;
 struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 typedef struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 
-/* "mpfmc/core/audio/sdl2.pxd":231
+/* "mpfmc/core/audio/sdl2.pxd":232
  * # specific data structures used in the MPF media controller audio library:
  * 
  * cdef struct Sample16Bytes:             # <<<<<<<<<<<<<<
@@ -845,7 +846,7 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes {
   Uint8 byte1;
 };
 
-/* "mpfmc/core/audio/sdl2.pxd":238
+/* "mpfmc/core/audio/sdl2.pxd":239
  *     Uint8 byte1
  * 
  * cdef union Sample16:             # <<<<<<<<<<<<<<
@@ -857,7 +858,7 @@ union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 {
   struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes bytes;
 };
 
-/* "mpfmc/core/audio/sdl2.pxd":251
+/* "mpfmc/core/audio/sdl2.pxd":252
  * # ---------------------------------------------------------------------------
  * 
  * ctypedef struct AudioCallbackData:             # <<<<<<<<<<<<<<
@@ -956,12 +957,12 @@ struct __pyx_t_5mpfmc_4core_5audio_10sound_file_SoundSample {
   double duration;
 };
 
-/* "mpfmc/core/audio/sound_file.pyx":18
- * #    SoundFile class
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sound_file.pxd":33
+ * 
+ * 
  * cdef class SoundFile:             # <<<<<<<<<<<<<<
  *     """SoundFile is the base class for wrapper classes used to manage sound sample data."""
- * 
+ *     cdef str file_name
  */
 struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile {
   PyObject_HEAD
@@ -972,9 +973,9 @@ struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile {
 };
 
 
-/* "mpfmc/core/audio/sound_file.pyx":47
- * #    SoundMemoryFile class
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sound_file.pxd":41
+ * 
+ * 
  * cdef class SoundMemoryFile(SoundFile):             # <<<<<<<<<<<<<<
  *     """SoundMemoryFile is a wrapper class to manage sound sample data stored
  *     in memory."""
@@ -985,12 +986,12 @@ struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile {
 };
 
 
-/* "mpfmc/core/audio/sound_file.pyx":123
- * #    SoundStreamingFile class
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sound_file.pxd":47
+ * 
+ * 
  * cdef class SoundStreamingFile(SoundFile):             # <<<<<<<<<<<<<<
  *     """SoundStreamingFile is a wrapper class to manage streaming sound sample data."""
- * 
+ *     cdef GstElement *pipeline
  */
 struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile {
   struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile __pyx_base;
@@ -1242,6 +1243,38 @@ static void __Pyx_WriteUnraisable(const char *name, int clineno,
                                   int lineno, const char *filename,
                                   int full_traceback, int nogil);
 
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
 /* KeywordStringCheck.proto */
 static int __Pyx_CheckKeywordStrings(PyObject *kwdict, const char* function_name, int kw_allowed);
 
@@ -1329,13 +1362,17 @@ static int __Pyx_check_binary_version(void);
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 
+/* Module declarations from 'mpfmc.core.audio.sdl2' */
+
+/* Module declarations from 'mpfmc.core.audio.gstreamer' */
+
 /* Module declarations from 'cpython.mem' */
 
-/* Module declarations from 'cpython.pycapsule' */
+/* Module declarations from 'cpython.buffer' */
 
-/* Module declarations from 'mpfmc.core.audio.sdl2' */
+/* Module declarations from 'libc.string' */
 
-/* Module declarations from 'mpfmc.core.audio.gstreamer' */
+/* Module declarations from 'cpython.pycapsule' */
 
 /* Module declarations from 'mpfmc.core.audio.sound_file' */
 static PyTypeObject *__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundFile = 0;
@@ -1349,6 +1386,7 @@ int __pyx_module_is_main_mpfmc__core__audio__sound_file = 0;
 static PyObject *__pyx_builtin_NotImplementedError;
 static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_super;
+static PyObject *__pyx_builtin_MemoryError;
 static const char __pyx_k__6[] = "\\";
 static const char __pyx_k__7[] = "/";
 static const char __pyx_k_os[] = "os";
@@ -1380,24 +1418,29 @@ static const char __pyx_k_TypeError[] = "TypeError";
 static const char __pyx_k_file_name[] = "file_name";
 static const char __pyx_k_getLogger[] = "getLogger";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_SoundFile_2[] = "<SoundFile>";
+static const char __pyx_k_sample_data[] = "sample_data";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_AudioException[] = "AudioException";
 static const char __pyx_k_SoundMemoryFile[] = "SoundMemoryFile";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_destroy_pipeline[] = "_destroy_pipeline";
+static const char __pyx_k_load_from_buffer[] = "load_from_buffer";
 static const char __pyx_k_SoundStreamingFile[] = "SoundStreamingFile";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_construct_pipeline[] = "_construct_pipeline";
 static const char __pyx_k_NotImplementedError[] = "NotImplementedError";
 static const char __pyx_k_audio_callback_data[] = "audio_callback_data";
 static const char __pyx_k_Could_not_locate_file[] = "Could not locate file ";
+static const char __pyx_k_No_sample_data_for_file[] = "No sample data for file ";
 static const char __pyx_k_SoundMemoryFile_Loaded_False[] = "<SoundMemoryFile({}, Loaded=False)>";
 static const char __pyx_k_SoundStreamingFile_Loaded_True[] = "<SoundStreamingFile({}, Loaded=True, sample_duration={}s)>";
 static const char __pyx_k_Loaded_file_s_Sample_duration_s[] = "Loaded file: %s Sample duration: %s";
 static const char __pyx_k_SoundMemoryFile_Loaded_True_sam[] = "<SoundMemoryFile({}, Loaded=True, sample_duration={}s)>";
 static const char __pyx_k_SoundStreamingFile_Loaded_False[] = "<SoundStreamingFile({}, Loaded=False)>";
 static const char __pyx_k_Could_not_load_sound_file_due_to[] = "Could not load sound file {} due to an error: {}";
+static const char __pyx_k_Loaded_file_from_buffer_s_Sample[] = "Loaded file from buffer: %s Sample duration: %s";
 static const char __pyx_k_Must_be_implemented_in_derived_c[] = "Must be implemented in derived class";
 static const char __pyx_k_Unable_to_create_a_GStreamer_pip[] = "Unable to create a GStreamer pipeline: code={} message={}";
 static const char __pyx_k_Unable_to_get_bus_from_the_pipel[] = "Unable to get bus from the pipeline";
@@ -1409,8 +1452,11 @@ static const char __pyx_k_uridecodebin_uri_audioconvert_au[] = "uridecodebin uri
 static PyObject *__pyx_n_s_AudioException;
 static PyObject *__pyx_kp_u_Could_not_load_sound_file_due_to;
 static PyObject *__pyx_kp_u_Could_not_locate_file;
+static PyObject *__pyx_kp_u_Loaded_file_from_buffer_s_Sample;
 static PyObject *__pyx_kp_u_Loaded_file_s_Sample_duration_s;
+static PyObject *__pyx_n_s_MemoryError;
 static PyObject *__pyx_kp_u_Must_be_implemented_in_derived_c;
+static PyObject *__pyx_kp_u_No_sample_data_for_file;
 static PyObject *__pyx_n_s_NotImplementedError;
 static PyObject *__pyx_n_u_S16BE;
 static PyObject *__pyx_n_u_S16LE;
@@ -1447,6 +1493,7 @@ static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_init;
 static PyObject *__pyx_n_s_isfile;
 static PyObject *__pyx_n_s_load;
+static PyObject *__pyx_n_s_load_from_buffer;
 static PyObject *__pyx_n_s_loaded;
 static PyObject *__pyx_n_s_logging;
 static PyObject *__pyx_n_s_main;
@@ -1458,6 +1505,7 @@ static PyObject *__pyx_n_s_path;
 static PyObject *__pyx_n_s_reduce;
 static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_sample_data;
 static PyObject *__pyx_kp_s_self_callback_data_self_sample_c;
 static PyObject *__pyx_n_s_setstate;
 static PyObject *__pyx_n_s_setstate_cython;
@@ -1473,14 +1521,16 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_6unload(CY
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_8duration___get__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_8__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_10__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
-static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, PyObject *__pyx_v_file_name, PyObject *__pyx_v_audio_callback_data); /* proto */
+static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, PyObject *__pyx_v_file_name, PyObject *__pyx_v_audio_callback_data, PyObject *__pyx_v_sample_data); /* proto */
 static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__dealloc__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__repr__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6load(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8unload(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8load_from_buffer(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, PyObject *__pyx_v_sample_data); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10get_sample_data(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12unload(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6loaded___get__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_14__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_16__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cinit__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_args, CYTHON_UNUSED PyObject *__pyx_v_kwargs); /* proto */
 static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__init__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile *__pyx_v_self, PyObject *__pyx_v_file_name, PyObject *__pyx_v_audio_callback_data); /* proto */
 static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__dealloc__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile *__pyx_v_self); /* proto */
@@ -1505,7 +1555,7 @@ static PyObject *__pyx_tuple__8;
 static PyObject *__pyx_tuple__9;
 /* Late includes */
 
-/* "mpfmc/core/audio/sound_file.pyx":21
+/* "mpfmc/core/audio/sound_file.pyx":23
  *     """SoundFile is the base class for wrapper classes used to manage sound sample data."""
  * 
  *     def __init__(self, str file_name, object audio_callback_data):             # <<<<<<<<<<<<<<
@@ -1544,11 +1594,11 @@ static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_9SoundFile_1__init__(PyObje
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_audio_callback_data)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 21, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 23, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 21, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 23, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -1561,13 +1611,13 @@ static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_9SoundFile_1__init__(PyObje
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 21, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 23, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.sound_file.SoundFile.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file_name), (&PyUnicode_Type), 1, "file_name", 1))) __PYX_ERR(0, 21, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file_name), (&PyUnicode_Type), 1, "file_name", 1))) __PYX_ERR(0, 23, __pyx_L1_error)
   __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile___init__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *)__pyx_v_self), __pyx_v_file_name, __pyx_v_audio_callback_data);
 
   /* function exit code */
@@ -1588,16 +1638,16 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile___init__(struct
   void *__pyx_t_4;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":22
+  /* "mpfmc/core/audio/sound_file.pyx":24
  * 
  *     def __init__(self, str file_name, object audio_callback_data):
  *         self.log = logging.getLogger("SoundFile")             # <<<<<<<<<<<<<<
  *         self.file_name = file_name
  *         self.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logging); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logging); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 24, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 24, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -1612,7 +1662,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile___init__(struct
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_n_u_SoundFile) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_u_SoundFile);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 22, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 24, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_GIVEREF(__pyx_t_1);
@@ -1621,7 +1671,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile___init__(struct
   __pyx_v_self->log = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":23
+  /* "mpfmc/core/audio/sound_file.pyx":25
  *     def __init__(self, str file_name, object audio_callback_data):
  *         self.log = logging.getLogger("SoundFile")
  *         self.file_name = file_name             # <<<<<<<<<<<<<<
@@ -1634,17 +1684,17 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile___init__(struct
   __Pyx_DECREF(__pyx_v_self->file_name);
   __pyx_v_self->file_name = __pyx_v_file_name;
 
-  /* "mpfmc/core/audio/sound_file.pyx":24
+  /* "mpfmc/core/audio/sound_file.pyx":26
  *         self.log = logging.getLogger("SoundFile")
  *         self.file_name = file_name
  *         self.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)             # <<<<<<<<<<<<<<
  *         self.sample.duration = 0
  * 
  */
-  __pyx_t_4 = PyCapsule_GetPointer(__pyx_v_audio_callback_data, NULL); if (unlikely(__pyx_t_4 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 24, __pyx_L1_error)
+  __pyx_t_4 = PyCapsule_GetPointer(__pyx_v_audio_callback_data, NULL); if (unlikely(__pyx_t_4 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 26, __pyx_L1_error)
   __pyx_v_self->callback_data = ((__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *)__pyx_t_4);
 
-  /* "mpfmc/core/audio/sound_file.pyx":25
+  /* "mpfmc/core/audio/sound_file.pyx":27
  *         self.file_name = file_name
  *         self.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)
  *         self.sample.duration = 0             # <<<<<<<<<<<<<<
@@ -1653,7 +1703,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile___init__(struct
  */
   __pyx_v_self->sample.duration = 0.0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":21
+  /* "mpfmc/core/audio/sound_file.pyx":23
  *     """SoundFile is the base class for wrapper classes used to manage sound sample data."""
  * 
  *     def __init__(self, str file_name, object audio_callback_data):             # <<<<<<<<<<<<<<
@@ -1675,7 +1725,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile___init__(struct
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":27
+/* "mpfmc/core/audio/sound_file.pyx":29
  *         self.sample.duration = 0
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -1701,7 +1751,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_2__repr__(
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__repr__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":28
+  /* "mpfmc/core/audio/sound_file.pyx":30
  * 
  *     def __repr__(self):
  *         return '<SoundFile>'             # <<<<<<<<<<<<<<
@@ -1713,7 +1763,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_2__repr__(
   __pyx_r = __pyx_kp_u_SoundFile_2;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":27
+  /* "mpfmc/core/audio/sound_file.pyx":29
  *         self.sample.duration = 0
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -1728,7 +1778,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_2__repr__(
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":30
+/* "mpfmc/core/audio/sound_file.pyx":32
  *         return '<SoundFile>'
  * 
  *     def load(self):             # <<<<<<<<<<<<<<
@@ -1756,20 +1806,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_4load(CYTH
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("load", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":32
+  /* "mpfmc/core/audio/sound_file.pyx":34
  *     def load(self):
  *         """Load the sound file"""
  *         raise NotImplementedError("Must be implemented in derived class")             # <<<<<<<<<<<<<<
  * 
  *     def unload(self):
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 32, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 34, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 32, __pyx_L1_error)
+  __PYX_ERR(0, 34, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/sound_file.pyx":30
+  /* "mpfmc/core/audio/sound_file.pyx":32
  *         return '<SoundFile>'
  * 
  *     def load(self):             # <<<<<<<<<<<<<<
@@ -1787,7 +1837,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_4load(CYTH
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":34
+/* "mpfmc/core/audio/sound_file.pyx":36
  *         raise NotImplementedError("Must be implemented in derived class")
  * 
  *     def unload(self):             # <<<<<<<<<<<<<<
@@ -1815,20 +1865,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_6unload(CY
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("unload", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":36
+  /* "mpfmc/core/audio/sound_file.pyx":38
  *     def unload(self):
  *         """Unload the sound file"""
  *         raise NotImplementedError("Must be implemented in derived class")             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 36, __pyx_L1_error)
+  __PYX_ERR(0, 38, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/sound_file.pyx":34
+  /* "mpfmc/core/audio/sound_file.pyx":36
  *         raise NotImplementedError("Must be implemented in derived class")
  * 
  *     def unload(self):             # <<<<<<<<<<<<<<
@@ -1846,7 +1896,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_6unload(CY
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":39
+/* "mpfmc/core/audio/sound_file.pyx":41
  * 
  *     @property
  *     def duration(self):             # <<<<<<<<<<<<<<
@@ -1873,7 +1923,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_8duration_
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":41
+  /* "mpfmc/core/audio/sound_file.pyx":43
  *     def duration(self):
  *         """Return the duration of the sound file"""
  *         return self.sample.duration             # <<<<<<<<<<<<<<
@@ -1881,13 +1931,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_8duration_
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->sample.duration); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->sample.duration); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":39
+  /* "mpfmc/core/audio/sound_file.pyx":41
  * 
  *     @property
  *     def duration(self):             # <<<<<<<<<<<<<<
@@ -2015,10 +2065,10 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_10__setsta
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":51
+/* "mpfmc/core/audio/sound_file.pyx":53
  *     in memory."""
  * 
- *     def __init__(self, str file_name, object audio_callback_data):             # <<<<<<<<<<<<<<
+ *     def __init__(self, str file_name, object audio_callback_data, object sample_data=None):             # <<<<<<<<<<<<<<
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)
  */
@@ -2028,16 +2078,20 @@ static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_1__init__
 static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_file_name = 0;
   PyObject *__pyx_v_audio_callback_data = 0;
+  PyObject *__pyx_v_sample_data = 0;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_file_name,&__pyx_n_s_audio_callback_data,0};
-    PyObject* values[2] = {0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_file_name,&__pyx_n_s_audio_callback_data,&__pyx_n_s_sample_data,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = ((PyObject *)Py_None);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         CYTHON_FALLTHROUGH;
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -2054,31 +2108,42 @@ static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_1__init__
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_audio_callback_data)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 51, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 2, 3, 1); __PYX_ERR(0, 53, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_sample_data);
+          if (value) { values[2] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 51, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 53, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
     __pyx_v_file_name = ((PyObject*)values[0]);
     __pyx_v_audio_callback_data = values[1];
+    __pyx_v_sample_data = values[2];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 51, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 53, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.sound_file.SoundMemoryFile.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file_name), (&PyUnicode_Type), 1, "file_name", 1))) __PYX_ERR(0, 51, __pyx_L1_error)
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self), __pyx_v_file_name, __pyx_v_audio_callback_data);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file_name), (&PyUnicode_Type), 1, "file_name", 1))) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self), __pyx_v_file_name, __pyx_v_audio_callback_data, __pyx_v_sample_data);
 
   /* function exit code */
   goto __pyx_L0;
@@ -2089,7 +2154,7 @@ static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_1__init__
   return __pyx_r;
 }
 
-static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, PyObject *__pyx_v_file_name, PyObject *__pyx_v_audio_callback_data) {
+static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, PyObject *__pyx_v_file_name, PyObject *__pyx_v_audio_callback_data, PyObject *__pyx_v_sample_data) {
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -2097,16 +2162,18 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   PyObject *__pyx_t_3 = NULL;
   int __pyx_t_4;
   PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":53
- *     def __init__(self, str file_name, object audio_callback_data):
+  /* "mpfmc/core/audio/sound_file.pyx":55
+ *     def __init__(self, str file_name, object audio_callback_data, object sample_data=None):
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)             # <<<<<<<<<<<<<<
  *         self.log = logging.getLogger("SoundMemoryFile")
  *         self.sample.type = sound_type_memory
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 55, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile));
   __Pyx_GIVEREF(((PyObject *)__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile));
@@ -2114,10 +2181,10 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   __Pyx_INCREF(((PyObject *)__pyx_v_self));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
   PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 55, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 55, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -2135,7 +2202,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_file_name, __pyx_v_audio_callback_data};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
@@ -2143,13 +2210,13 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_file_name, __pyx_v_audio_callback_data};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 55, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_3) {
       __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -2160,23 +2227,23 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
     __Pyx_INCREF(__pyx_v_audio_callback_data);
     __Pyx_GIVEREF(__pyx_v_audio_callback_data);
     PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, __pyx_v_audio_callback_data);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":54
+  /* "mpfmc/core/audio/sound_file.pyx":56
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)
  *         self.log = logging.getLogger("SoundMemoryFile")             # <<<<<<<<<<<<<<
  *         self.sample.type = sound_type_memory
  *         self.sample.data.memory = <SampleMemory*>PyMem_Malloc(sizeof(SampleMemory))
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logging); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logging); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 56, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 56, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -2191,7 +2258,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_2, __pyx_n_u_SoundMemoryFile) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_n_u_SoundMemoryFile);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 54, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 56, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_GIVEREF(__pyx_t_1);
@@ -2200,7 +2267,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   __pyx_v_self->__pyx_base.log = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":55
+  /* "mpfmc/core/audio/sound_file.pyx":57
  *         super().__init__(file_name, audio_callback_data)
  *         self.log = logging.getLogger("SoundMemoryFile")
  *         self.sample.type = sound_type_memory             # <<<<<<<<<<<<<<
@@ -2209,7 +2276,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
  */
   __pyx_v_self->__pyx_base.sample.type = __pyx_e_5mpfmc_4core_5audio_10sound_file_sound_type_memory;
 
-  /* "mpfmc/core/audio/sound_file.pyx":56
+  /* "mpfmc/core/audio/sound_file.pyx":58
  *         self.log = logging.getLogger("SoundMemoryFile")
  *         self.sample.type = sound_type_memory
  *         self.sample.data.memory = <SampleMemory*>PyMem_Malloc(sizeof(SampleMemory))             # <<<<<<<<<<<<<<
@@ -2218,7 +2285,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
  */
   __pyx_v_self->__pyx_base.sample.data.memory = ((__pyx_t_5mpfmc_4core_5audio_10sound_file_SampleMemory *)PyMem_Malloc((sizeof(__pyx_t_5mpfmc_4core_5audio_10sound_file_SampleMemory))));
 
-  /* "mpfmc/core/audio/sound_file.pyx":57
+  /* "mpfmc/core/audio/sound_file.pyx":59
  *         self.sample.type = sound_type_memory
  *         self.sample.data.memory = <SampleMemory*>PyMem_Malloc(sizeof(SampleMemory))
  *         self.sample.data.memory.data = NULL             # <<<<<<<<<<<<<<
@@ -2227,45 +2294,95 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
  */
   __pyx_v_self->__pyx_base.sample.data.memory->data = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":58
+  /* "mpfmc/core/audio/sound_file.pyx":60
  *         self.sample.data.memory = <SampleMemory*>PyMem_Malloc(sizeof(SampleMemory))
  *         self.sample.data.memory.data = NULL
  *         self.sample.data.memory.size = 0             # <<<<<<<<<<<<<<
  * 
- *         self.load()
+ *         if sample_data is None:
  */
   __pyx_v_self->__pyx_base.sample.data.memory->size = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":60
+  /* "mpfmc/core/audio/sound_file.pyx":62
  *         self.sample.data.memory.size = 0
  * 
- *         self.load()             # <<<<<<<<<<<<<<
+ *         if sample_data is None:             # <<<<<<<<<<<<<<
+ *             self.load()
+ *         else:
+ */
+  __pyx_t_6 = (__pyx_v_sample_data == Py_None);
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  if (__pyx_t_7) {
+
+    /* "mpfmc/core/audio/sound_file.pyx":63
+ * 
+ *         if sample_data is None:
+ *             self.load()             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.load_from_buffer(sample_data)
+ */
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 63, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_2 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_2)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_2);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/sound_file.pyx":62
+ *         self.sample.data.memory.size = 0
+ * 
+ *         if sample_data is None:             # <<<<<<<<<<<<<<
+ *             self.load()
+ *         else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "mpfmc/core/audio/sound_file.pyx":65
+ *             self.load()
+ *         else:
+ *             self.load_from_buffer(sample_data)             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 60, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_2 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_2)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_2);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
+  /*else*/ {
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load_from_buffer); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 65, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_2 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_2)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_2);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
     }
+    __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_2, __pyx_v_sample_data) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_sample_data);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 65, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   }
-  __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_L3:;
 
-  /* "mpfmc/core/audio/sound_file.pyx":51
+  /* "mpfmc/core/audio/sound_file.pyx":53
  *     in memory."""
  * 
- *     def __init__(self, str file_name, object audio_callback_data):             # <<<<<<<<<<<<<<
+ *     def __init__(self, str file_name, object audio_callback_data, object sample_data=None):             # <<<<<<<<<<<<<<
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)
  */
@@ -2285,8 +2402,8 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":62
- *         self.load()
+/* "mpfmc/core/audio/sound_file.pyx":67
+ *             self.load_from_buffer(sample_data)
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         self.unload()
@@ -2312,14 +2429,14 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
   int __pyx_t_4;
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":63
+  /* "mpfmc/core/audio/sound_file.pyx":68
  * 
  *     def __dealloc__(self):
  *         self.unload()             # <<<<<<<<<<<<<<
  *         if self.sample.data.memory != NULL:
  *             PyMem_Free(self.sample.data.memory)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_unload); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_unload); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 68, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -2333,12 +2450,12 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":64
+  /* "mpfmc/core/audio/sound_file.pyx":69
  *     def __dealloc__(self):
  *         self.unload()
  *         if self.sample.data.memory != NULL:             # <<<<<<<<<<<<<<
@@ -2348,7 +2465,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
   __pyx_t_4 = ((__pyx_v_self->__pyx_base.sample.data.memory != NULL) != 0);
   if (__pyx_t_4) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":65
+    /* "mpfmc/core/audio/sound_file.pyx":70
  *         self.unload()
  *         if self.sample.data.memory != NULL:
  *             PyMem_Free(self.sample.data.memory)             # <<<<<<<<<<<<<<
@@ -2357,7 +2474,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
  */
     PyMem_Free(__pyx_v_self->__pyx_base.sample.data.memory);
 
-    /* "mpfmc/core/audio/sound_file.pyx":66
+    /* "mpfmc/core/audio/sound_file.pyx":71
  *         if self.sample.data.memory != NULL:
  *             PyMem_Free(self.sample.data.memory)
  *             self.sample.data.memory = NULL             # <<<<<<<<<<<<<<
@@ -2366,7 +2483,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
  */
     __pyx_v_self->__pyx_base.sample.data.memory = NULL;
 
-    /* "mpfmc/core/audio/sound_file.pyx":64
+    /* "mpfmc/core/audio/sound_file.pyx":69
  *     def __dealloc__(self):
  *         self.unload()
  *         if self.sample.data.memory != NULL:             # <<<<<<<<<<<<<<
@@ -2375,8 +2492,8 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":62
- *         self.load()
+  /* "mpfmc/core/audio/sound_file.pyx":67
+ *             self.load_from_buffer(sample_data)
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         self.unload()
@@ -2394,7 +2511,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
   __Pyx_RefNannyFinishContext();
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":68
+/* "mpfmc/core/audio/sound_file.pyx":73
  *             self.sample.data.memory = NULL
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -2427,20 +2544,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
   PyObject *__pyx_t_7 = NULL;
   __Pyx_RefNannySetupContext("__repr__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":69
+  /* "mpfmc/core/audio/sound_file.pyx":74
  * 
  *     def __repr__(self):
  *         if self.loaded:             # <<<<<<<<<<<<<<
  *             return '<SoundMemoryFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name, self.sample.duration)
  *         else:
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 69, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 74, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":70
+    /* "mpfmc/core/audio/sound_file.pyx":75
  *     def __repr__(self):
  *         if self.loaded:
  *             return '<SoundMemoryFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name, self.sample.duration)             # <<<<<<<<<<<<<<
@@ -2448,9 +2565,9 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
  *             return "<SoundMemoryFile({}, Loaded=False)>".format(self.file_name)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundMemoryFile_Loaded_True_sam, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 70, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundMemoryFile_Loaded_True_sam, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 70, __pyx_L1_error)
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 75, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     __pyx_t_6 = 0;
@@ -2467,7 +2584,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_self->__pyx_base.file_name, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -2476,14 +2593,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_self->__pyx_base.file_name, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     {
-      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 75, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
       if (__pyx_t_5) {
         __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -2494,7 +2611,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
       __Pyx_GIVEREF(__pyx_t_4);
       PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
       __pyx_t_4 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     }
@@ -2503,7 +2620,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
     __pyx_t_1 = 0;
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":69
+    /* "mpfmc/core/audio/sound_file.pyx":74
  * 
  *     def __repr__(self):
  *         if self.loaded:             # <<<<<<<<<<<<<<
@@ -2512,7 +2629,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":72
+  /* "mpfmc/core/audio/sound_file.pyx":77
  *             return '<SoundMemoryFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name, self.sample.duration)
  *         else:
  *             return "<SoundMemoryFile({}, Loaded=False)>".format(self.file_name)             # <<<<<<<<<<<<<<
@@ -2521,7 +2638,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundMemoryFile_Loaded_False, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 72, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundMemoryFile_Loaded_False, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 77, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_7 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -2535,7 +2652,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
     }
     __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_7, __pyx_v_self->__pyx_base.file_name) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_self->__pyx_base.file_name);
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_r = __pyx_t_1;
@@ -2543,7 +2660,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
     goto __pyx_L0;
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":68
+  /* "mpfmc/core/audio/sound_file.pyx":73
  *             self.sample.data.memory = NULL
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -2566,7 +2683,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":74
+/* "mpfmc/core/audio/sound_file.pyx":79
  *             return "<SoundMemoryFile({}, Loaded=False)>".format(self.file_name)
  * 
  *     def load(self):             # <<<<<<<<<<<<<<
@@ -2604,20 +2721,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   PyObject *__pyx_t_9 = NULL;
   __Pyx_RefNannySetupContext("load", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":78
+  /* "mpfmc/core/audio/sound_file.pyx":83
  *         cdef Mix_Chunk *chunk
  * 
  *         if self.loaded:             # <<<<<<<<<<<<<<
  *             return
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 83, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":79
+    /* "mpfmc/core/audio/sound_file.pyx":84
  * 
  *         if self.loaded:
  *             return             # <<<<<<<<<<<<<<
@@ -2628,7 +2745,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":78
+    /* "mpfmc/core/audio/sound_file.pyx":83
  *         cdef Mix_Chunk *chunk
  * 
  *         if self.loaded:             # <<<<<<<<<<<<<<
@@ -2637,19 +2754,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":81
+  /* "mpfmc/core/audio/sound_file.pyx":86
  *             return
  * 
  *         if not os.path.isfile(self.file_name):             # <<<<<<<<<<<<<<
  *             raise AudioException('Could not locate file ' + self.file_name)
  * 
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_os); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_os); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_path); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_path); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_isfile); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_isfile); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_t_4 = NULL;
@@ -2664,24 +2781,24 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   }
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_self->__pyx_base.file_name) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_self->__pyx_base.file_name);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_5 = ((!__pyx_t_2) != 0);
   if (unlikely(__pyx_t_5)) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":82
+    /* "mpfmc/core/audio/sound_file.pyx":87
  * 
  *         if not os.path.isfile(self.file_name):
  *             raise AudioException('Could not locate file ' + self.file_name)             # <<<<<<<<<<<<<<
  * 
  *         # Load the audio file (will be converted to current sample output format)
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyUnicode_ConcatSafe(__pyx_kp_u_Could_not_locate_file, __pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 82, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyUnicode_ConcatSafe(__pyx_kp_u_Could_not_locate_file, __pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 87, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_6 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -2696,14 +2813,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_6, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 82, __pyx_L1_error)
+    __PYX_ERR(0, 87, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/sound_file.pyx":81
+    /* "mpfmc/core/audio/sound_file.pyx":86
  *             return
  * 
  *         if not os.path.isfile(self.file_name):             # <<<<<<<<<<<<<<
@@ -2712,7 +2829,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":85
+  /* "mpfmc/core/audio/sound_file.pyx":90
  * 
  *         # Load the audio file (will be converted to current sample output format)
  *         chunk = Mix_LoadWAV(self.file_name.encode('utf-8'))             # <<<<<<<<<<<<<<
@@ -2721,15 +2838,15 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   if (unlikely(__pyx_v_self->__pyx_base.file_name == Py_None)) {
     PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "encode");
-    __PYX_ERR(0, 85, __pyx_L1_error)
+    __PYX_ERR(0, 90, __pyx_L1_error)
   }
-  __pyx_t_1 = PyUnicode_AsUTF8String(__pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_t_1 = PyUnicode_AsUTF8String(__pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_7 = __Pyx_PyBytes_AsWritableString(__pyx_t_1); if (unlikely((!__pyx_t_7) && PyErr_Occurred())) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyBytes_AsWritableString(__pyx_t_1); if (unlikely((!__pyx_t_7) && PyErr_Occurred())) __PYX_ERR(0, 90, __pyx_L1_error)
   __pyx_v_chunk = Mix_LoadWAV(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":86
+  /* "mpfmc/core/audio/sound_file.pyx":91
  *         # Load the audio file (will be converted to current sample output format)
  *         chunk = Mix_LoadWAV(self.file_name.encode('utf-8'))
  *         if chunk == NULL:             # <<<<<<<<<<<<<<
@@ -2739,16 +2856,16 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   __pyx_t_5 = ((__pyx_v_chunk == NULL) != 0);
   if (unlikely(__pyx_t_5)) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":87
+    /* "mpfmc/core/audio/sound_file.pyx":92
  *         chunk = Mix_LoadWAV(self.file_name.encode('utf-8'))
  *         if chunk == NULL:
  *             msg = "Could not load sound file {} due to an error: {}".format(self.file_name, SDL_GetError())             # <<<<<<<<<<<<<<
  *             raise AudioException(msg)
  * 
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Could_not_load_sound_file_due_to, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Could_not_load_sound_file_due_to, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 92, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyBytes_FromString(SDL_GetError()); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 87, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyBytes_FromString(SDL_GetError()); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 92, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_6 = NULL;
     __pyx_t_8 = 0;
@@ -2765,7 +2882,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_self->__pyx_base.file_name, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -2774,14 +2891,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_self->__pyx_base.file_name, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     {
-      __pyx_t_9 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __pyx_t_9 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       if (__pyx_t_6) {
         __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_6); __pyx_t_6 = NULL;
@@ -2792,7 +2909,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
       __Pyx_GIVEREF(__pyx_t_4);
       PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_4);
       __pyx_t_4 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     }
@@ -2800,14 +2917,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     __pyx_v_msg = __pyx_t_1;
     __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":88
+    /* "mpfmc/core/audio/sound_file.pyx":93
  *         if chunk == NULL:
  *             msg = "Could not load sound file {} due to an error: {}".format(self.file_name, SDL_GetError())
  *             raise AudioException(msg)             # <<<<<<<<<<<<<<
  * 
  *         # Save the loaded sample data
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 88, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 93, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_9 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -2821,14 +2938,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     }
     __pyx_t_1 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_9, __pyx_v_msg) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_msg);
     __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 88, __pyx_L1_error)
+    __PYX_ERR(0, 93, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/sound_file.pyx":86
+    /* "mpfmc/core/audio/sound_file.pyx":91
  *         # Load the audio file (will be converted to current sample output format)
  *         chunk = Mix_LoadWAV(self.file_name.encode('utf-8'))
  *         if chunk == NULL:             # <<<<<<<<<<<<<<
@@ -2837,7 +2954,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":91
+  /* "mpfmc/core/audio/sound_file.pyx":96
  * 
  *         # Save the loaded sample data
  *         self.sample.data.memory.size = <gsize>chunk.alen             # <<<<<<<<<<<<<<
@@ -2846,7 +2963,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   __pyx_v_self->__pyx_base.sample.data.memory->size = ((gsize)__pyx_v_chunk->alen);
 
-  /* "mpfmc/core/audio/sound_file.pyx":92
+  /* "mpfmc/core/audio/sound_file.pyx":97
  *         # Save the loaded sample data
  *         self.sample.data.memory.size = <gsize>chunk.alen
  *         self.sample.data.memory.data = <gpointer>chunk.abuf             # <<<<<<<<<<<<<<
@@ -2855,7 +2972,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   __pyx_v_self->__pyx_base.sample.data.memory->data = ((gpointer)__pyx_v_chunk->abuf);
 
-  /* "mpfmc/core/audio/sound_file.pyx":95
+  /* "mpfmc/core/audio/sound_file.pyx":100
  * 
  *         # Set the sample duration (in seconds)
  *         self.sample.duration = self.sample.data.memory.size / self.callback_data.seconds_to_bytes_factor             # <<<<<<<<<<<<<<
@@ -2864,11 +2981,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   if (unlikely(__pyx_v_self->__pyx_base.callback_data->seconds_to_bytes_factor == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 95, __pyx_L1_error)
+    __PYX_ERR(0, 100, __pyx_L1_error)
   }
   __pyx_v_self->__pyx_base.sample.duration = (((double)__pyx_v_self->__pyx_base.sample.data.memory->size) / __pyx_v_self->__pyx_base.callback_data->seconds_to_bytes_factor);
 
-  /* "mpfmc/core/audio/sound_file.pyx":101
+  /* "mpfmc/core/audio/sound_file.pyx":106
  *         # can just free the Mix_Chunk structure using SDL_free and the sample buffer will remain intact. The
  *         # sample memory must be freed later when this object is deallocated.
  *         SDL_free(chunk)             # <<<<<<<<<<<<<<
@@ -2877,24 +2994,24 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   SDL_free(__pyx_v_chunk);
 
-  /* "mpfmc/core/audio/sound_file.pyx":103
+  /* "mpfmc/core/audio/sound_file.pyx":108
  *         SDL_free(chunk)
  * 
  *         self.log.debug('Loaded file: %s Sample duration: %s',             # <<<<<<<<<<<<<<
  *                        self.file_name, self.sample.duration)
  * 
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->__pyx_base.log, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->__pyx_base.log, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 108, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
 
-  /* "mpfmc/core/audio/sound_file.pyx":104
+  /* "mpfmc/core/audio/sound_file.pyx":109
  * 
  *         self.log.debug('Loaded file: %s Sample duration: %s',
  *                        self.file_name, self.sample.duration)             # <<<<<<<<<<<<<<
  * 
- *     def unload(self):
+ *     def load_from_buffer(self, object sample_data not None):
  */
-  __pyx_t_9 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __pyx_t_9 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 109, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __pyx_t_4 = NULL;
   __pyx_t_8 = 0;
@@ -2911,7 +3028,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_3)) {
     PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_kp_u_Loaded_file_s_Sample_duration_s, __pyx_v_self->__pyx_base.file_name, __pyx_t_9};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
@@ -2920,14 +3037,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
     PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_kp_u_Loaded_file_s_Sample_duration_s, __pyx_v_self->__pyx_base.file_name, __pyx_t_9};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   } else
   #endif
   {
-    __pyx_t_6 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __pyx_t_6 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 108, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
@@ -2941,14 +3058,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     __Pyx_GIVEREF(__pyx_t_9);
     PyTuple_SET_ITEM(__pyx_t_6, 2+__pyx_t_8, __pyx_t_9);
     __pyx_t_9 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":74
+  /* "mpfmc/core/audio/sound_file.pyx":79
  *             return "<SoundMemoryFile({}, Loaded=False)>".format(self.file_name)
  * 
  *     def load(self):             # <<<<<<<<<<<<<<
@@ -2974,35 +3091,498 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":106
+/* "mpfmc/core/audio/sound_file.pyx":111
  *                        self.file_name, self.sample.duration)
  * 
+ *     def load_from_buffer(self, object sample_data not None):             # <<<<<<<<<<<<<<
+ *         """Loads already decoded sample data (in the current sample output format) into memory."""
+ *         cdef Py_buffer view
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_9load_from_buffer(PyObject *__pyx_v_self, PyObject *__pyx_v_sample_data); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8load_from_buffer[] = "SoundMemoryFile.load_from_buffer(self, sample_data)\nLoads already decoded sample data (in the current sample output format) into memory.";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_9load_from_buffer(PyObject *__pyx_v_self, PyObject *__pyx_v_sample_data) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("load_from_buffer (wrapper)", 0);
+  if (unlikely(((PyObject *)__pyx_v_sample_data) == Py_None)) {
+    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "sample_data"); __PYX_ERR(0, 111, __pyx_L1_error)
+  }
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8load_from_buffer(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self), ((PyObject *)__pyx_v_sample_data));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8load_from_buffer(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, PyObject *__pyx_v_sample_data) {
+  Py_buffer __pyx_v_view;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  char const *__pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  __Pyx_RefNannySetupContext("load_from_buffer", 0);
+
+  /* "mpfmc/core/audio/sound_file.pyx":114
+ *         """Loads already decoded sample data (in the current sample output format) into memory."""
+ *         cdef Py_buffer view
+ *         if self.loaded:             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/sound_file.pyx":115
+ *         cdef Py_buffer view
+ *         if self.loaded:
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         PyObject_GetBuffer(sample_data, &view, PyBUF_SIMPLE)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/sound_file.pyx":114
+ *         """Loads already decoded sample data (in the current sample output format) into memory."""
+ *         cdef Py_buffer view
+ *         if self.loaded:             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/sound_file.pyx":117
+ *             return
+ * 
+ *         PyObject_GetBuffer(sample_data, &view, PyBUF_SIMPLE)             # <<<<<<<<<<<<<<
+ *         try:
+ *             if view.len == 0:
+ */
+  __pyx_t_3 = PyObject_GetBuffer(__pyx_v_sample_data, (&__pyx_v_view), PyBUF_SIMPLE); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 117, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/sound_file.pyx":118
+ * 
+ *         PyObject_GetBuffer(sample_data, &view, PyBUF_SIMPLE)
+ *         try:             # <<<<<<<<<<<<<<
+ *             if view.len == 0:
+ *                 raise AudioException('No sample data for file ' + self.file_name)
+ */
+  /*try:*/ {
+
+    /* "mpfmc/core/audio/sound_file.pyx":119
+ *         PyObject_GetBuffer(sample_data, &view, PyBUF_SIMPLE)
+ *         try:
+ *             if view.len == 0:             # <<<<<<<<<<<<<<
+ *                 raise AudioException('No sample data for file ' + self.file_name)
+ * 
+ */
+    __pyx_t_2 = ((__pyx_v_view.len == 0) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "mpfmc/core/audio/sound_file.pyx":120
+ *         try:
+ *             if view.len == 0:
+ *                 raise AudioException('No sample data for file ' + self.file_name)             # <<<<<<<<<<<<<<
+ * 
+ *             # The sample memory is allocated with SDL_malloc like the memory of Mix_LoadWAV so unload
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 120, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = __Pyx_PyUnicode_ConcatSafe(__pyx_kp_u_No_sample_data_for_file, __pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 120, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+        __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+        if (likely(__pyx_t_6)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+          __Pyx_INCREF(__pyx_t_6);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_4, function);
+        }
+      }
+      __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 120, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __PYX_ERR(0, 120, __pyx_L5_error)
+
+      /* "mpfmc/core/audio/sound_file.pyx":119
+ *         PyObject_GetBuffer(sample_data, &view, PyBUF_SIMPLE)
+ *         try:
+ *             if view.len == 0:             # <<<<<<<<<<<<<<
+ *                 raise AudioException('No sample data for file ' + self.file_name)
+ * 
+ */
+    }
+
+    /* "mpfmc/core/audio/sound_file.pyx":124
+ *             # The sample memory is allocated with SDL_malloc like the memory of Mix_LoadWAV so unload
+ *             # can free both the same way.
+ *             self.sample.data.memory.data = <gpointer>SDL_malloc(view.len)             # <<<<<<<<<<<<<<
+ *             if self.sample.data.memory.data == NULL:
+ *                 raise MemoryError()
+ */
+    __pyx_v_self->__pyx_base.sample.data.memory->data = ((gpointer)SDL_malloc(__pyx_v_view.len));
+
+    /* "mpfmc/core/audio/sound_file.pyx":125
+ *             # can free both the same way.
+ *             self.sample.data.memory.data = <gpointer>SDL_malloc(view.len)
+ *             if self.sample.data.memory.data == NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ * 
+ */
+    __pyx_t_2 = ((__pyx_v_self->__pyx_base.sample.data.memory->data == NULL) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "mpfmc/core/audio/sound_file.pyx":126
+ *             self.sample.data.memory.data = <gpointer>SDL_malloc(view.len)
+ *             if self.sample.data.memory.data == NULL:
+ *                 raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *             memcpy(<void*>self.sample.data.memory.data, view.buf, view.len)
+ */
+      PyErr_NoMemory(); __PYX_ERR(0, 126, __pyx_L5_error)
+
+      /* "mpfmc/core/audio/sound_file.pyx":125
+ *             # can free both the same way.
+ *             self.sample.data.memory.data = <gpointer>SDL_malloc(view.len)
+ *             if self.sample.data.memory.data == NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ * 
+ */
+    }
+
+    /* "mpfmc/core/audio/sound_file.pyx":128
+ *                 raise MemoryError()
+ * 
+ *             memcpy(<void*>self.sample.data.memory.data, view.buf, view.len)             # <<<<<<<<<<<<<<
+ *             self.sample.data.memory.size = <gsize>view.len
+ *         finally:
+ */
+    (void)(memcpy(((void *)__pyx_v_self->__pyx_base.sample.data.memory->data), __pyx_v_view.buf, __pyx_v_view.len));
+
+    /* "mpfmc/core/audio/sound_file.pyx":129
+ * 
+ *             memcpy(<void*>self.sample.data.memory.data, view.buf, view.len)
+ *             self.sample.data.memory.size = <gsize>view.len             # <<<<<<<<<<<<<<
+ *         finally:
+ *             PyBuffer_Release(&view)
+ */
+    __pyx_v_self->__pyx_base.sample.data.memory->size = ((gsize)__pyx_v_view.len);
+  }
+
+  /* "mpfmc/core/audio/sound_file.pyx":131
+ *             self.sample.data.memory.size = <gsize>view.len
+ *         finally:
+ *             PyBuffer_Release(&view)             # <<<<<<<<<<<<<<
+ * 
+ *         self.sample.duration = self.sample.data.memory.size / self.callback_data.seconds_to_bytes_factor
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      PyBuffer_Release((&__pyx_v_view));
+      goto __pyx_L6;
+    }
+    __pyx_L5_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_12, &__pyx_t_13, &__pyx_t_14);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11) < 0)) __Pyx_ErrFetch(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __pyx_t_3 = __pyx_lineno; __pyx_t_7 = __pyx_clineno; __pyx_t_8 = __pyx_filename;
+      {
+        PyBuffer_Release((&__pyx_v_view));
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_ExceptionReset(__pyx_t_12, __pyx_t_13, __pyx_t_14);
+      }
+      __Pyx_XGIVEREF(__pyx_t_9);
+      __Pyx_XGIVEREF(__pyx_t_10);
+      __Pyx_XGIVEREF(__pyx_t_11);
+      __Pyx_ErrRestore(__pyx_t_9, __pyx_t_10, __pyx_t_11);
+      __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0;
+      __pyx_lineno = __pyx_t_3; __pyx_clineno = __pyx_t_7; __pyx_filename = __pyx_t_8;
+      goto __pyx_L1_error;
+    }
+    __pyx_L6:;
+  }
+
+  /* "mpfmc/core/audio/sound_file.pyx":133
+ *             PyBuffer_Release(&view)
+ * 
+ *         self.sample.duration = self.sample.data.memory.size / self.callback_data.seconds_to_bytes_factor             # <<<<<<<<<<<<<<
+ * 
+ *         self.log.debug('Loaded file from buffer: %s Sample duration: %s',
+ */
+  if (unlikely(__pyx_v_self->__pyx_base.callback_data->seconds_to_bytes_factor == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(0, 133, __pyx_L1_error)
+  }
+  __pyx_v_self->__pyx_base.sample.duration = (((double)__pyx_v_self->__pyx_base.sample.data.memory->size) / __pyx_v_self->__pyx_base.callback_data->seconds_to_bytes_factor);
+
+  /* "mpfmc/core/audio/sound_file.pyx":135
+ *         self.sample.duration = self.sample.data.memory.size / self.callback_data.seconds_to_bytes_factor
+ * 
+ *         self.log.debug('Loaded file from buffer: %s Sample duration: %s',             # <<<<<<<<<<<<<<
+ *                        self.file_name, self.sample.duration)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->__pyx_base.log, __pyx_n_s_debug); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 135, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+
+  /* "mpfmc/core/audio/sound_file.pyx":136
+ * 
+ *         self.log.debug('Loaded file from buffer: %s Sample duration: %s',
+ *                        self.file_name, self.sample.duration)             # <<<<<<<<<<<<<<
+ * 
+ *     def get_sample_data(self):
+ */
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = NULL;
+  __pyx_t_7 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+      __pyx_t_7 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_4)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_6, __pyx_kp_u_Loaded_file_from_buffer_s_Sample, __pyx_v_self->__pyx_base.file_name, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 3+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_6, __pyx_kp_u_Loaded_file_from_buffer_s_Sample, __pyx_v_self->__pyx_base.file_name, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 3+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_15 = PyTuple_New(3+__pyx_t_7); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 135, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_15);
+    if (__pyx_t_6) {
+      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_t_6); __pyx_t_6 = NULL;
+    }
+    __Pyx_INCREF(__pyx_kp_u_Loaded_file_from_buffer_s_Sample);
+    __Pyx_GIVEREF(__pyx_kp_u_Loaded_file_from_buffer_s_Sample);
+    PyTuple_SET_ITEM(__pyx_t_15, 0+__pyx_t_7, __pyx_kp_u_Loaded_file_from_buffer_s_Sample);
+    __Pyx_INCREF(__pyx_v_self->__pyx_base.file_name);
+    __Pyx_GIVEREF(__pyx_v_self->__pyx_base.file_name);
+    PyTuple_SET_ITEM(__pyx_t_15, 1+__pyx_t_7, __pyx_v_self->__pyx_base.file_name);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_15, 2+__pyx_t_7, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_15, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/sound_file.pyx":111
+ *                        self.file_name, self.sample.duration)
+ * 
+ *     def load_from_buffer(self, object sample_data not None):             # <<<<<<<<<<<<<<
+ *         """Loads already decoded sample data (in the current sample output format) into memory."""
+ *         cdef Py_buffer view
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_AddTraceback("mpfmc.core.audio.sound_file.SoundMemoryFile.load_from_buffer", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/sound_file.pyx":138
+ *                        self.file_name, self.sample.duration)
+ * 
+ *     def get_sample_data(self):             # <<<<<<<<<<<<<<
+ *         """Returns a copy of the decoded sample data (e.g. to cache it)"""
+ *         if not self.loaded:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11get_sample_data(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10get_sample_data[] = "SoundMemoryFile.get_sample_data(self)\nReturns a copy of the decoded sample data (e.g. to cache it)";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11get_sample_data(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_sample_data (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10get_sample_data(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10get_sample_data(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  __Pyx_RefNannySetupContext("get_sample_data", 0);
+
+  /* "mpfmc/core/audio/sound_file.pyx":140
+ *     def get_sample_data(self):
+ *         """Returns a copy of the decoded sample data (e.g. to cache it)"""
+ *         if not self.loaded:             # <<<<<<<<<<<<<<
+ *             return None
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = ((!__pyx_t_2) != 0);
+  if (__pyx_t_3) {
+
+    /* "mpfmc/core/audio/sound_file.pyx":141
+ *         """Returns a copy of the decoded sample data (e.g. to cache it)"""
+ *         if not self.loaded:
+ *             return None             # <<<<<<<<<<<<<<
+ * 
+ *         return (<char*>self.sample.data.memory.data)[:self.sample.data.memory.size]
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/sound_file.pyx":140
+ *     def get_sample_data(self):
+ *         """Returns a copy of the decoded sample data (e.g. to cache it)"""
+ *         if not self.loaded:             # <<<<<<<<<<<<<<
+ *             return None
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/sound_file.pyx":143
+ *             return None
+ * 
+ *         return (<char*>self.sample.data.memory.data)[:self.sample.data.memory.size]             # <<<<<<<<<<<<<<
+ * 
+ *     def unload(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBytes_FromStringAndSize(((char *)__pyx_v_self->__pyx_base.sample.data.memory->data) + 0, __pyx_v_self->__pyx_base.sample.data.memory->size - 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 143, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/sound_file.pyx":138
+ *                        self.file_name, self.sample.duration)
+ * 
+ *     def get_sample_data(self):             # <<<<<<<<<<<<<<
+ *         """Returns a copy of the decoded sample data (e.g. to cache it)"""
+ *         if not self.loaded:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.sound_file.SoundMemoryFile.get_sample_data", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/sound_file.pyx":145
+ *         return (<char*>self.sample.data.memory.data)[:self.sample.data.memory.size]
+ * 
  *     def unload(self):             # <<<<<<<<<<<<<<
  *         """Unloads the sample data from memory"""
  *         if self.sample.data.memory.data != NULL:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_9unload(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8unload[] = "SoundMemoryFile.unload(self)\nUnloads the sample data from memory";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_9unload(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13unload(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12unload[] = "SoundMemoryFile.unload(self)\nUnloads the sample data from memory";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13unload(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("unload (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8unload(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self));
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12unload(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8unload(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12unload(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("unload", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":108
+  /* "mpfmc/core/audio/sound_file.pyx":147
  *     def unload(self):
  *         """Unloads the sample data from memory"""
  *         if self.sample.data.memory.data != NULL:             # <<<<<<<<<<<<<<
@@ -3012,7 +3592,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
   __pyx_t_1 = ((__pyx_v_self->__pyx_base.sample.data.memory->data != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":109
+    /* "mpfmc/core/audio/sound_file.pyx":148
  *         """Unloads the sample data from memory"""
  *         if self.sample.data.memory.data != NULL:
  *             SDL_free(<void*>self.sample.data.memory.data)             # <<<<<<<<<<<<<<
@@ -3021,7 +3601,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
  */
     SDL_free(((void *)__pyx_v_self->__pyx_base.sample.data.memory->data));
 
-    /* "mpfmc/core/audio/sound_file.pyx":108
+    /* "mpfmc/core/audio/sound_file.pyx":147
  *     def unload(self):
  *         """Unloads the sample data from memory"""
  *         if self.sample.data.memory.data != NULL:             # <<<<<<<<<<<<<<
@@ -3030,7 +3610,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":111
+  /* "mpfmc/core/audio/sound_file.pyx":150
  *             SDL_free(<void*>self.sample.data.memory.data)
  * 
  *         self.sample.data.memory.data = NULL             # <<<<<<<<<<<<<<
@@ -3039,7 +3619,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
  */
   __pyx_v_self->__pyx_base.sample.data.memory->data = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":112
+  /* "mpfmc/core/audio/sound_file.pyx":151
  * 
  *         self.sample.data.memory.data = NULL
  *         self.sample.data.memory.size = 0             # <<<<<<<<<<<<<<
@@ -3048,8 +3628,8 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
  */
   __pyx_v_self->__pyx_base.sample.data.memory->size = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":106
- *                        self.file_name, self.sample.duration)
+  /* "mpfmc/core/audio/sound_file.pyx":145
+ *         return (<char*>self.sample.data.memory.data)[:self.sample.data.memory.size]
  * 
  *     def unload(self):             # <<<<<<<<<<<<<<
  *         """Unloads the sample data from memory"""
@@ -3063,7 +3643,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":115
+/* "mpfmc/core/audio/sound_file.pyx":154
  * 
  *     @property
  *     def loaded(self):             # <<<<<<<<<<<<<<
@@ -3092,7 +3672,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":117
+  /* "mpfmc/core/audio/sound_file.pyx":156
  *     def loaded(self):
  *         """Returns whether or not the sound file data is loaded in memory"""
  *         return self.sample.data.memory.data != NULL and self.sample.data.memory.size > 0             # <<<<<<<<<<<<<<
@@ -3103,14 +3683,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   __pyx_t_2 = (__pyx_v_self->__pyx_base.sample.data.memory->data != NULL);
   if (__pyx_t_2) {
   } else {
-    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_1 = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L3_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->__pyx_base.sample.data.memory->size > 0);
-  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_1 = __pyx_t_3;
   __pyx_t_3 = 0;
@@ -3119,7 +3699,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":115
+  /* "mpfmc/core/audio/sound_file.pyx":154
  * 
  *     @property
  *     def loaded(self):             # <<<<<<<<<<<<<<
@@ -3146,20 +3726,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10__reduce_cython__[] = "SoundMemoryFile.__reduce_cython__(self)";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_15__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_14__reduce_cython__[] = "SoundMemoryFile.__reduce_cython__(self)";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_15__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10__reduce_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self));
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_14__reduce_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_14__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3201,20 +3781,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__setstate_cython__[] = "SoundMemoryFile.__setstate_cython__(self, __pyx_state)";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_17__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_16__setstate_cython__[] = "SoundMemoryFile.__setstate_cython__(self, __pyx_state)";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_17__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__setstate_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_16__setstate_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_16__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3248,7 +3828,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":126
+/* "mpfmc/core/audio/sound_file.pyx":165
  *     """SoundStreamingFile is a wrapper class to manage streaming sound sample data."""
  * 
  *     def __cinit__(self, *args, **kwargs):             # <<<<<<<<<<<<<<
@@ -3281,7 +3861,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cini
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":128
+  /* "mpfmc/core/audio/sound_file.pyx":167
  *     def __cinit__(self, *args, **kwargs):
  *         """C constructor"""
  *         self.pipeline = NULL             # <<<<<<<<<<<<<<
@@ -3290,7 +3870,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cini
  */
   __pyx_v_self->pipeline = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":129
+  /* "mpfmc/core/audio/sound_file.pyx":168
  *         """C constructor"""
  *         self.pipeline = NULL
  *         self.bus = NULL             # <<<<<<<<<<<<<<
@@ -3299,7 +3879,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cini
  */
   __pyx_v_self->bus = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":130
+  /* "mpfmc/core/audio/sound_file.pyx":169
  *         self.pipeline = NULL
  *         self.bus = NULL
  *         self.bus_message_handler_id = 0             # <<<<<<<<<<<<<<
@@ -3308,7 +3888,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cini
  */
   __pyx_v_self->bus_message_handler_id = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":126
+  /* "mpfmc/core/audio/sound_file.pyx":165
  *     """SoundStreamingFile is a wrapper class to manage streaming sound sample data."""
  * 
  *     def __cinit__(self, *args, **kwargs):             # <<<<<<<<<<<<<<
@@ -3322,7 +3902,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cini
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":132
+/* "mpfmc/core/audio/sound_file.pyx":171
  *         self.bus_message_handler_id = 0
  * 
  *     def __init__(self, str file_name, object audio_callback_data):             # <<<<<<<<<<<<<<
@@ -3361,11 +3941,11 @@ static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_3__ini
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_audio_callback_data)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 132, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 171, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 132, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 171, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -3378,13 +3958,13 @@ static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_3__ini
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 132, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 171, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.sound_file.SoundStreamingFile.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file_name), (&PyUnicode_Type), 1, "file_name", 1))) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file_name), (&PyUnicode_Type), 1, "file_name", 1))) __PYX_ERR(0, 171, __pyx_L1_error)
   __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__init__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile *)__pyx_v_self), __pyx_v_file_name, __pyx_v_audio_callback_data);
 
   /* function exit code */
@@ -3406,14 +3986,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   PyObject *__pyx_t_5 = NULL;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":134
+  /* "mpfmc/core/audio/sound_file.pyx":173
  *     def __init__(self, str file_name, object audio_callback_data):
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)             # <<<<<<<<<<<<<<
  *         self.log = logging.getLogger("SoundStreamingFile")
  * 
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 173, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile));
   __Pyx_GIVEREF(((PyObject *)__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile));
@@ -3421,10 +4001,10 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   __Pyx_INCREF(((PyObject *)__pyx_v_self));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
   PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 173, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 173, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -3442,7 +4022,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_file_name, __pyx_v_audio_callback_data};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
@@ -3450,13 +4030,13 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_file_name, __pyx_v_audio_callback_data};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 173, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_3) {
       __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -3467,23 +4047,23 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
     __Pyx_INCREF(__pyx_v_audio_callback_data);
     __Pyx_GIVEREF(__pyx_v_audio_callback_data);
     PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, __pyx_v_audio_callback_data);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":135
+  /* "mpfmc/core/audio/sound_file.pyx":174
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)
  *         self.log = logging.getLogger("SoundStreamingFile")             # <<<<<<<<<<<<<<
  * 
  *         self.sample.type = sound_type_streaming
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logging); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 135, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logging); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 174, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 135, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 174, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -3498,7 +4078,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_2, __pyx_n_u_SoundStreamingFile) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_n_u_SoundStreamingFile);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_GIVEREF(__pyx_t_1);
@@ -3507,7 +4087,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   __pyx_v_self->__pyx_base.log = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":137
+  /* "mpfmc/core/audio/sound_file.pyx":176
  *         self.log = logging.getLogger("SoundStreamingFile")
  * 
  *         self.sample.type = sound_type_streaming             # <<<<<<<<<<<<<<
@@ -3516,7 +4096,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.type = __pyx_e_5mpfmc_4core_5audio_10sound_file_sound_type_streaming;
 
-  /* "mpfmc/core/audio/sound_file.pyx":138
+  /* "mpfmc/core/audio/sound_file.pyx":177
  * 
  *         self.sample.type = sound_type_streaming
  *         self.sample.data.stream = <SampleStream*>PyMem_Malloc(sizeof(SampleStream))             # <<<<<<<<<<<<<<
@@ -3525,7 +4105,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream = ((__pyx_t_5mpfmc_4core_5audio_10sound_file_SampleStream *)PyMem_Malloc((sizeof(__pyx_t_5mpfmc_4core_5audio_10sound_file_SampleStream))));
 
-  /* "mpfmc/core/audio/sound_file.pyx":139
+  /* "mpfmc/core/audio/sound_file.pyx":178
  *         self.sample.type = sound_type_streaming
  *         self.sample.data.stream = <SampleStream*>PyMem_Malloc(sizeof(SampleStream))
  *         self.sample.data.stream.pipeline = NULL             # <<<<<<<<<<<<<<
@@ -3534,7 +4114,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->pipeline = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":140
+  /* "mpfmc/core/audio/sound_file.pyx":179
  *         self.sample.data.stream = <SampleStream*>PyMem_Malloc(sizeof(SampleStream))
  *         self.sample.data.stream.pipeline = NULL
  *         self.sample.data.stream.sink = NULL             # <<<<<<<<<<<<<<
@@ -3543,7 +4123,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->sink = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":141
+  /* "mpfmc/core/audio/sound_file.pyx":180
  *         self.sample.data.stream.pipeline = NULL
  *         self.sample.data.stream.sink = NULL
  *         self.sample.data.stream.sample = NULL             # <<<<<<<<<<<<<<
@@ -3552,7 +4132,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->sample = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":142
+  /* "mpfmc/core/audio/sound_file.pyx":181
  *         self.sample.data.stream.sink = NULL
  *         self.sample.data.stream.sample = NULL
  *         self.sample.data.stream.buffer = NULL             # <<<<<<<<<<<<<<
@@ -3561,7 +4141,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->buffer = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":143
+  /* "mpfmc/core/audio/sound_file.pyx":182
  *         self.sample.data.stream.sample = NULL
  *         self.sample.data.stream.buffer = NULL
  *         self.sample.data.stream.map_contains_valid_sample_data = 0             # <<<<<<<<<<<<<<
@@ -3570,7 +4150,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->map_contains_valid_sample_data = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":144
+  /* "mpfmc/core/audio/sound_file.pyx":183
  *         self.sample.data.stream.buffer = NULL
  *         self.sample.data.stream.map_contains_valid_sample_data = 0
  *         self.sample.data.stream.map_buffer_pos = 0             # <<<<<<<<<<<<<<
@@ -3579,7 +4159,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->map_buffer_pos = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":145
+  /* "mpfmc/core/audio/sound_file.pyx":184
  *         self.sample.data.stream.map_contains_valid_sample_data = 0
  *         self.sample.data.stream.map_buffer_pos = 0
  *         self.sample.data.stream.null_buffer_count = 0             # <<<<<<<<<<<<<<
@@ -3588,14 +4168,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->null_buffer_count = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":147
+  /* "mpfmc/core/audio/sound_file.pyx":186
  *         self.sample.data.stream.null_buffer_count = 0
  * 
  *         self.load()             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 186, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __pyx_t_2 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
@@ -3609,12 +4189,12 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 147, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 186, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":132
+  /* "mpfmc/core/audio/sound_file.pyx":171
  *         self.bus_message_handler_id = 0
  * 
  *     def __init__(self, str file_name, object audio_callback_data):             # <<<<<<<<<<<<<<
@@ -3637,7 +4217,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":149
+/* "mpfmc/core/audio/sound_file.pyx":188
  *         self.load()
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -3661,7 +4241,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":150
+  /* "mpfmc/core/audio/sound_file.pyx":189
  * 
  *     def __dealloc__(self):
  *         if self.sample.data.stream != NULL:             # <<<<<<<<<<<<<<
@@ -3671,7 +4251,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
   __pyx_t_1 = ((__pyx_v_self->__pyx_base.sample.data.stream != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":151
+    /* "mpfmc/core/audio/sound_file.pyx":190
  *     def __dealloc__(self):
  *         if self.sample.data.stream != NULL:
  *             PyMem_Free(self.sample.data.stream)             # <<<<<<<<<<<<<<
@@ -3680,7 +4260,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
  */
     PyMem_Free(__pyx_v_self->__pyx_base.sample.data.stream);
 
-    /* "mpfmc/core/audio/sound_file.pyx":152
+    /* "mpfmc/core/audio/sound_file.pyx":191
  *         if self.sample.data.stream != NULL:
  *             PyMem_Free(self.sample.data.stream)
  *             self.sample.data.stream = NULL             # <<<<<<<<<<<<<<
@@ -3689,7 +4269,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
  */
     __pyx_v_self->__pyx_base.sample.data.stream = NULL;
 
-    /* "mpfmc/core/audio/sound_file.pyx":150
+    /* "mpfmc/core/audio/sound_file.pyx":189
  * 
  *     def __dealloc__(self):
  *         if self.sample.data.stream != NULL:             # <<<<<<<<<<<<<<
@@ -3698,7 +4278,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":149
+  /* "mpfmc/core/audio/sound_file.pyx":188
  *         self.load()
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -3710,7 +4290,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
   __Pyx_RefNannyFinishContext();
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":154
+/* "mpfmc/core/audio/sound_file.pyx":193
  *             self.sample.data.stream = NULL
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -3743,20 +4323,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   PyObject *__pyx_t_7 = NULL;
   __Pyx_RefNannySetupContext("__repr__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":155
+  /* "mpfmc/core/audio/sound_file.pyx":194
  * 
  *     def __repr__(self):
  *         if self.loaded:             # <<<<<<<<<<<<<<
  *             return '<SoundStreamingFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name,self.sample.duration)
  *         return "<SoundStreamingFile({}, Loaded=False)>".format(self.file_name)
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 194, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 194, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":156
+    /* "mpfmc/core/audio/sound_file.pyx":195
  *     def __repr__(self):
  *         if self.loaded:
  *             return '<SoundStreamingFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name,self.sample.duration)             # <<<<<<<<<<<<<<
@@ -3764,9 +4344,9 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  * 
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundStreamingFile_Loaded_True, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundStreamingFile_Loaded_True, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 195, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 195, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     __pyx_t_6 = 0;
@@ -3783,7 +4363,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_self->__pyx_base.file_name, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -3792,14 +4372,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_self->__pyx_base.file_name, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     {
-      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 195, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
       if (__pyx_t_5) {
         __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -3810,7 +4390,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
       __Pyx_GIVEREF(__pyx_t_4);
       PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
       __pyx_t_4 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     }
@@ -3819,7 +4399,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __pyx_t_1 = 0;
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":155
+    /* "mpfmc/core/audio/sound_file.pyx":194
  * 
  *     def __repr__(self):
  *         if self.loaded:             # <<<<<<<<<<<<<<
@@ -3828,7 +4408,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":157
+  /* "mpfmc/core/audio/sound_file.pyx":196
  *         if self.loaded:
  *             return '<SoundStreamingFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name,self.sample.duration)
  *         return "<SoundStreamingFile({}, Loaded=False)>".format(self.file_name)             # <<<<<<<<<<<<<<
@@ -3836,7 +4416,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  *     def _gst_init(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundStreamingFile_Loaded_False, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundStreamingFile_Loaded_False, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_7 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -3850,14 +4430,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   }
   __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_7, __pyx_v_self->__pyx_base.file_name) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_self->__pyx_base.file_name);
   __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":154
+  /* "mpfmc/core/audio/sound_file.pyx":193
  *             self.sample.data.stream = NULL
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -3880,7 +4460,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":159
+/* "mpfmc/core/audio/sound_file.pyx":198
  *         return "<SoundStreamingFile({}, Loaded=False)>".format(self.file_name)
  * 
  *     def _gst_init(self):             # <<<<<<<<<<<<<<
@@ -3919,7 +4499,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   PyObject *__pyx_t_8 = NULL;
   __Pyx_RefNannySetupContext("_gst_init", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":160
+  /* "mpfmc/core/audio/sound_file.pyx":199
  * 
  *     def _gst_init(self):
  *         if gst_is_initialized():             # <<<<<<<<<<<<<<
@@ -3929,7 +4509,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = (gst_is_initialized() != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":161
+    /* "mpfmc/core/audio/sound_file.pyx":200
  *     def _gst_init(self):
  *         if gst_is_initialized():
  *             return True             # <<<<<<<<<<<<<<
@@ -3941,7 +4521,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __pyx_r = Py_True;
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":160
+    /* "mpfmc/core/audio/sound_file.pyx":199
  * 
  *     def _gst_init(self):
  *         if gst_is_initialized():             # <<<<<<<<<<<<<<
@@ -3950,7 +4530,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":162
+  /* "mpfmc/core/audio/sound_file.pyx":201
  *         if gst_is_initialized():
  *             return True
  *         cdef int argc = 0             # <<<<<<<<<<<<<<
@@ -3959,7 +4539,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_argc = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":163
+  /* "mpfmc/core/audio/sound_file.pyx":202
  *             return True
  *         cdef int argc = 0
  *         cdef char **argv = NULL             # <<<<<<<<<<<<<<
@@ -3968,7 +4548,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_argv = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":165
+  /* "mpfmc/core/audio/sound_file.pyx":204
  *         cdef char **argv = NULL
  *         cdef GError *error
  *         if not gst_init_check(&argc, &argv, &error):             # <<<<<<<<<<<<<<
@@ -3978,26 +4558,26 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((!(gst_init_check((&__pyx_v_argc), (&__pyx_v_argv), (&__pyx_v_error)) != 0)) != 0);
   if (unlikely(__pyx_t_1)) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":166
+    /* "mpfmc/core/audio/sound_file.pyx":205
  *         cdef GError *error
  *         if not gst_init_check(&argc, &argv, &error):
  *             msg = 'Unable to initialize gstreamer: code={} message={}'.format(             # <<<<<<<<<<<<<<
  *                     error.code, <bytes>error.message)
  *             raise AudioException(msg)
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Unable_to_initialize_gstreamer_c, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Unable_to_initialize_gstreamer_c, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 205, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
 
-    /* "mpfmc/core/audio/sound_file.pyx":167
+    /* "mpfmc/core/audio/sound_file.pyx":206
  *         if not gst_init_check(&argc, &argv, &error):
  *             msg = 'Unable to initialize gstreamer: code={} message={}'.format(
  *                     error.code, <bytes>error.message)             # <<<<<<<<<<<<<<
  *             raise AudioException(msg)
  * 
  */
-    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_error->code); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 167, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_error->code); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 206, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyBytes_FromString(__pyx_v_error->message); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 167, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyBytes_FromString(__pyx_v_error->message); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 206, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __pyx_t_6 = NULL;
     __pyx_t_7 = 0;
@@ -4014,7 +4594,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_4, __pyx_t_5};
-      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 205, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -4024,7 +4604,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_4, __pyx_t_5};
-      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 205, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -4032,7 +4612,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     } else
     #endif
     {
-      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 166, __pyx_L1_error)
+      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 205, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       if (__pyx_t_6) {
         __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
@@ -4044,7 +4624,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
       PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_5);
       __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 205, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     }
@@ -4052,14 +4632,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __pyx_v_msg = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":168
+    /* "mpfmc/core/audio/sound_file.pyx":207
  *             msg = 'Unable to initialize gstreamer: code={} message={}'.format(
  *                     error.code, <bytes>error.message)
  *             raise AudioException(msg)             # <<<<<<<<<<<<<<
  * 
  *     def _destroy_pipeline(self):
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 207, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_8 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -4073,14 +4653,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     }
     __pyx_t_2 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_8, __pyx_v_msg) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_msg);
     __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 207, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 168, __pyx_L1_error)
+    __PYX_ERR(0, 207, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/sound_file.pyx":165
+    /* "mpfmc/core/audio/sound_file.pyx":204
  *         cdef char **argv = NULL
  *         cdef GError *error
  *         if not gst_init_check(&argc, &argv, &error):             # <<<<<<<<<<<<<<
@@ -4089,7 +4669,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":159
+  /* "mpfmc/core/audio/sound_file.pyx":198
  *         return "<SoundStreamingFile({}, Loaded=False)>".format(self.file_name)
  * 
  *     def _gst_init(self):             # <<<<<<<<<<<<<<
@@ -4116,7 +4696,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":170
+/* "mpfmc/core/audio/sound_file.pyx":209
  *             raise AudioException(msg)
  * 
  *     def _destroy_pipeline(self):             # <<<<<<<<<<<<<<
@@ -4147,7 +4727,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("_destroy_pipeline", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":175
+  /* "mpfmc/core/audio/sound_file.pyx":214
  *         cdef GstState current_state, pending_state
  * 
  *         if self.bus != NULL and self.bus_message_handler_id != 0:             # <<<<<<<<<<<<<<
@@ -4165,7 +4745,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":176
+    /* "mpfmc/core/audio/sound_file.pyx":215
  * 
  *         if self.bus != NULL and self.bus_message_handler_id != 0:
  *             c_signal_disconnect(<GstElement*>self.bus, self.bus_message_handler_id)             # <<<<<<<<<<<<<<
@@ -4174,7 +4754,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     c_signal_disconnect(((GstElement *)__pyx_v_self->bus), __pyx_v_self->bus_message_handler_id);
 
-    /* "mpfmc/core/audio/sound_file.pyx":177
+    /* "mpfmc/core/audio/sound_file.pyx":216
  *         if self.bus != NULL and self.bus_message_handler_id != 0:
  *             c_signal_disconnect(<GstElement*>self.bus, self.bus_message_handler_id)
  *             self.bus_message_handler_id = 0             # <<<<<<<<<<<<<<
@@ -4183,7 +4763,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_self->bus_message_handler_id = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":175
+    /* "mpfmc/core/audio/sound_file.pyx":214
  *         cdef GstState current_state, pending_state
  * 
  *         if self.bus != NULL and self.bus_message_handler_id != 0:             # <<<<<<<<<<<<<<
@@ -4192,7 +4772,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":179
+  /* "mpfmc/core/audio/sound_file.pyx":218
  *             self.bus_message_handler_id = 0
  * 
  *         if self.pipeline != NULL:             # <<<<<<<<<<<<<<
@@ -4202,7 +4782,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_self->pipeline != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":183
+    /* "mpfmc/core/audio/sound_file.pyx":222
  *             # state is set to NULL, we need to query it. We also put a 5s
  *             # timeout for safety, but normally, nobody should hit it.
  *             with nogil:             # <<<<<<<<<<<<<<
@@ -4217,7 +4797,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
         #endif
         /*try:*/ {
 
-          /* "mpfmc/core/audio/sound_file.pyx":184
+          /* "mpfmc/core/audio/sound_file.pyx":223
  *             # timeout for safety, but normally, nobody should hit it.
  *             with nogil:
  *                 gst_element_set_state(self.pipeline, GST_STATE_NULL)             # <<<<<<<<<<<<<<
@@ -4226,7 +4806,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
           (void)(gst_element_set_state(__pyx_v_self->pipeline, GST_STATE_NULL));
 
-          /* "mpfmc/core/audio/sound_file.pyx":185
+          /* "mpfmc/core/audio/sound_file.pyx":224
  *             with nogil:
  *                 gst_element_set_state(self.pipeline, GST_STATE_NULL)
  *                 gst_element_get_state(self.pipeline, &current_state,             # <<<<<<<<<<<<<<
@@ -4236,7 +4816,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
           (void)(gst_element_get_state(__pyx_v_self->pipeline, (&__pyx_v_current_state), (&__pyx_v_pending_state), ((GstClockTime)5e9)));
         }
 
-        /* "mpfmc/core/audio/sound_file.pyx":183
+        /* "mpfmc/core/audio/sound_file.pyx":222
  *             # state is set to NULL, we need to query it. We also put a 5s
  *             # timeout for safety, but normally, nobody should hit it.
  *             with nogil:             # <<<<<<<<<<<<<<
@@ -4255,7 +4835,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
         }
     }
 
-    /* "mpfmc/core/audio/sound_file.pyx":187
+    /* "mpfmc/core/audio/sound_file.pyx":226
  *                 gst_element_get_state(self.pipeline, &current_state,
  *                         &pending_state, <GstClockTime>5e9)
  *             gst_object_unref(self.pipeline)             # <<<<<<<<<<<<<<
@@ -4264,7 +4844,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     gst_object_unref(__pyx_v_self->pipeline);
 
-    /* "mpfmc/core/audio/sound_file.pyx":179
+    /* "mpfmc/core/audio/sound_file.pyx":218
  *             self.bus_message_handler_id = 0
  * 
  *         if self.pipeline != NULL:             # <<<<<<<<<<<<<<
@@ -4273,7 +4853,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":189
+  /* "mpfmc/core/audio/sound_file.pyx":228
  *             gst_object_unref(self.pipeline)
  * 
  *         if self.bus != NULL:             # <<<<<<<<<<<<<<
@@ -4283,7 +4863,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_self->bus != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":190
+    /* "mpfmc/core/audio/sound_file.pyx":229
  * 
  *         if self.bus != NULL:
  *             gst_object_unref(self.bus)             # <<<<<<<<<<<<<<
@@ -4292,7 +4872,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     gst_object_unref(__pyx_v_self->bus);
 
-    /* "mpfmc/core/audio/sound_file.pyx":189
+    /* "mpfmc/core/audio/sound_file.pyx":228
  *             gst_object_unref(self.pipeline)
  * 
  *         if self.bus != NULL:             # <<<<<<<<<<<<<<
@@ -4301,7 +4881,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":192
+  /* "mpfmc/core/audio/sound_file.pyx":231
  *             gst_object_unref(self.bus)
  * 
  *         self.bus = NULL             # <<<<<<<<<<<<<<
@@ -4310,7 +4890,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_self->bus = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":193
+  /* "mpfmc/core/audio/sound_file.pyx":232
  * 
  *         self.bus = NULL
  *         self.pipeline = NULL             # <<<<<<<<<<<<<<
@@ -4319,7 +4899,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_self->pipeline = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":170
+  /* "mpfmc/core/audio/sound_file.pyx":209
  *             raise AudioException(msg)
  * 
  *     def _destroy_pipeline(self):             # <<<<<<<<<<<<<<
@@ -4334,7 +4914,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":195
+/* "mpfmc/core/audio/sound_file.pyx":234
  *         self.pipeline = NULL
  * 
  *     def _construct_pipeline(self):             # <<<<<<<<<<<<<<
@@ -4380,7 +4960,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   GstElement *__pyx_t_11;
   __Pyx_RefNannySetupContext("_construct_pipeline", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":199
+  /* "mpfmc/core/audio/sound_file.pyx":238
  *         cdef GError *error
  *         cdef GstSample *sample
  *         cdef gint64 duration = 0             # <<<<<<<<<<<<<<
@@ -4389,7 +4969,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_duration = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":204
+  /* "mpfmc/core/audio/sound_file.pyx":243
  * 
  *         # If the pipeline has already been created, delete it
  *         if self.pipeline != NULL:             # <<<<<<<<<<<<<<
@@ -4399,14 +4979,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_self->pipeline != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":205
+    /* "mpfmc/core/audio/sound_file.pyx":244
  *         # If the pipeline has already been created, delete it
  *         if self.pipeline != NULL:
  *             self._destroy_pipeline()             # <<<<<<<<<<<<<<
  * 
  *         # Pipeline structure: uridecodebin --> audioconvert --> audioresample --> appsink
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_destroy_pipeline); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 205, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_destroy_pipeline); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 244, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -4420,12 +5000,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     }
     __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 205, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 244, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":204
+    /* "mpfmc/core/audio/sound_file.pyx":243
  * 
  *         # If the pipeline has already been created, delete it
  *         if self.pipeline != NULL:             # <<<<<<<<<<<<<<
@@ -4434,7 +5014,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":210
+  /* "mpfmc/core/audio/sound_file.pyx":249
  * 
  *         # Create GStreamer pipeline with the specified caps (from a string)
  *         file_path = 'file:///' + self.file_name.replace('\\', '/')             # <<<<<<<<<<<<<<
@@ -4443,17 +5023,17 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   if (unlikely(__pyx_v_self->__pyx_base.file_name == Py_None)) {
     PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "replace");
-    __PYX_ERR(0, 210, __pyx_L1_error)
+    __PYX_ERR(0, 249, __pyx_L1_error)
   }
-  __pyx_t_2 = PyUnicode_Replace(__pyx_v_self->__pyx_base.file_name, __pyx_kp_u__6, __pyx_kp_u__7, -1L); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_t_2 = PyUnicode_Replace(__pyx_v_self->__pyx_base.file_name, __pyx_kp_u__6, __pyx_kp_u__7, -1L); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 249, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyUnicode_Concat(__pyx_kp_u_file, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyUnicode_Concat(__pyx_kp_u_file, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 249, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_file_path = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":211
+  /* "mpfmc/core/audio/sound_file.pyx":250
  *         # Create GStreamer pipeline with the specified caps (from a string)
  *         file_path = 'file:///' + self.file_name.replace('\\', '/')
  *         if SDL_AUDIO_ISLITTLEENDIAN(self.callback_data.format):             # <<<<<<<<<<<<<<
@@ -4463,7 +5043,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = (SDL_AUDIO_ISLITTLEENDIAN(__pyx_v_self->__pyx_base.callback_data->format) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":212
+    /* "mpfmc/core/audio/sound_file.pyx":251
  *         file_path = 'file:///' + self.file_name.replace('\\', '/')
  *         if SDL_AUDIO_ISLITTLEENDIAN(self.callback_data.format):
  *             audio_format = "S16LE"             # <<<<<<<<<<<<<<
@@ -4473,7 +5053,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __Pyx_INCREF(__pyx_n_u_S16LE);
     __pyx_v_audio_format = __pyx_n_u_S16LE;
 
-    /* "mpfmc/core/audio/sound_file.pyx":211
+    /* "mpfmc/core/audio/sound_file.pyx":250
  *         # Create GStreamer pipeline with the specified caps (from a string)
  *         file_path = 'file:///' + self.file_name.replace('\\', '/')
  *         if SDL_AUDIO_ISLITTLEENDIAN(self.callback_data.format):             # <<<<<<<<<<<<<<
@@ -4483,7 +5063,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     goto __pyx_L4;
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":214
+  /* "mpfmc/core/audio/sound_file.pyx":253
  *             audio_format = "S16LE"
  *         else:
  *             audio_format = "S16BE"             # <<<<<<<<<<<<<<
@@ -4496,34 +5076,34 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   }
   __pyx_L4:;
 
-  /* "mpfmc/core/audio/sound_file.pyx":215
+  /* "mpfmc/core/audio/sound_file.pyx":254
  *         else:
  *             audio_format = "S16BE"
  *         pipeline_string = 'uridecodebin uri="{}" ! audioconvert ! audioresample ! appsink name=sink caps="audio/x-raw,rate={},channels={},format={},layout=interleaved" sync=true blocksize={}'.format(             # <<<<<<<<<<<<<<
  *             file_path, str(self.callback_data.sample_rate), str(self.callback_data.channels), audio_format, self.callback_data.buffer_size)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_uridecodebin_uri_audioconvert_au, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_uridecodebin_uri_audioconvert_au, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 254, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "mpfmc/core/audio/sound_file.pyx":216
+  /* "mpfmc/core/audio/sound_file.pyx":255
  *             audio_format = "S16BE"
  *         pipeline_string = 'uridecodebin uri="{}" ! audioconvert ! audioresample ! appsink name=sink caps="audio/x-raw,rate={},channels={},format={},layout=interleaved" sync=true blocksize={}'.format(
  *             file_path, str(self.callback_data.sample_rate), str(self.callback_data.channels), audio_format, self.callback_data.buffer_size)             # <<<<<<<<<<<<<<
  * 
  *         error = NULL
  */
-  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->__pyx_base.callback_data->sample_rate); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->__pyx_base.callback_data->sample_rate); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 255, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 255, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->__pyx_base.callback_data->channels); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->__pyx_base.callback_data->channels); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 255, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 255, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyInt_From_Uint32(__pyx_v_self->__pyx_base.callback_data->buffer_size); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_Uint32(__pyx_v_self->__pyx_base.callback_data->buffer_size); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 255, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_7 = NULL;
   __pyx_t_8 = 0;
@@ -4540,7 +5120,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[6] = {__pyx_t_7, __pyx_v_file_path, __pyx_t_5, __pyx_t_6, __pyx_v_audio_format, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 5+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 5+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 254, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -4551,7 +5131,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[6] = {__pyx_t_7, __pyx_v_file_path, __pyx_t_5, __pyx_t_6, __pyx_v_audio_format, __pyx_t_4};
-    __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 5+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 5+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 254, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -4560,7 +5140,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   } else
   #endif
   {
-    __pyx_t_9 = PyTuple_New(5+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __pyx_t_9 = PyTuple_New(5+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 254, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
     if (__pyx_t_7) {
       __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
@@ -4580,7 +5160,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __pyx_t_5 = 0;
     __pyx_t_6 = 0;
     __pyx_t_4 = 0;
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 254, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   }
@@ -4588,7 +5168,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_v_pipeline_string = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":218
+  /* "mpfmc/core/audio/sound_file.pyx":257
  *             file_path, str(self.callback_data.sample_rate), str(self.callback_data.channels), audio_format, self.callback_data.buffer_size)
  * 
  *         error = NULL             # <<<<<<<<<<<<<<
@@ -4597,14 +5177,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_error = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":219
+  /* "mpfmc/core/audio/sound_file.pyx":258
  * 
  *         error = NULL
  *         self.pipeline = gst_parse_launch(pipeline_string.encode('utf-8'), &error)             # <<<<<<<<<<<<<<
  * 
  *         if error != NULL:
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_pipeline_string, __pyx_n_s_encode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_pipeline_string, __pyx_n_s_encode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 258, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_9 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4618,14 +5198,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   }
   __pyx_t_3 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_9, __pyx_kp_u_utf_8) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_utf_8);
   __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 219, __pyx_L1_error)
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 258, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_10 = __Pyx_PyObject_AsWritableString(__pyx_t_3); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_t_10 = __Pyx_PyObject_AsWritableString(__pyx_t_3); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 258, __pyx_L1_error)
   __pyx_v_self->pipeline = gst_parse_launch(__pyx_t_10, (&__pyx_v_error));
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":221
+  /* "mpfmc/core/audio/sound_file.pyx":260
  *         self.pipeline = gst_parse_launch(pipeline_string.encode('utf-8'), &error)
  * 
  *         if error != NULL:             # <<<<<<<<<<<<<<
@@ -4635,18 +5215,18 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_error != NULL) != 0);
   if (unlikely(__pyx_t_1)) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":222
+    /* "mpfmc/core/audio/sound_file.pyx":261
  * 
  *         if error != NULL:
  *             msg = 'Unable to create a GStreamer pipeline: code={} message={}'.format(error.code, <bytes>error.message)             # <<<<<<<<<<<<<<
  *             raise AudioException(msg)
  * 
  */
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Unable_to_create_a_GStreamer_pip, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Unable_to_create_a_GStreamer_pip, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 261, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_error->code); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_error->code); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 261, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_4 = __Pyx_PyBytes_FromString(__pyx_v_error->message); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyBytes_FromString(__pyx_v_error->message); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 261, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_6 = NULL;
     __pyx_t_8 = 0;
@@ -4663,7 +5243,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_2)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_9, __pyx_t_4};
-      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 222, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
@@ -4673,7 +5253,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_9, __pyx_t_4};
-      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 222, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
@@ -4681,7 +5261,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     } else
     #endif
     {
-      __pyx_t_5 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 222, __pyx_L1_error)
+      __pyx_t_5 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 261, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       if (__pyx_t_6) {
         __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6); __pyx_t_6 = NULL;
@@ -4693,7 +5273,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
       PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_8, __pyx_t_4);
       __pyx_t_9 = 0;
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 222, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
@@ -4701,14 +5281,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __pyx_v_msg = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":223
+    /* "mpfmc/core/audio/sound_file.pyx":262
  *         if error != NULL:
  *             msg = 'Unable to create a GStreamer pipeline: code={} message={}'.format(error.code, <bytes>error.message)
  *             raise AudioException(msg)             # <<<<<<<<<<<<<<
  * 
  *         # Get the pipeline bus (the bus allows applications to receive pipeline messages)
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 223, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 262, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
@@ -4722,14 +5302,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     }
     __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_5, __pyx_v_msg) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_msg);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 223, __pyx_L1_error)
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 262, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 223, __pyx_L1_error)
+    __PYX_ERR(0, 262, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/sound_file.pyx":221
+    /* "mpfmc/core/audio/sound_file.pyx":260
  *         self.pipeline = gst_parse_launch(pipeline_string.encode('utf-8'), &error)
  * 
  *         if error != NULL:             # <<<<<<<<<<<<<<
@@ -4738,7 +5318,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":226
+  /* "mpfmc/core/audio/sound_file.pyx":265
  * 
  *         # Get the pipeline bus (the bus allows applications to receive pipeline messages)
  *         self.bus = gst_pipeline_get_bus(<GstPipeline*>self.pipeline)             # <<<<<<<<<<<<<<
@@ -4747,7 +5327,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_self->bus = gst_pipeline_get_bus(((GstPipeline *)__pyx_v_self->pipeline));
 
-  /* "mpfmc/core/audio/sound_file.pyx":227
+  /* "mpfmc/core/audio/sound_file.pyx":266
  *         # Get the pipeline bus (the bus allows applications to receive pipeline messages)
  *         self.bus = gst_pipeline_get_bus(<GstPipeline*>self.pipeline)
  *         if self.bus == NULL:             # <<<<<<<<<<<<<<
@@ -4757,14 +5337,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_self->bus == NULL) != 0);
   if (unlikely(__pyx_t_1)) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":228
+    /* "mpfmc/core/audio/sound_file.pyx":267
  *         self.bus = gst_pipeline_get_bus(<GstPipeline*>self.pipeline)
  *         if self.bus == NULL:
  *             raise AudioException('Unable to get bus from the pipeline')             # <<<<<<<<<<<<<<
  * 
  *         # Enable pipeline messages and callback message handler
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 228, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 267, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
@@ -4778,14 +5358,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     }
     __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_5, __pyx_kp_u_Unable_to_get_bus_from_the_pipel) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_Unable_to_get_bus_from_the_pipel);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 228, __pyx_L1_error)
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 267, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 228, __pyx_L1_error)
+    __PYX_ERR(0, 267, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/sound_file.pyx":227
+    /* "mpfmc/core/audio/sound_file.pyx":266
  *         # Get the pipeline bus (the bus allows applications to receive pipeline messages)
  *         self.bus = gst_pipeline_get_bus(<GstPipeline*>self.pipeline)
  *         if self.bus == NULL:             # <<<<<<<<<<<<<<
@@ -4794,7 +5374,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":235
+  /* "mpfmc/core/audio/sound_file.pyx":274
  * 
  *         # Get sink
  *         self.sink = gst_bin_get_by_name(<GstBin*>self.pipeline, "sink")             # <<<<<<<<<<<<<<
@@ -4803,7 +5383,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_self->sink = gst_bin_get_by_name(((GstBin *)__pyx_v_self->pipeline), ((const gchar *)"sink"));
 
-  /* "mpfmc/core/audio/sound_file.pyx":238
+  /* "mpfmc/core/audio/sound_file.pyx":277
  * 
  *         # Set to PAUSED to make the first frame arrive in the sink
  *         ret = gst_element_set_state(self.pipeline, GST_STATE_PAUSED)             # <<<<<<<<<<<<<<
@@ -4812,7 +5392,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_ret = gst_element_set_state(__pyx_v_self->pipeline, GST_STATE_PAUSED);
 
-  /* "mpfmc/core/audio/sound_file.pyx":242
+  /* "mpfmc/core/audio/sound_file.pyx":281
  *         # Get the preroll sample (forces the code to wait until the sample has been completely loaded
  *         # which is necessary to retrieve the duration).
  *         sample = c_appsink_pull_preroll(self.sink)             # <<<<<<<<<<<<<<
@@ -4821,7 +5401,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_sample = c_appsink_pull_preroll(__pyx_v_self->sink);
 
-  /* "mpfmc/core/audio/sound_file.pyx":243
+  /* "mpfmc/core/audio/sound_file.pyx":282
  *         # which is necessary to retrieve the duration).
  *         sample = c_appsink_pull_preroll(self.sink)
  *         if sample != NULL:             # <<<<<<<<<<<<<<
@@ -4831,7 +5411,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_sample != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":244
+    /* "mpfmc/core/audio/sound_file.pyx":283
  *         sample = c_appsink_pull_preroll(self.sink)
  *         if sample != NULL:
  *             gst_sample_unref(sample)             # <<<<<<<<<<<<<<
@@ -4840,7 +5420,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     gst_sample_unref(__pyx_v_sample);
 
-    /* "mpfmc/core/audio/sound_file.pyx":243
+    /* "mpfmc/core/audio/sound_file.pyx":282
  *         # which is necessary to retrieve the duration).
  *         sample = c_appsink_pull_preroll(self.sink)
  *         if sample != NULL:             # <<<<<<<<<<<<<<
@@ -4849,7 +5429,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":247
+  /* "mpfmc/core/audio/sound_file.pyx":286
  * 
  *         # Get duration of audio file (in nanoseconds)
  *         if not gst_element_query_duration(self.sink, GST_FORMAT_TIME, &duration):             # <<<<<<<<<<<<<<
@@ -4859,7 +5439,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((!(gst_element_query_duration(__pyx_v_self->sink, GST_FORMAT_TIME, (&__pyx_v_duration)) != 0)) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":248
+    /* "mpfmc/core/audio/sound_file.pyx":287
  *         # Get duration of audio file (in nanoseconds)
  *         if not gst_element_query_duration(self.sink, GST_FORMAT_TIME, &duration):
  *             duration = 0             # <<<<<<<<<<<<<<
@@ -4868,7 +5448,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_duration = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":247
+    /* "mpfmc/core/audio/sound_file.pyx":286
  * 
  *         # Get duration of audio file (in nanoseconds)
  *         if not gst_element_query_duration(self.sink, GST_FORMAT_TIME, &duration):             # <<<<<<<<<<<<<<
@@ -4877,7 +5457,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":251
+  /* "mpfmc/core/audio/sound_file.pyx":290
  * 
  *         # Store duration in seconds
  *         self.sample.duration = duration / GST_SECOND             # <<<<<<<<<<<<<<
@@ -4886,11 +5466,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   if (unlikely(GST_SECOND == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 251, __pyx_L1_error)
+    __PYX_ERR(0, 290, __pyx_L1_error)
   }
   __pyx_v_self->__pyx_base.sample.duration = (((double)__pyx_v_duration) / ((double)GST_SECOND));
 
-  /* "mpfmc/core/audio/sound_file.pyx":255
+  /* "mpfmc/core/audio/sound_file.pyx":294
  *         # The pipeline should now be ready to play.  Store the pointers to the pipeline
  *         # and appsink in the SampleStream struct for use in the application.
  *         self.sample.data.stream.pipeline = self.pipeline             # <<<<<<<<<<<<<<
@@ -4900,7 +5480,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_11 = __pyx_v_self->pipeline;
   __pyx_v_self->__pyx_base.sample.data.stream->pipeline = __pyx_t_11;
 
-  /* "mpfmc/core/audio/sound_file.pyx":256
+  /* "mpfmc/core/audio/sound_file.pyx":295
  *         # and appsink in the SampleStream struct for use in the application.
  *         self.sample.data.stream.pipeline = self.pipeline
  *         self.sample.data.stream.sink = self.sink             # <<<<<<<<<<<<<<
@@ -4910,7 +5490,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_11 = __pyx_v_self->sink;
   __pyx_v_self->__pyx_base.sample.data.stream->sink = __pyx_t_11;
 
-  /* "mpfmc/core/audio/sound_file.pyx":195
+  /* "mpfmc/core/audio/sound_file.pyx":234
  *         self.pipeline = NULL
  * 
  *     def _construct_pipeline(self):             # <<<<<<<<<<<<<<
@@ -4941,7 +5521,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":258
+/* "mpfmc/core/audio/sound_file.pyx":297
  *         self.sample.data.stream.sink = self.sink
  * 
  *     def load(self):             # <<<<<<<<<<<<<<
@@ -4974,14 +5554,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   PyObject *__pyx_t_6 = NULL;
   __Pyx_RefNannySetupContext("load", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":264
+  /* "mpfmc/core/audio/sound_file.pyx":303
  *         #    return
  * 
  *         self._gst_init()             # <<<<<<<<<<<<<<
  *         self._construct_pipeline()
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_gst_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 264, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_gst_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 303, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4995,19 +5575,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":265
+  /* "mpfmc/core/audio/sound_file.pyx":304
  * 
  *         self._gst_init()
  *         self._construct_pipeline()             # <<<<<<<<<<<<<<
  * 
  *         self.log.debug('Loaded file: %s Sample duration: %s',
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_construct_pipeline); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 265, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_construct_pipeline); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 304, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -5021,29 +5601,29 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 304, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":267
+  /* "mpfmc/core/audio/sound_file.pyx":306
  *         self._construct_pipeline()
  * 
  *         self.log.debug('Loaded file: %s Sample duration: %s',             # <<<<<<<<<<<<<<
  *                        self.file_name, self.sample.duration)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->__pyx_base.log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 267, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->__pyx_base.log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 306, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "mpfmc/core/audio/sound_file.pyx":268
+  /* "mpfmc/core/audio/sound_file.pyx":307
  * 
  *         self.log.debug('Loaded file: %s Sample duration: %s',
  *                        self.file_name, self.sample.duration)             # <<<<<<<<<<<<<<
  * 
  *     def unload(self):
  */
-  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 268, __pyx_L1_error)
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 307, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -5060,7 +5640,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_kp_u_Loaded_file_s_Sample_duration_s, __pyx_v_self->__pyx_base.file_name, __pyx_t_3};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5069,14 +5649,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_kp_u_Loaded_file_s_Sample_duration_s, __pyx_v_self->__pyx_base.file_name, __pyx_t_3};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   } else
   #endif
   {
-    __pyx_t_6 = PyTuple_New(3+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 267, __pyx_L1_error)
+    __pyx_t_6 = PyTuple_New(3+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 306, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
@@ -5090,14 +5670,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __Pyx_GIVEREF(__pyx_t_3);
     PyTuple_SET_ITEM(__pyx_t_6, 2+__pyx_t_5, __pyx_t_3);
     __pyx_t_3 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":258
+  /* "mpfmc/core/audio/sound_file.pyx":297
  *         self.sample.data.stream.sink = self.sink
  * 
  *     def load(self):             # <<<<<<<<<<<<<<
@@ -5122,7 +5702,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":270
+/* "mpfmc/core/audio/sound_file.pyx":309
  *                        self.file_name, self.sample.duration)
  * 
  *     def unload(self):             # <<<<<<<<<<<<<<
@@ -5150,7 +5730,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("unload", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":274
+  /* "mpfmc/core/audio/sound_file.pyx":313
  * 
  *         # Done with the streaming buffer, release references to it
  *         if self.sample.data.stream.map_contains_valid_sample_data:             # <<<<<<<<<<<<<<
@@ -5160,7 +5740,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = (__pyx_v_self->__pyx_base.sample.data.stream->map_contains_valid_sample_data != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":275
+    /* "mpfmc/core/audio/sound_file.pyx":314
  *         # Done with the streaming buffer, release references to it
  *         if self.sample.data.stream.map_contains_valid_sample_data:
  *             gst_buffer_unmap(self.sample.data.stream.buffer, &self.sample.data.stream.map_info)             # <<<<<<<<<<<<<<
@@ -5169,7 +5749,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     gst_buffer_unmap(__pyx_v_self->__pyx_base.sample.data.stream->buffer, (&__pyx_v_self->__pyx_base.sample.data.stream->map_info));
 
-    /* "mpfmc/core/audio/sound_file.pyx":276
+    /* "mpfmc/core/audio/sound_file.pyx":315
  *         if self.sample.data.stream.map_contains_valid_sample_data:
  *             gst_buffer_unmap(self.sample.data.stream.buffer, &self.sample.data.stream.map_info)
  *             gst_sample_unref(self.sample.data.stream.sample)             # <<<<<<<<<<<<<<
@@ -5178,7 +5758,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     gst_sample_unref(__pyx_v_self->__pyx_base.sample.data.stream->sample);
 
-    /* "mpfmc/core/audio/sound_file.pyx":278
+    /* "mpfmc/core/audio/sound_file.pyx":317
  *             gst_sample_unref(self.sample.data.stream.sample)
  * 
  *             self.sample.data.stream.buffer = NULL             # <<<<<<<<<<<<<<
@@ -5187,7 +5767,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_self->__pyx_base.sample.data.stream->buffer = NULL;
 
-    /* "mpfmc/core/audio/sound_file.pyx":279
+    /* "mpfmc/core/audio/sound_file.pyx":318
  * 
  *             self.sample.data.stream.buffer = NULL
  *             self.sample.data.stream.sample = NULL             # <<<<<<<<<<<<<<
@@ -5196,7 +5776,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_self->__pyx_base.sample.data.stream->sample = NULL;
 
-    /* "mpfmc/core/audio/sound_file.pyx":280
+    /* "mpfmc/core/audio/sound_file.pyx":319
  *             self.sample.data.stream.buffer = NULL
  *             self.sample.data.stream.sample = NULL
  *             self.sample.data.stream.map_buffer_pos = 0             # <<<<<<<<<<<<<<
@@ -5205,7 +5785,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_self->__pyx_base.sample.data.stream->map_buffer_pos = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":281
+    /* "mpfmc/core/audio/sound_file.pyx":320
  *             self.sample.data.stream.sample = NULL
  *             self.sample.data.stream.map_buffer_pos = 0
  *             self.sample.data.stream.map_contains_valid_sample_data = 0             # <<<<<<<<<<<<<<
@@ -5214,7 +5794,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_self->__pyx_base.sample.data.stream->map_contains_valid_sample_data = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":274
+    /* "mpfmc/core/audio/sound_file.pyx":313
  * 
  *         # Done with the streaming buffer, release references to it
  *         if self.sample.data.stream.map_contains_valid_sample_data:             # <<<<<<<<<<<<<<
@@ -5223,7 +5803,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":284
+  /* "mpfmc/core/audio/sound_file.pyx":323
  * 
  *         # Cleanup the streaming pipeline
  *         gst_element_set_state(self.pipeline, GST_STATE_NULL)             # <<<<<<<<<<<<<<
@@ -5232,7 +5812,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   (void)(gst_element_set_state(__pyx_v_self->pipeline, GST_STATE_NULL));
 
-  /* "mpfmc/core/audio/sound_file.pyx":285
+  /* "mpfmc/core/audio/sound_file.pyx":324
  *         # Cleanup the streaming pipeline
  *         gst_element_set_state(self.pipeline, GST_STATE_NULL)
  *         gst_object_unref(self.pipeline)             # <<<<<<<<<<<<<<
@@ -5241,7 +5821,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   gst_object_unref(__pyx_v_self->pipeline);
 
-  /* "mpfmc/core/audio/sound_file.pyx":270
+  /* "mpfmc/core/audio/sound_file.pyx":309
  *                        self.file_name, self.sample.duration)
  * 
  *     def unload(self):             # <<<<<<<<<<<<<<
@@ -5256,7 +5836,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":288
+/* "mpfmc/core/audio/sound_file.pyx":327
  * 
  *     @property
  *     def loaded(self):             # <<<<<<<<<<<<<<
@@ -5285,7 +5865,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":290
+  /* "mpfmc/core/audio/sound_file.pyx":329
  *     def loaded(self):
  *         """Returns whether or not the sound file data is loaded in memory"""
  *         return self.sample.data.stream != NULL and self.sample.data.stream.pipeline != NULL and self.sample.data.stream.sink != NULL             # <<<<<<<<<<<<<<
@@ -5294,7 +5874,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_2 = (__pyx_v_self->__pyx_base.sample.data.stream != NULL);
   if (__pyx_t_2) {
   } else {
-    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 290, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 329, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_1 = __pyx_t_3;
     __pyx_t_3 = 0;
@@ -5303,14 +5883,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_2 = (__pyx_v_self->__pyx_base.sample.data.stream->pipeline != NULL);
   if (__pyx_t_2) {
   } else {
-    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 290, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 329, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_1 = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L3_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->__pyx_base.sample.data.stream->sink != NULL);
-  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 329, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_1 = __pyx_t_3;
   __pyx_t_3 = 0;
@@ -5319,7 +5899,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":288
+  /* "mpfmc/core/audio/sound_file.pyx":327
  * 
  *     @property
  *     def loaded(self):             # <<<<<<<<<<<<<<
@@ -5603,9 +6183,11 @@ static PyObject *__pyx_getprop_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFil
 
 static PyMethodDef __pyx_methods_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile[] = {
   {"load", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_7load, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6load},
-  {"unload", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_9unload, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8unload},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11__reduce_cython__, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13__setstate_cython__, METH_O, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__setstate_cython__},
+  {"load_from_buffer", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_9load_from_buffer, METH_O, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8load_from_buffer},
+  {"get_sample_data", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11get_sample_data, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10get_sample_data},
+  {"unload", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13unload, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12unload},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_15__reduce_cython__, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_14__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_17__setstate_cython__, METH_O, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_16__setstate_cython__},
   {0, 0, 0, 0}
 };
 
@@ -5640,7 +6222,7 @@ static PyTypeObject __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  "SoundMemoryFile(unicode file_name, audio_callback_data)\nSoundMemoryFile is a wrapper class to manage sound sample data stored\n    in memory.", /*tp_doc*/
+  "SoundMemoryFile(unicode file_name, audio_callback_data, sample_data=None)\nSoundMemoryFile is a wrapper class to manage sound sample data stored\n    in memory.", /*tp_doc*/
   __pyx_tp_traverse_5mpfmc_4core_5audio_10sound_file_SoundFile, /*tp_traverse*/
   __pyx_tp_clear_5mpfmc_4core_5audio_10sound_file_SoundFile, /*tp_clear*/
   0, /*tp_richcompare*/
@@ -5834,8 +6416,11 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_AudioException, __pyx_k_AudioException, sizeof(__pyx_k_AudioException), 0, 0, 1, 1},
   {&__pyx_kp_u_Could_not_load_sound_file_due_to, __pyx_k_Could_not_load_sound_file_due_to, sizeof(__pyx_k_Could_not_load_sound_file_due_to), 0, 1, 0, 0},
   {&__pyx_kp_u_Could_not_locate_file, __pyx_k_Could_not_locate_file, sizeof(__pyx_k_Could_not_locate_file), 0, 1, 0, 0},
+  {&__pyx_kp_u_Loaded_file_from_buffer_s_Sample, __pyx_k_Loaded_file_from_buffer_s_Sample, sizeof(__pyx_k_Loaded_file_from_buffer_s_Sample), 0, 1, 0, 0},
   {&__pyx_kp_u_Loaded_file_s_Sample_duration_s, __pyx_k_Loaded_file_s_Sample_duration_s, sizeof(__pyx_k_Loaded_file_s_Sample_duration_s), 0, 1, 0, 0},
+  {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
   {&__pyx_kp_u_Must_be_implemented_in_derived_c, __pyx_k_Must_be_implemented_in_derived_c, sizeof(__pyx_k_Must_be_implemented_in_derived_c), 0, 1, 0, 0},
+  {&__pyx_kp_u_No_sample_data_for_file, __pyx_k_No_sample_data_for_file, sizeof(__pyx_k_No_sample_data_for_file), 0, 1, 0, 0},
   {&__pyx_n_s_NotImplementedError, __pyx_k_NotImplementedError, sizeof(__pyx_k_NotImplementedError), 0, 0, 1, 1},
   {&__pyx_n_u_S16BE, __pyx_k_S16BE, sizeof(__pyx_k_S16BE), 0, 1, 0, 1},
   {&__pyx_n_u_S16LE, __pyx_k_S16LE, sizeof(__pyx_k_S16LE), 0, 1, 0, 1},
@@ -5872,6 +6457,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
   {&__pyx_n_s_isfile, __pyx_k_isfile, sizeof(__pyx_k_isfile), 0, 0, 1, 1},
   {&__pyx_n_s_load, __pyx_k_load, sizeof(__pyx_k_load), 0, 0, 1, 1},
+  {&__pyx_n_s_load_from_buffer, __pyx_k_load_from_buffer, sizeof(__pyx_k_load_from_buffer), 0, 0, 1, 1},
   {&__pyx_n_s_loaded, __pyx_k_loaded, sizeof(__pyx_k_loaded), 0, 0, 1, 1},
   {&__pyx_n_s_logging, __pyx_k_logging, sizeof(__pyx_k_logging), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
@@ -5883,6 +6469,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_sample_data, __pyx_k_sample_data, sizeof(__pyx_k_sample_data), 0, 0, 1, 1},
   {&__pyx_kp_s_self_callback_data_self_sample_c, __pyx_k_self_callback_data_self_sample_c, sizeof(__pyx_k_self_callback_data_self_sample_c), 0, 0, 1, 0},
   {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
   {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
@@ -5894,9 +6481,10 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 32, __pyx_L1_error)
+  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 34, __pyx_L1_error)
   __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
-  __pyx_builtin_super = __Pyx_GetBuiltinName(__pyx_n_s_super); if (!__pyx_builtin_super) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_builtin_super = __Pyx_GetBuiltinName(__pyx_n_s_super); if (!__pyx_builtin_super) __PYX_ERR(0, 55, __pyx_L1_error)
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 126, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -5906,14 +6494,14 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":32
+  /* "mpfmc/core/audio/sound_file.pyx":34
  *     def load(self):
  *         """Load the sound file"""
  *         raise NotImplementedError("Must be implemented in derived class")             # <<<<<<<<<<<<<<
  * 
  *     def unload(self):
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Must_be_implemented_in_derived_c); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 32, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Must_be_implemented_in_derived_c); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 34, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
@@ -6023,37 +6611,37 @@ static int __Pyx_modinit_type_init_code(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile.tp_dictoffset && __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_SoundFile, (PyObject *)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_SoundFile, (PyObject *)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
   __pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundFile = &__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile;
   __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile.tp_base = __pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundFile;
-  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 49, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile.tp_dictoffset && __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_SoundMemoryFile, (PyObject *)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_SoundMemoryFile, (PyObject *)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 49, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 49, __pyx_L1_error)
   __pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile = &__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile;
   __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile.tp_base = __pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundFile;
-  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 123, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 162, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile.tp_dictoffset && __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_SoundStreamingFile, (PyObject *)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 123, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 123, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_SoundStreamingFile, (PyObject *)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 162, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 162, __pyx_L1_error)
   __pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile = &__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -6284,48 +6872,48 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "mpfmc/core/audio/sound_file.pyx":6
- * from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+  /* "mpfmc/core/audio/sound_file.pyx":8
+ * from libc.string cimport memcpy
  * cimport cpython.pycapsule as pycapsule
  * import logging             # <<<<<<<<<<<<<<
  * import os
  * 
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_logging, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_logging, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logging, __pyx_t_1) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logging, __pyx_t_1) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":7
+  /* "mpfmc/core/audio/sound_file.pyx":9
  * cimport cpython.pycapsule as pycapsule
  * import logging
  * import os             # <<<<<<<<<<<<<<
  * 
  * from mpfmc.core.audio.audio_exception import AudioException
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_os, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_os, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_os, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_os, __pyx_t_1) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":9
+  /* "mpfmc/core/audio/sound_file.pyx":11
  * import os
  * 
  * from mpfmc.core.audio.audio_exception import AudioException             # <<<<<<<<<<<<<<
  * from mpfmc.core.audio.sdl2 cimport *
  * from mpfmc.core.audio.gstreamer cimport *
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 11, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_s_AudioException);
   __Pyx_GIVEREF(__pyx_n_s_AudioException);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_AudioException);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_mpfmc_core_audio_audio_exception, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_mpfmc_core_audio_audio_exception, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 11, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 11, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_AudioException, __pyx_t_1) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_AudioException, __pyx_t_1) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
@@ -7132,6 +7720,171 @@ static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
 #endif
 }
 
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+    #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#endif
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
 /* KeywordStringCheck */
 static int __Pyx_CheckKeywordStrings(
     PyObject *kwdict,
@@ -2,6 +2,8 @@
 #cython: embedsignature=True, language_level=3
 
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+from libc.string cimport memcpy
 cimport cpython.pycapsule as pycapsule
 import logging
 import os
@@ -48,7 +50,7 @@ cdef class SoundMemoryFile(SoundFile):
     """SoundMemoryFile is a wrapper class to manage sound sample data stored
     in memory."""
 
-    def __init__(self, str file_name, object audio_callback_data):
+    def __init__(self, str file_name, object audio_callback_data, object sample_data=None):
         # IMPORTANT: Call super class init function
         super().__init__(file_name, audio_callback_data)
         self.log = logging.getLogger("SoundMemoryFile")
@@ -57,7 +59,10 @@ cdef class SoundMemoryFile(SoundFile):
         self.sample.data.memory.data = NULL
         self.sample.data.memory.size = 0
 
-        self.load()
+        if sample_data is None:
+            self.load()
+        else:
+            self.load_from_buffer(sample_data)
 
     def __dealloc__(self):
         self.unload()
@@ -103,6 +108,40 @@ cdef class SoundMemoryFile(SoundFile):
         self.log.debug('Loaded file: %s Sample duration: %s',
                        self.file_name, self.sample.duration)
 
+    def load_from_buffer(self, object sample_data not None):
+        """Loads already decoded sample data (in the current sample output format) into memory."""
+        cdef Py_buffer view
+        if self.loaded:
+            return
+
+        PyObject_GetBuffer(sample_data, &view, PyBUF_SIMPLE)
+        try:
+            if view.len == 0:
+                raise AudioException('No sample data for file ' + self.file_name)
+
+            # The sample memory is allocated with SDL_malloc like the memory of Mix_LoadWAV so unload
+            # can free both the same way.
+            self.sample.data.memory.data = <gpointer>SDL_malloc(view.len)
+            if self.sample.data.memory.data == NULL:
+                raise MemoryError()
+
+            memcpy(<void*>self.sample.data.memory.data, view.buf, view.len)
+            self.sample.data.memory.size = <gsize>view.len
+        finally:
+            PyBuffer_Release(&view)
+
+        self.sample.duration = self.sample.data.memory.size / self.callback_data.seconds_to_bytes_factor
+
+        self.log.debug('Loaded file from buffer: %s Sample duration: %s',
+                       self.file_name, self.sample.duration)
+
+    def get_sample_data(self):
+        """Returns a copy of the decoded sample data (e.g. to cache it)"""
+        if not self.loaded:
+            return None
+
+        return (<char*>self.sample.data.memory.data)[:self.sample.data.memory.size]
+
     def unload(self):
         """Unloads the sample data from memory"""
         if self.sample.data.memory.data != NULL:
@@ -0,0 +1,506 @@
+"""Asyncio based BCP Server interface for the MPF Media Controller."""
+
+import asyncio
+import logging
+from collections import deque
+import socket
+import sys
+import threading
+import time
+import traceback
+
+from mpf.exceptions.runtime_error import MpfRuntimeError
+from mpfmc.core.bcp_decoder import BcpDecoder
+from mpfmc.core.bcp_server import create_unix_socket, get_host_and_port, remove_unix_socket
+
+# categories of outgoing commands for monitor clients. all other commands are in "core"
+BCP_CATEGORIES = {
+    'dmd_frame': 'dmd',
+    'dmd_frame_delta': 'dmd',
+    'rgb_dmd_frame': 'dmd',
+    'rgb_dmd_frame_delta': 'dmd',
+    'trigger': 'triggers',
+    'set_machine_var': 'machine_vars',
+    'status_report': 'status',
+}
+
+
+def get_message_category(data):
+    """Return the category of an encoded outgoing message."""
+    return BCP_CATEGORIES.get(data.split(b'?', 1)[0].strip().decode(), 'core')
+
+
+class BcpServerProtocol(asyncio.Protocol):
+
+    """Streaming BCP protocol which splits lines and binary payloads.
+
+    Args:
+        server: The AsyncioBCPServer which owns this connection.
+
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self._buffer = bytearray()
+        self._pending_command = None
+        self._bytes_needed = 0
+
+    def connection_made(self, transport):
+        """Register the connection with the server."""
+        self.transport = transport
+        self.server.client_connected(self, transport)
+
+    def connection_lost(self, exc):
+        """Tell the server that the client went away."""
+        del exc
+        self.server.client_disconnected(self)
+
+    def pause_writing(self):
+        """Stop writing to a client which does not keep up."""
+        self.server.client_writing_paused(self, True)
+
+    def resume_writing(self):
+        """Continue writing to the client."""
+        self.server.client_writing_paused(self, False)
+
+    def data_received(self, data):
+        """Parse all complete commands from the receive buffer."""
+        received = time.perf_counter()
+        buffer = self._buffer
+        buffer.extend(data)
+        commands = []
+        pos = 0
+
+        # lines and payloads are copied once from the buffer
+        with memoryview(buffer) as view:
+            while True:
+                if self._pending_command:
+                    # waiting for the binary payload of a "&bytes=" command
+                    if len(buffer) - pos < self._bytes_needed:
+                        break
+
+                    cmd, kwargs = self._pending_command
+                    kwargs['rawbytes'] = bytes(view[pos:pos + self._bytes_needed])
+                    pos += self._bytes_needed
+                    self._pending_command = None
+                    self._bytes_needed = 0
+                    commands.append((cmd, kwargs))
+                    continue
+
+                end = buffer.find(b'\n', pos)
+                if end < 0:
+                    break
+
+                line = bytes(view[pos:end]).strip()
+                pos = end + 1
+                if not line:
+                    continue
+
+                try:
+                    cmd, kwargs, bytes_needed = self.server.decode_line(line)
+                except UnicodeDecodeError:
+                    self.server.log.warning("Failed to decode BCP message: %s", line)
+                    continue
+
+                if bytes_needed:
+                    self._pending_command = (cmd, kwargs)
+                    self._bytes_needed = bytes_needed
+                else:
+                    commands.append((cmd, kwargs))
+
+        del buffer[:pos]
+
+        if commands:
+            self.server.commands_received(commands, received, self)
+
+
+class BcpMonitorClient:
+
+    """A secondary client which receives the categories it subscribed to.
+
+    Outgoing messages are queued per client. If the client does not keep up
+    the oldest messages are dropped so it never slows down the MC or the
+    main connection.
+
+    Args:
+        transport: The asyncio transport of the client.
+        queue_size: Maximum number of queued messages.
+
+    """
+
+    __slots__ = ["transport", "categories", "queue", "queue_size", "dropped", "paused"]
+
+    def __init__(self, transport, queue_size):
+        self.transport = transport
+        self.categories = set()
+        self.queue = deque()
+        self.queue_size = queue_size
+        self.dropped = 0
+        self.paused = False
+
+    def wants(self, category):
+        """Return true if the client subscribed to a category."""
+        return category in self.categories or 'all' in self.categories
+
+    def queue_message(self, data):
+        """Queue the buffers of a message. Drops the oldest one when full."""
+        if len(self.queue) >= self.queue_size:
+            self.queue.popleft()
+            self.dropped += 1
+        self.queue.append(data)
+
+    def take_messages(self):
+        """Return and remove all queued messages unless writing is paused."""
+        if self.paused or not self.queue:
+            return []
+
+        messages = list(self.queue)
+        self.queue.clear()
+        return messages
+
+
+class AsyncioBCPServer(threading.Thread):
+
+    """BCP Server which runs a single asyncio event loop in its own thread.
+
+    This replaces the receiving and sending threads of the BCPServer with one
+    event loop. Incoming data is parsed as a stream and complete commands are
+    put into the receive queue in one batch. Outgoing messages are buffered
+    and written with one ``writelines`` call per loop iteration.
+
+    The first client is the main connection (MPF). Up to bcp_max_clients - 1
+    additional clients (monitors, DMD bridges or another MC) may connect.
+    They subscribe to categories of outgoing commands with
+    ``monitor_start?category=dmd`` (see BCP_CATEGORIES, "all" subscribes to
+    everything) and ``monitor_stop`` (all categories if none is passed).
+    Their other commands are ignored.
+    Every monitor has a bounded queue so slow monitors never hold back the
+    main connection.
+
+    Args:
+        mc: A reference to the main MediaController instance.
+        receiving_queue: A shared Queue() object which holds incoming BCP
+            commands.
+        sending_queue: A shared BcpSendQueue object which holds outgoing BCP
+            commands. While the main client does not keep up streamed
+            messages stay in the queue and are replaced by newer ones.
+
+    """
+
+    def __init__(self, mc, receiving_queue, sending_queue):
+
+        threading.Thread.__init__(self)
+        self.mc = mc
+        self.log = logging.getLogger('MPF-MC BCP Server')
+        self.receive_queue = receiving_queue
+        self.sending_queue = sending_queue
+        self.loop = asyncio.new_event_loop()
+        self.connection = None
+        self.transport = None
+        self.socket = None
+        self.socket_path = None
+        self.server = None
+        self.done = False
+
+        self.max_clients = max(int(mc.machine_config['mpf-mc']['bcp_max_clients']), 1)
+        self.client_queue_size = int(mc.machine_config['mpf-mc']['bcp_client_queue_size'])
+        self.monitors = dict()
+        self.decoder = BcpDecoder()
+
+        self._send_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._writing_paused = False
+        self._accept_timer = None
+
+        if mc.machine_config['mpf-mc']['bcp_socket_path']:
+            self.setup_unix_socket(mc.machine_config['mpf-mc']['bcp_socket_path'])
+        else:
+            self.setup_server_socket(mc.machine_config['mpf-mc']['bcp_interface'],
+                                     mc.machine_config['mpf-mc']['bcp_port'])
+
+    def setup_server_socket(self, interface='localhost', port=5050):
+        """Sets up the socket listener.
+
+        Args:
+            interface: String name of which interface this socket will listen
+                on.
+            port: Integer TCP port number the socket will listen on.
+
+        """
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+        self.log.info('Starting up on %s port %s (asyncio)', interface, port)
+
+        try:
+            self.socket.bind((interface, port))
+        except IOError as e:
+            raise MpfRuntimeError("Failed to bind BCP Socket to {} on port {}. "
+                                  "Is there another application running on that port?".format(interface, port), 1,
+                                  self.log.name) from e
+
+        self.socket.listen(5)
+        self.socket.setblocking(False)
+
+    def setup_unix_socket(self, path):
+        """Sets up a unix domain socket listener.
+
+        Args:
+            path: File system path of the socket.
+
+        """
+        self.socket = create_unix_socket(path, self.log)
+        self.socket_path = path
+        self.socket.listen(5)
+        self.socket.setblocking(False)
+
+    def run(self):
+        """Run the event loop until the MC stops."""
+        try:
+            asyncio.set_event_loop(self.loop)
+            if self.socket.family == socket.AF_INET:
+                create_server = self.loop.create_server
+            else:
+                create_server = self.loop.create_unix_server
+            self.server = self.loop.run_until_complete(
+                create_server(lambda: BcpServerProtocol(self), sock=self.socket))
+
+            self._post_client_disconnected()
+            if self.mc.options['production']:
+                self._accept_timer = self.loop.call_later(30, self._accept_timeout)
+            self.loop.call_later(1, self._check_thread_stopper)
+
+            self.loop.run_forever()
+
+            self.server.close()
+            self.loop.run_until_complete(self.server.wait_closed())
+            self.loop.close()
+            if self.socket_path:
+                remove_unix_socket(self.socket_path)
+
+        except Exception:   # noqa
+            exc_type, exc_value, exc_traceback = sys.exc_info()
+            lines = traceback.format_exception(exc_type, exc_value,
+                                               exc_traceback)
+            msg = ''.join(line for line in lines)
+            self.mc.crash_queue.put(msg)
+
+    def _post_client_disconnected(self):
+        # Since posting an event from a thread is not safe, we just
+        # drop the event we want into the receive queue and let the
+        # main loop pick it up
+        host, port = get_host_and_port(self.socket.getsockname())
+        self.receive_queue.put(('trigger',
+                                {'name': 'client_disconnected',
+                                 'host': host,
+                                 'port': port}))
+        self.mc.bcp_client_connected = False
+
+    def _accept_timeout(self):
+        if not self.connection:
+            self.log.warning("Timeout while waiting for connection. Stopping!")
+            self.mc.stop()
+            self.loop.stop()
+
+    def _check_thread_stopper(self):
+        if self.mc.thread_stopper.is_set():
+            self.log.info("Stopping BCP server loop")
+            self.loop.stop()
+            return
+
+        self.loop.call_later(1, self._check_thread_stopper)
+
+    def client_connected(self, connection, transport):
+        """Accept the main client and monitors up to bcp_max_clients."""
+        if self.connection:
+            if len(self.monitors) + 1 >= self.max_clients:
+                self.log.warning("Rejecting additional BCP connection from %s",
+                                 transport.get_extra_info('peername'))
+                transport.close()
+                return
+
+            self.log.info("Accepted monitor connection from: %s", transport.get_extra_info('peername'))
+            with self._send_lock:
+                self.monitors[connection] = BcpMonitorClient(transport, self.client_queue_size)
+            return
+
+        if self._accept_timer:
+            self._accept_timer.cancel()
+            self._accept_timer = None
+
+        sock = transport.get_extra_info('socket')
+        if sock is not None and sock.family == socket.AF_INET:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self.connection = connection
+        self.transport = transport
+        host, port = get_host_and_port(transport.get_extra_info('peername'))
+
+        self.log.info("Received connection from: %s:%s", host, port)
+
+        self.receive_queue.put(('trigger',
+                                {'name': 'client_connected',
+                                 'host': host,
+                                 'port': port}))
+        self.mc.bcp_client_connected = True
+
+    def client_disconnected(self, connection):
+        """Stop the MC when the main client closes the connection."""
+        if connection is not self.connection:
+            with self._send_lock:
+                self.monitors.pop(connection, None)
+            return
+
+        self.connection = None
+        self.transport = None
+
+        # always exit
+        self.mc.stop()
+        self.loop.stop()
+
+    def decode_line(self, line):
+        """Decode a received line into command, kwargs and payload length.
+
+        Raises UnicodeDecodeError if the line is not valid UTF-8.
+        """
+        self.log.debug('Received "%s"', line)
+
+        try:
+            return self.decoder.decode_with_payload_length(line)
+        except UnicodeDecodeError:
+            raise
+        except ValueError:
+            self.log.error("DECODE BCP ERROR. Message: %s", line)
+            raise
+
+    def client_writing_paused(self, connection, paused):
+        """Stop or continue writing to a client when its socket buffer is full.
+
+        Control messages are still written to the main client. Only streamed
+        messages are held back.
+        """
+        if connection is self.connection:
+            self._writing_paused = paused
+        elif connection in self.monitors:
+            self.monitors[connection].paused = paused
+        else:
+            return
+
+        if not paused:
+            self._flush()
+
+    def commands_received(self, commands, received=None, connection=None):
+        """Hand a batch of decoded commands to the main thread.
+
+        Args:
+            commands: List of (command, kwargs) tuples.
+            received: Optional time.perf_counter() when the data was read
+                from the socket. It is passed on for BCP statistics.
+            connection: The protocol of the client which sent the commands.
+        """
+        if connection is not None and connection in self.monitors:
+            self._monitor_commands_received(self.monitors[connection], commands)
+            return
+
+        for cmd, kwargs in commands:
+            if received is None:
+                self.receive_queue.put((cmd, kwargs))
+            else:
+                self.receive_queue.put((cmd, kwargs, received))
+
+    def _monitor_commands_received(self, monitor, commands):
+        for cmd, kwargs in commands:
+            if cmd == 'monitor_start':
+                monitor.categories.add(kwargs.get('category'))
+            elif cmd == 'monitor_stop':
+                if kwargs.get('category'):
+                    monitor.categories.discard(kwargs['category'])
+                else:
+                    monitor.categories.clear()
+            else:
+                self.log.debug("Ignoring command %s from monitor", cmd)
+
+    def send(self, msg, rawbytes=None):
+        """Queue an encoded BCP message and schedule a flush on the loop.
+
+        This is called from the main thread. If rawbytes are passed, msg is
+        the complete encoded header line.
+        """
+        self.sending_queue.put((msg, rawbytes))
+        self._schedule_flush()
+
+    # pylint: disable-msg=too-many-arguments
+    def send_stream(self, stream_key, bcp_command, kwargs, rawbytes=None, merge=None):
+        """Queue a streamed message and schedule a flush on the loop.
+
+        A pending message of the same stream is replaced.
+        """
+        self.sending_queue.put_stream(stream_key, bcp_command, kwargs, rawbytes, merge)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        with self._send_lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        try:
+            self.loop.call_soon_threadsafe(self._flush)
+        except RuntimeError:
+            # loop is already closed
+            pass
+
+    def get_send_queue_depth(self):
+        """Return the number of messages which wait to be written."""
+        return self.sending_queue.qsize()
+
+    def _flush(self):
+        with self._send_lock:
+            self._flush_scheduled = False
+
+        if not self.transport or self.transport.is_closing():
+            self.sending_queue.clear_streams()
+
+        data = []
+        messages = []
+        for msg, rawbytes in self.sending_queue.drain(streams=not self._writing_paused):
+            if rawbytes:
+                message = [msg, rawbytes]
+            else:
+                message = [('{}\n'.format(msg)).encode('utf-8')]
+            data.extend(message)
+            messages.append(message)
+
+        if data and self.transport and not self.transport.is_closing():
+            self.transport.writelines(data)
+
+        if not self.monitors:
+            return
+
+        with self._send_lock:
+            for message in messages:
+                category = get_message_category(message[0])
+                for monitor in self.monitors.values():
+                    if monitor.wants(category):
+                        monitor.queue_message(message)
+
+            monitor_messages = [(monitor.transport, monitor.take_messages())
+                                for monitor in self.monitors.values()]
+
+        for transport, messages in monitor_messages:
+            if messages and not transport.is_closing():
+                for message in messages:
+                    transport.writelines(message)
+
+    def stop(self):
+        """ Stops and shuts down the BCP server."""
+        if not self.done:
+            self.log.info("Socket thread stopping.")
+            self.send('goodbye')
+            self.done = True
+            self.mc.done = True
+            try:
+                self.loop.call_soon_threadsafe(self.loop.stop)
+            except RuntimeError:
+                pass
@@ -0,0 +1,151 @@
+"""Fast decoder for incoming BCP commands.
+
+The decoder returns the same results as
+mpf.core.bcp.bcp_socket_client.decode_command_string but works directly on
+the received bytes. The command name and the decoded parameter names of
+every command shape (command plus parameter names) are cached so repeated
+commands only decode their values.
+"""
+import json
+from typing import Tuple
+from urllib.parse import unquote
+
+MAX_LAYOUTS = 1024
+
+BYTES_SEPARATOR = b'&bytes='
+
+
+def decode_value(raw: bytes):
+    """Decode a parameter value including the BCP type prefixes."""
+    text = raw.decode()
+    if '+' in text:
+        text = text.replace('+', ' ')
+    if '%' in text:
+        text = unquote(text, errors='replace')
+
+    if ':' in text:
+        if text.startswith('int:'):
+            return int(text[4:])
+        if text.startswith('float:'):
+            return float(text[6:])
+        lower = text.lower()
+        if lower == 'bool:true':
+            return True
+        if lower == 'bool:false':
+            return False
+        if text == 'NoneType:':
+            return None
+
+    # like decode_command_string values are unquoted twice
+    if '%' in text:
+        return unquote(text)
+
+    return text
+
+
+def _decode_name(raw: bytes) -> str:
+    text = raw.decode()
+    if '+' in text:
+        text = text.replace('+', ' ')
+    if '%' in text:
+        text = unquote(text, errors='replace')
+    return text
+
+
+class BcpDecoder:
+
+    """Decodes BCP command lines from bytes.
+
+    Args:
+        max_layouts: Maximum number of cached command shapes. The cache is
+            cleared when it is full.
+
+    """
+
+    __slots__ = ["max_layouts", "_layouts", "_commands"]
+
+    def __init__(self, max_layouts: int = MAX_LAYOUTS) -> None:
+        """Initialise decoder."""
+        self.max_layouts = max_layouts
+        self._layouts = dict()
+        self._commands = dict()
+
+    def decode(self, line) -> Tuple[str, dict]:
+        """Decode a line without newline into the command and its kwargs.
+
+        Args:
+            line: bytes, bytearray or a memoryview of the receive buffer.
+
+        Raises UnicodeDecodeError if the line is not valid UTF-8 and
+        ValueError if a value or JSON payload cannot be parsed.
+        """
+        if not isinstance(line, bytes):
+            line = bytes(line)
+
+        command, separator, query = line.strip().partition(b'?')
+        if not separator or not query:
+            return self._get_command(command), dict()
+
+        if query.startswith(b'json='):
+            return self._get_command(command), json.loads(query[5:].decode())
+
+        raw_names = []
+        raw_values = []
+        for part in query.split(b'&'):
+            if not part:
+                continue
+            name, _, value = part.partition(b'=')
+            raw_names.append(name)
+            raw_values.append(value)
+
+        layout_key = (command, tuple(raw_names))
+        layout = self._layouts.get(layout_key)
+        if layout is None:
+            layout = self._add_layout(layout_key)
+
+        command, names, unique = layout
+        if unique:
+            return command, dict(zip(names, map(decode_value, raw_values)))
+
+        # the first value of a parameter wins
+        kwargs = dict()
+        for name, raw_value in zip(names, raw_values):
+            if name not in kwargs:
+                kwargs[name] = decode_value(raw_value)
+        return command, kwargs
+
+    def decode_with_payload_length(self, line) -> Tuple[str, dict, int]:
+        """Decode a line which may announce a binary payload with "&bytes=".
+
+        Returns the command, kwargs and the length of the payload which
+        follows the line (0 if there is none).
+        """
+        if not isinstance(line, bytes):
+            line = bytes(line)
+
+        if BYTES_SEPARATOR not in line:
+            command, kwargs = self.decode(line)
+            return command, kwargs, 0
+
+        line, _, length = line.partition(BYTES_SEPARATOR)
+        command, kwargs = self.decode(line)
+        return command, kwargs, int(length)
+
+    def _get_command(self, raw: bytes) -> str:
+        command = self._commands.get(raw)
+        if command is None:
+            command = raw.decode()
+            if len(self._commands) >= self.max_layouts:
+                self._commands.clear()
+            self._commands[raw] = command
+        return command
+
+    def _add_layout(self, layout_key):
+        raw_command, raw_names = layout_key
+        names = tuple(_decode_name(name) for name in raw_names)
+        layout = (self._get_command(raw_command), names, len(set(names)) == len(names))
+
+        if len(self._layouts) >= self.max_layouts:
+            self._layouts.clear()
+        self._layouts[layout_key] = layout
+        return layout
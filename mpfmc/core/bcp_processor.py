@@ -1,7 +1,10 @@
-from copy import deepcopy
+from collections import OrderedDict
 
+import os
 import queue
 import logging
+import tempfile
+import time
 from distutils.version import LooseVersion
 
 import psutil
@@ -10,6 +13,11 @@ from kivy.clock import Clock
 import mpf.core.bcp.bcp_socket_client as bcp
 from mpfmc._version import __bcp_version__, version as mc_version, extended_version as mc_extended_version
 from mpfmc.core.bcp_server import BCPServer
+from mpfmc.core.bcp_asyncio_server import AsyncioBCPServer
+from mpfmc.core.bcp_recorder import BcpSessionRecorder
+from mpfmc.core.bcp_send_queue import BcpSendQueue
+from mpfmc.core.bcp_shared_memory import SharedMemoryRing
+from mpfmc.core.bcp_stats import BcpStats
 
 
 class BcpProcessor:
@@ -20,8 +28,30 @@ class BcpProcessor:
         self.socket_thread = None
         self.connected = False
         self.receive_queue = queue.Queue()
-        self.sending_queue = queue.Queue()
+        self.sending_queue = BcpSendQueue(self._encode_message)
         self.mc_process = psutil.Process()
+        self._rawbytes_headers = dict()
+
+        self.time_budget = self.mc.machine_config['mpf-mc']['bcp_time_budget']
+        self.queue_depth = 0
+        """Number of commands which were left in the queue after the last frame."""
+        self.frame_processing_time = 0.0
+        """Seconds spent processing commands in the last frame."""
+
+        coalescing_config = self.mc.machine_config['mpf-mc']['variable_coalescing']
+        self.coalesce_variables = coalescing_config['enabled']
+        self.all_changes_variables = set(coalescing_config['all_changes'] or [])
+        self.coalesced_updates = 0
+        """Number of variable updates which were replaced by a later one."""
+        self._pending_variables = OrderedDict()
+
+        self.stats = BcpStats(self.mc.machine_config['mpf-mc']['bcp_stats'])
+
+        self.shared_memory = None
+        self.shared_memory_attached = False
+        self.recorder = None
+        if self.mc.options.get('bcp_record_file'):
+            self.start_recording(self.mc.options['bcp_record_file'])
 
         if self.mc.options['bcp']:
             self.mc.events.add_handler('init_done', self._start_socket_thread)
@@ -45,13 +75,24 @@ class BcpProcessor:
                              'player_variable': self._bcp_player_variable,
                              'reset': self._bcp_reset,
                              'settings': self._bcp_settings,
+                             'shared_memory_attach': self._bcp_shared_memory_attach,
+                             'shared_memory_detach': self._bcp_shared_memory_detach,
                              'status_request': self._bcp_status_request,
                              'switch': self._bcp_switch,
                              'trigger': self._bcp_trigger,
                              }
 
+        # handlers for the most frequent commands which take the kwargs dict
+        # directly. they are used if all required parameters are present
+        self._fast_paths = {
+            'trigger': (frozenset(('name',)), self._fast_trigger),
+            'switch': (frozenset(('name', 'state')), self._fast_switch),
+            'player_variable': (frozenset(('name', 'value', 'player_num')), self._fast_player_variable),
+        }
+
         self.mc.events.add_handler('client_connected', self._client_connected)
         self.mc.events.add_handler('mc_reset_complete', self._reset_complete)
+        self.mc.events.add_handler('debug_dump_stats', self._debug_dump_stats)
 
         Clock.schedule_interval(self._get_from_queue, 0)
 
@@ -69,6 +110,51 @@ class BcpProcessor:
         self.register_trigger("debug_dump_stats")
         self.connected = True
 
+        if self.mc.machine_config['mpf-mc']['bcp_shared_memory']['enabled']:
+            self._announce_shared_memory()
+
+    def _announce_shared_memory(self):
+        """Tell the client where it can attach to the shared memory ring.
+
+        Binary payloads are only written to the ring after the client sent
+        shared_memory_attach.
+        """
+        if not self.shared_memory:
+            config = self.mc.machine_config['mpf-mc']['bcp_shared_memory']
+            path = config['path']
+            if not path:
+                socket_path = self.mc.machine_config['mpf-mc']['bcp_socket_path']
+                path = socket_path + '.shm' if socket_path else os.path.join(
+                    tempfile.gettempdir(), 'mpf-mc-bcp.shm')
+            self.shared_memory = SharedMemoryRing(path, int(config['size']))
+            self.mc.events.add_handler('shutdown', self._close_shared_memory)
+
+        self.shared_memory_attached = False
+        self.send("shared_memory_available", path=self.shared_memory.path,
+                  size=self.shared_memory.capacity)
+
+    def _bcp_shared_memory_attach(self, **kwargs):
+        """Send binary payloads through the shared memory ring."""
+        del kwargs
+        if not self.shared_memory:
+            self.log.warning("Client wants to attach to shared memory but it is not enabled.")
+            return
+
+        self.shared_memory.reset()
+        self.shared_memory_attached = True
+
+    def _bcp_shared_memory_detach(self, **kwargs):
+        """Send binary payloads through the socket again."""
+        del kwargs
+        self.shared_memory_attached = False
+
+    def _close_shared_memory(self, **kwargs):
+        del kwargs
+        self.shared_memory_attached = False
+        if self.shared_memory:
+            self.shared_memory.close()
+            self.shared_memory = None
+
     def register_trigger(self, event):
         """Register a trigger for events from MPF."""
         self.send("register_trigger", event=event)
@@ -79,14 +165,28 @@ class BcpProcessor:
         if self.socket_thread:
             return
 
-        self.socket_thread = BCPServer(self.mc, self.receive_queue,
-                                       self.sending_queue)
+        transport = self.mc.machine_config['mpf-mc']['bcp_transport']
+        if transport == 'asyncio':
+            server_cls = AsyncioBCPServer
+        elif transport == 'thread':
+            server_cls = BCPServer
+            if self.mc.machine_config['mpf-mc']['bcp_max_clients'] > 1:
+                self.log.warning("mpf-mc: bcp_max_clients needs bcp_transport: asyncio. "
+                                 "Only one client can connect.")
+        else:
+            raise ValueError("Invalid BCP transport '{}' in mpf-mc: bcp_transport. "
+                             "Valid options are 'thread' and 'asyncio'.".format(transport))
+
+        self.socket_thread = server_cls(self.mc, self.receive_queue,
+                                        self.sending_queue)
         self.socket_thread.daemon = True
         self.socket_thread.start()
 
         self.mc.events.remove_handler(self._start_socket_thread)
 
-    def send(self, bcp_command, callback=None, rawbytes=None, **kwargs):
+    # pylint: disable-msg=too-many-arguments
+    def send(self, bcp_command, callback=None, rawbytes=None, stream_key=None,
+             merge=None, **kwargs):
         """Sends a BCP command to the connected pinball controller.
 
         Note that if the BCP server is not running, this method will just throw
@@ -96,6 +196,14 @@ class BcpProcessor:
             bcp_command: String of the BCP command name.
             callback: Optional callback method that will be called when the
                 command is sent.
+            rawbytes: Optional binary payload (bytes, bytearray or any other
+                buffer) which is sent after the command without copying.
+            stream_key: Optional name of a stream (e.g. frames of one DMD). If
+                the previous message of the stream has not been sent yet it is
+                replaced by this one. Use this only for messages where only the
+                latest one matters.
+            merge: Optional name of a dict parameter which is merged with the
+                one of a replaced message of the same stream.
             **kwargs: Optional additional kwargs will be added to the BCP
                 command string.
 
@@ -104,13 +212,117 @@ class BcpProcessor:
             if not self.mc.bcp_client_connected:
                 raise AssertionError("Not connected to MPF.")
 
-            self.sending_queue.put(
-                (bcp.encode_command_string(bcp_command, **kwargs), rawbytes))
+            if stream_key:
+                self._send_stream(stream_key, bcp_command, rawbytes, merge, kwargs)
+            elif rawbytes and self.shared_memory_attached:
+                self._send_shared_memory(bcp_command, rawbytes, kwargs)
+            elif rawbytes:
+                self.socket_thread.send(
+                    self._get_rawbytes_header(bcp_command, len(rawbytes), kwargs), rawbytes)
+            else:
+                self.socket_thread.send(
+                    bcp.encode_command_string(bcp_command, **kwargs))
+
+            if self.stats.enabled:
+                self.stats.record_send(self.socket_thread.get_send_queue_depth())
 
         if callback:
             callback()
 
-    def receive_bcp_message(self, msg):
+    # pylint: disable-msg=too-many-arguments
+    def _send_stream(self, stream_key, bcp_command, rawbytes, merge, kwargs):
+        if rawbytes and self.shared_memory_attached:
+            shm_kwargs = self._write_shared_memory(rawbytes, kwargs)
+            if shm_kwargs is not None:
+                rawbytes = None
+                kwargs = shm_kwargs
+
+        self.socket_thread.send_stream(stream_key, bcp_command, kwargs, rawbytes, merge)
+
+    def _encode_message(self, bcp_command, kwargs, rawbytes):
+        """Encode a streamed message when it is taken from the sending queue."""
+        if rawbytes:
+            return self._get_rawbytes_header(bcp_command, len(rawbytes), kwargs), rawbytes
+
+        return bcp.encode_command_string(bcp_command, **kwargs), None
+
+    def _write_shared_memory(self, rawbytes, kwargs):
+        """Write a binary payload to the shared memory ring.
+
+        Returns the kwargs of the command which references the payload or None
+        if the ring is full.
+        """
+        position = self.shared_memory.write(rawbytes)
+        if position is None:
+            return None
+
+        shm_kwargs = dict(shm_pos=position, shm_length=len(rawbytes))
+        shm_kwargs.update(kwargs)
+        return shm_kwargs
+
+    def _send_shared_memory(self, bcp_command, rawbytes, kwargs):
+        """Write a binary payload to the shared memory ring.
+
+        Only the position and length are sent through the socket. If the ring
+        is full the payload is sent through the socket instead.
+        """
+        shm_kwargs = self._write_shared_memory(rawbytes, kwargs)
+        if shm_kwargs is None:
+            self.socket_thread.send(
+                self._get_rawbytes_header(bcp_command, len(rawbytes), kwargs), rawbytes)
+            return
+
+        self.socket_thread.send(bcp.encode_command_string(bcp_command, **shm_kwargs))
+
+    def _get_rawbytes_header(self, bcp_command, length, kwargs):
+        """Return the encoded header line for a binary BCP message.
+
+        Streamed payloads (e.g. DMD frames) use the same command, kwargs and
+        length for every frame, so the encoded header is cached.
+        """
+        try:
+            cache_key = (bcp_command, length, tuple(sorted(kwargs.items())))
+            header = self._rawbytes_headers.get(cache_key)
+        except TypeError:
+            # unhashable kwargs
+            cache_key = None
+            header = None
+
+        if header is None:
+            header = '{}&bytes={}\n'.format(
+                bcp.encode_command_string(bcp_command, **kwargs), length).encode('utf-8')
+
+            if cache_key is not None:
+                if len(self._rawbytes_headers) > 256:
+                    self._rawbytes_headers.clear()
+                self._rawbytes_headers[cache_key] = header
+
+        return header
+
+    def start_recording(self, path):
+        """Record all incoming BCP commands to a session file.
+
+        The recording can be replayed with
+        mpfmc.core.bcp_recorder.BcpSessionPlayer.
+        """
+        if self.recorder:
+            self.stop_recording()
+
+        self.log.info("Recording BCP session to %s", path)
+        self.recorder = BcpSessionRecorder(path)
+        self.mc.events.add_handler('shutdown', self.stop_recording)
+
+    def stop_recording(self, **kwargs):
+        """Stop recording and close the session file."""
+        del kwargs
+        if not self.recorder:
+            return
+
+        self.recorder.stop()
+        self.recorder = None
+        self.mc.events.remove_handler(self.stop_recording)
+
+    def receive_bcp_message(self, msg, rawbytes=None):
         """Receives an incoming BCP message to be processed.
 
         Note this method is intended for testing. Usually BCP messages are
@@ -121,23 +333,155 @@ class BcpProcessor:
         Args:
             msg: A string of the BCP message (in the standard BCP format:
                 command?param1=value1&param2=value2...
+            rawbytes: Optional binary payload of the message.
 
         """
         cmd, kwargs = bcp.decode_command_string(msg)
+        if rawbytes is not None:
+            kwargs['rawbytes'] = rawbytes
         self.receive_queue.put((cmd, kwargs))
 
     def _get_from_queue(self, dt):
-        """Gets and processes all queued up incoming BCP commands."""
+        """Gets and processes queued up incoming BCP commands.
+
+        If a time budget is set, processing stops when it is exhausted and the
+        remaining commands are processed in the next frame. At least one
+        command is processed per frame and the order is always kept.
+        """
         del dt
 
-        while not self.receive_queue.empty():
-            cmd, kwargs = self.receive_queue.get(False)
-            self._process_command(cmd, **kwargs)
+        if self.receive_queue.empty():
+            self.queue_depth = 0
+            self.frame_processing_time = 0.0
+            return
+
+        if self.mc.frame_rate:
+            self.mc.frame_rate.notify_activity()
+
+        start = time.perf_counter()
+        deadline = start + self.time_budget
+        get_command = self.receive_queue.get_nowait
+        stats = self.stats if self.stats.enabled else None
+        popped = received = None
+
+        try:
+            while True:
+                item = get_command()
+                cmd, kwargs = item[0], item[1]
+                if self.recorder:
+                    self.recorder.record(cmd, kwargs, item[2] if len(item) > 2 else None)
+                if stats:
+                    popped = time.perf_counter()
+                    # commands which were not received from the socket have no timestamp
+                    received = item[2] if len(item) > 2 else None
+
+                if (cmd in ('player_variable', 'machine_variable') and self.coalesce_variables and
+                        kwargs.get('name') not in self.all_changes_variables):
+                    self._coalesce_variable(cmd, kwargs, received, popped)
+                else:
+                    if self._pending_variables:
+                        # keep the order with all other commands
+                        self._flush_variables()
+                        if stats:
+                            popped = time.perf_counter()
+                    self._dispatch(cmd, kwargs)
+                    if stats:
+                        stats.record(cmd, received, popped, time.perf_counter())
+
+                if self.time_budget and time.perf_counter() >= deadline:
+                    break
+        except queue.Empty:
+            pass
+
+        if self._pending_variables:
+            self._flush_variables()
+
+        self.frame_processing_time = time.perf_counter() - start
+        self.queue_depth = self.receive_queue.qsize()
+        if stats:
+            stats.record_frame(self.frame_processing_time, self.queue_depth)
+
+    def require_all_changes(self, name):
+        """Process every update of a player or machine variable.
+
+        By default consecutive updates of a variable within one frame are
+        collapsed into one update with the last value. Use this for handlers
+        which need to see every change.
+        """
+        self.all_changes_variables.add(name)
+
+    def _coalesce_variable(self, bcp_command, kwargs, received=None, popped=None):
+        """Remember a variable update until the next command or the end of the frame.
+
+        The timestamps of the first update are kept for the statistics.
+        """
+        key = (bcp_command, kwargs.get('name'), kwargs.get('player_num'))
+        try:
+            first, received, popped = self._pending_variables[key]
+        except KeyError:
+            self._pending_variables[key] = (kwargs, received, popped)
+            return
+
+        self.coalesced_updates += 1
+        if self.stats.enabled:
+            self.stats.record_coalesced(bcp_command)
+        merged = dict(kwargs)
+        if 'prev_value' in first:
+            merged['prev_value'] = first['prev_value']
+        if 'change' in first or 'change' in kwargs:
+            merged['change'] = self._combine_changes(first, kwargs)
+        self._pending_variables[key] = (merged, received, popped)
+
+    @staticmethod
+    def _combine_changes(first, last):
+        prev_value = first.get('prev_value')
+        value = last.get('value')
+        if (isinstance(value, (int, float)) and isinstance(prev_value, (int, float)) and
+                not isinstance(value, bool) and not isinstance(prev_value, bool)):
+            return value - prev_value
+
+        return bool(first.get('change', True) or last.get('change', True))
+
+    def _flush_variables(self):
+        pending = self._pending_variables
+        self._pending_variables = OrderedDict()
+        for (bcp_command, _, _), (kwargs, received, popped) in pending.items():
+            if self.stats.enabled:
+                start = time.perf_counter()
+                self._dispatch(bcp_command, kwargs)
+                self.stats.record(bcp_command, received, start if popped is None else popped,
+                                  time.perf_counter(), start)
+            else:
+                self._dispatch(bcp_command, kwargs)
+
+    def _dispatch(self, bcp_command, kwargs):
+        """Process a command from the queue.
+
+        The kwargs dict is owned by the caller and may be modified.
+        """
+        fast_path = self._fast_paths.get(bcp_command)
+        if fast_path and not self.debug_log and fast_path[0].issubset(kwargs):
+            fast_path[1](kwargs)
+        else:
+            self._process_command(bcp_command, **kwargs)
+
+    def _fast_trigger(self, kwargs):
+        self.mc.events.post(kwargs.pop('name'), **kwargs)
+
+    def _fast_switch(self, kwargs):
+        if int(kwargs['state']):
+            self.mc.events.post('switch_' + kwargs['name'] + '_active')
+        else:
+            self.mc.events.post('switch_' + kwargs['name'] + '_inactive')
+
+    def _fast_player_variable(self, kwargs):
+        self.mc.update_player_var(kwargs['name'], kwargs['value'], int(kwargs['player_num']))
 
     def _process_command(self, bcp_command, **kwargs):
         if self.debug_log:
             if 'rawbytes' in kwargs:
-                debug_kwargs = deepcopy(kwargs)
+                # do not copy the payload
+                debug_kwargs = dict(kwargs)
                 debug_kwargs['rawbytes'] = '<{} bytes>'.format(
                     len(debug_kwargs.pop('rawbytes')))
 
@@ -156,13 +500,31 @@ class BcpProcessor:
             # self.send('error',message='invalid command', command=bcp_command)
 
     def _bcp_status_request(self, **kwargs):
-        """Status request."""
+        """Status request.
+
+        If BCP statistics are enabled they are added to the report.
+        """
         del kwargs
 
-        self.send("status_report",
-                  cpu=self.mc_process.cpu_percent(),
-                  rss=self.mc_process.memory_info().rss,
-                  vms=self.mc_process.memory_info().vms)
+        if self.stats.enabled:
+            bcp_stats = self.stats.get_summary()
+            bcp_stats['send_queue'] = self.sending_queue.get_metrics()
+            self.send("status_report",
+                      cpu=self.mc_process.cpu_percent(),
+                      rss=self.mc_process.memory_info().rss,
+                      vms=self.mc_process.memory_info().vms,
+                      bcp_stats=bcp_stats)
+        else:
+            self.send("status_report",
+                      cpu=self.mc_process.cpu_percent(),
+                      rss=self.mc_process.memory_info().rss,
+                      vms=self.mc_process.memory_info().vms)
+
+    def _debug_dump_stats(self, **kwargs):
+        del kwargs
+        if self.stats.enabled:
+            self.stats.log_summary(self.log)
+            self.log.info("Send queue: %s", self.sending_queue.get_metrics())
 
     def _bcp_hello(self, **kwargs):
         """Processes an incoming BCP 'hello' command."""
@@ -0,0 +1,201 @@
+"""Recording and replay of incoming BCP sessions.
+
+A recording contains all BCP commands which the MC received with the time
+they arrived. Binary payloads (e.g. DMD frames) are stored as they are.
+
+The file is gzip compressed. After a magic line every command is stored as
+a header with the time since the first command (float64), the length of the
+encoded command string and the length of the binary payload (both uint32,
+little endian) followed by the command string and the payload.
+"""
+import gzip
+import struct
+import time
+
+from kivy.clock import Clock
+
+import mpf.core.bcp.bcp_socket_client as bcp
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.core.mc import MpfMc
+
+MAGIC = b'MPFMC-BCP-SESSION 1\n'
+
+RECORD_HEADER = struct.Struct('<dII')
+
+
+class BcpSessionWriter:
+
+    """Writes BCP commands to a session file.
+
+    Args:
+        path: The file to write.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open session file."""
+        self.path = path
+        self.commands = 0
+        self._file = gzip.open(path, 'wb', compresslevel=6)
+        self._file.write(MAGIC)
+
+    def write(self, timestamp: float, message: str, rawbytes=None) -> None:
+        """Write one encoded command.
+
+        Args:
+            timestamp: Seconds since the start of the session.
+            message: The encoded BCP command string.
+            rawbytes: Optional binary payload of the command.
+        """
+        message = message.encode('utf-8')
+        self._file.write(RECORD_HEADER.pack(timestamp, len(message), len(rawbytes) if rawbytes else 0))
+        self._file.write(message)
+        if rawbytes:
+            self._file.write(rawbytes)
+        self.commands += 1
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def read_session(path: str):
+    """Yield (timestamp, message, rawbytes) for all commands in a session file.
+
+    rawbytes is None for commands without binary payload. A session which was
+    cut off (e.g. because the MC crashed) ends with the last complete command.
+    """
+    with gzip.open(path, 'rb') as session_file:
+        if session_file.read(len(MAGIC)) != MAGIC:
+            raise ValueError("{} is not a BCP session recording.".format(path))
+
+        try:
+            while True:
+                header = session_file.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    return
+
+                timestamp, message_length, rawbytes_length = RECORD_HEADER.unpack(header)
+                message = session_file.read(message_length)
+                rawbytes = session_file.read(rawbytes_length) if rawbytes_length else None
+                if len(message) < message_length or (rawbytes_length and len(rawbytes) < rawbytes_length):
+                    return
+
+                yield timestamp, message.decode('utf-8'), rawbytes
+        except EOFError:
+            return
+
+
+class BcpSessionRecorder:
+
+    """Records all commands which the BcpProcessor takes from its queue.
+
+    Args:
+        path: The file to write.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        """Start recording."""
+        self.writer = BcpSessionWriter(path)
+        self._start = None
+
+    def record(self, bcp_command: str, kwargs: dict, received=None) -> None:
+        """Record a command.
+
+        Args:
+            bcp_command: Name of the command.
+            kwargs: The decoded parameters of the command.
+            received: Optional time.perf_counter() when the command was read
+                from the socket. The current time is used otherwise.
+        """
+        if received is None:
+            received = time.perf_counter()
+        if self._start is None:
+            self._start = received
+
+        rawbytes = kwargs.get('rawbytes')
+        if rawbytes is not None:
+            kwargs = dict(kwargs)
+            del kwargs['rawbytes']
+
+        self.writer.write(max(received - self._start, 0.0), bcp.encode_command_string(bcp_command, **kwargs),
+                          rawbytes)
+
+    def stop(self) -> None:
+        """Stop recording and close the file."""
+        self.writer.close()
+
+
+class BcpSessionPlayer:
+
+    """Replays a recorded session into an MC.
+
+    Commands are passed to BcpProcessor.receive_bcp_message when they are
+    due. The player uses Clock.time() so it also works with the simulated
+    time of MpfMcTestCase.
+
+    Args:
+        mc: The MpfMc instance.
+        path: The session file.
+        speed: 1.0 replays at recorded speed, 2.0 twice as fast. 0 passes all
+            commands at once so they are processed as fast as possible.
+
+    """
+
+    def __init__(self, mc: "MpfMc", path: str, speed: float = 1.0) -> None:
+        """Initialise player."""
+        self.mc = mc
+        self.path = path
+        self.speed = speed
+        self.done = False
+        self.commands = 0
+        """Number of commands which have been passed to the MC."""
+        self.duration = 0.0
+        """Recorded duration of the session."""
+
+        self._session = None
+        self._next = None
+        self._start_time = None
+        self._event = None
+
+    def start(self) -> None:
+        """Start the replay with the next frame."""
+        self._session = read_session(self.path)
+        self._next = next(self._session, None)
+        self._start_time = Clock.time()
+        self.done = self._next is None
+        if not self.done:
+            self._event = Clock.schedule_interval(self._tick, 0)
+
+    def stop(self) -> None:
+        """Stop the replay."""
+        if self._event:
+            self._event.cancel()
+            self._event = None
+        if self._session:
+            self._session.close()
+            self._session = None
+        self.done = True
+
+    def _tick(self, dt) -> None:
+        del dt
+        if self.speed:
+            position = (Clock.time() - self._start_time) * self.speed
+        else:
+            position = float('inf')
+
+        receive = self.mc.bcp_processor.receive_bcp_message
+        while self._next is not None and self._next[0] <= position:
+            timestamp, message, rawbytes = self._next
+            receive(message, rawbytes)
+            self.commands += 1
+            self.duration = timestamp
+            self._next = next(self._session, None)
+
+        if self._next is None:
+            self.stop()
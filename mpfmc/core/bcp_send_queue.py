@@ -0,0 +1,144 @@
+"""Outgoing BCP queue with priority classes for streamed payloads."""
+import queue
+import threading
+from collections import deque, OrderedDict
+
+
+class BcpSendQueue:
+
+    """Queue of outgoing BCP messages.
+
+    There are two priority classes. Control messages are encoded by the
+    sender, kept in order and never dropped. Streamed messages (e.g. DMD
+    frames) have a stream key. If a message of the same stream is still
+    pending it is replaced in place so only the newest frame is sent when
+    the client does not keep up. Streamed messages are encoded when they are
+    taken from the queue. Control messages are returned first.
+
+    Items which are returned are tuples of the encoded message and the
+    optional binary payload. The queue can be used like a queue.Queue by the
+    sending thread.
+
+    Args:
+        encode: Callable(bcp_command, kwargs, rawbytes) which returns the
+            (message, rawbytes) tuple of a streamed message.
+
+    """
+
+    def __init__(self, encode) -> None:
+        """Initialise queue."""
+        self.encode = encode
+        self.replaced = 0
+        """Number of streamed messages which were replaced by a newer one."""
+        self.dropped = 0
+        """Number of streamed messages which were discarded without sending."""
+        self.stream_metrics = dict()
+        """Stream key -> [sent, replaced]."""
+
+        self._control = deque()
+        self._streams = OrderedDict()
+        self._condition = threading.Condition()
+
+    def put(self, item, block=True, timeout=None) -> None:
+        """Add an encoded control message (message, rawbytes)."""
+        del block, timeout
+        with self._condition:
+            self._control.append(item)
+            self._condition.notify()
+
+    # pylint: disable-msg=too-many-arguments
+    def put_stream(self, stream_key, bcp_command, kwargs, rawbytes=None, merge=None) -> None:
+        """Add a streamed message and replace a pending one of the same stream.
+
+        Args:
+            stream_key: Name of the stream, e.g. "dmd_frame:dmd".
+            bcp_command: The BCP command.
+            kwargs: Parameters of the command.
+            rawbytes: Optional binary payload.
+            merge: Optional name of a dict parameter. When a pending message
+                is replaced this parameter is merged with the one of the
+                pending message so no changes are lost.
+        """
+        with self._condition:
+            metrics = self.stream_metrics.get(stream_key)
+            if metrics is None:
+                metrics = self.stream_metrics[stream_key] = [0, 0]
+
+            pending = self._streams.get(stream_key)
+            if pending is not None:
+                self.replaced += 1
+                metrics[1] += 1
+                if merge and merge in pending[1] and merge in kwargs:
+                    merged = dict(pending[1][merge])
+                    merged.update(kwargs[merge])
+                    kwargs = dict(kwargs)
+                    kwargs[merge] = merged
+
+            # an existing key keeps its position in the queue
+            self._streams[stream_key] = (bcp_command, kwargs, rawbytes)
+            self._condition.notify()
+
+    def _pop(self):
+        if self._control:
+            return self._control.popleft()
+
+        stream_key, (bcp_command, kwargs, rawbytes) = self._streams.popitem(last=False)
+        self.stream_metrics[stream_key][0] += 1
+        return self.encode(bcp_command, kwargs, rawbytes)
+
+    def get(self, block=True, timeout=None):
+        """Remove and return the next message.
+
+        Raises queue.Empty if no message is available in time.
+        """
+        with self._condition:
+            if block and not self._control and not self._streams:
+                self._condition.wait(timeout)
+
+            if not self._control and not self._streams:
+                raise queue.Empty
+
+            return self._pop()
+
+    def get_nowait(self):
+        """Return the next message without waiting."""
+        return self.get(False)
+
+    def drain(self, streams=True) -> list:
+        """Remove and return all pending messages.
+
+        Args:
+            streams: If False only control messages are returned and streamed
+                messages stay in the queue (e.g. while the client is slow).
+        """
+        with self._condition:
+            messages = list(self._control)
+            self._control.clear()
+            while streams and self._streams:
+                messages.append(self._pop())
+
+        return messages
+
+    def clear_streams(self) -> None:
+        """Discard all pending streamed messages."""
+        with self._condition:
+            self.dropped += len(self._streams)
+            self._streams.clear()
+
+    def qsize(self) -> int:
+        """Return the number of pending messages."""
+        return len(self._control) + len(self._streams)
+
+    def empty(self) -> bool:
+        """Return true if no message is pending."""
+        return not self._control and not self._streams
+
+    def get_metrics(self) -> dict:
+        """Return sent, replaced and dropped counts."""
+        return {
+            'pending': self.qsize(),
+            'replaced': self.replaced,
+            'dropped': self.dropped,
+            'streams': {key: {'sent': sent, 'replaced': replaced}
+                        for key, (sent, replaced) in sorted(self.stream_metrics.items())},
+        }
@@ -8,10 +8,66 @@ import threading
 import time
 import traceback
 
+import os
 import select
+import stat
 
-import mpf.core.bcp.bcp_socket_client as bcp
 from mpf.exceptions.runtime_error import MpfRuntimeError
+from mpfmc.core.bcp_decoder import BcpDecoder
+
+
+def create_unix_socket(path, log):
+    """Create and bind a unix domain socket.
+
+    A stale socket file from a previous run is removed first.
+
+    Args:
+        path: File system path of the socket.
+        log: The logger of the server.
+
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise MpfRuntimeError("Unix domain sockets are not supported on this platform. "
+                              "Remove mpf-mc: bcp_socket_path.", 1, log.name)
+
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.remove(path)
+    except FileNotFoundError:
+        pass
+
+    unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    log.info('Starting up on unix socket %s', path)
+
+    try:
+        unix_socket.bind(path)
+    except IOError as e:
+        raise MpfRuntimeError("Failed to bind BCP Socket to {}. "
+                              "Is there another application using it?".format(path), 1, log.name) from e
+
+    return unix_socket
+
+
+def remove_unix_socket(path):
+    """Remove the file of a unix domain socket after the server stopped."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def get_host_and_port(address):
+    """Return host and port of a socket address.
+
+    Unix domain sockets have a path (or an empty string for unnamed client
+    sockets) instead of a tuple. The path is returned as host and port is 0.
+    """
+    if isinstance(address, tuple):
+        return address[0], address[1]
+
+    if isinstance(address, bytes):
+        address = address.decode(errors='replace')
+    return address, 0
 
 
 class BCPServer(threading.Thread):
@@ -21,7 +77,7 @@ class BCPServer(threading.Thread):
         mc: A reference to the main MediaController instance.
         receiving_queue: A shared Queue() object which holds incoming BCP
             commands.
-        sending_queue: A shared Queue() object which holds outgoing BCP
+        sending_queue: A shared BcpSendQueue object which holds outgoing BCP
             commands.
 
     """
@@ -35,10 +91,15 @@ class BCPServer(threading.Thread):
         self.sending_queue = sending_queue
         self.connection = None
         self.socket = None
+        self.socket_path = None
         self.done = False
+        self.decoder = BcpDecoder()
 
-        self.setup_server_socket(mc.machine_config['mpf-mc']['bcp_interface'],
-                                 mc.machine_config['mpf-mc']['bcp_port'])
+        if mc.machine_config['mpf-mc']['bcp_socket_path']:
+            self.setup_unix_socket(mc.machine_config['mpf-mc']['bcp_socket_path'])
+        else:
+            self.setup_server_socket(mc.machine_config['mpf-mc']['bcp_interface'],
+                                     mc.machine_config['mpf-mc']['bcp_port'])
         self.sending_thread = threading.Thread(target=self.sending_loop)
         self.sending_thread.daemon = True
         self.sending_thread.start()
@@ -67,6 +128,20 @@ class BCPServer(threading.Thread):
         self.socket.listen(5)
         self.socket.settimeout(1)
 
+    def setup_unix_socket(self, path):
+        """Sets up a unix domain socket listener.
+
+        This avoids the TCP stack if MPF runs on the same host.
+
+        Args:
+            path: File system path of the socket.
+
+        """
+        self.socket = create_unix_socket(path, self.log)
+        self.socket_path = path
+        self.socket.listen(5)
+        self.socket.settimeout(1)
+
     def run(self):
         """The socket thread's run loop."""
         try:
@@ -75,10 +150,11 @@ class BCPServer(threading.Thread):
                 # Since posting an event from a thread is not safe, we just
                 # drop the event we want into the receive queue and let the
                 # main loop pick it up
+                host, port = get_host_and_port(self.socket.getsockname())
                 self.receive_queue.put(('trigger',
                                         {'name': 'client_disconnected',
-                                         'host': self.socket.getsockname()[0],
-                                         'port': self.socket.getsockname()[1]}))
+                                         'host': host,
+                                         'port': port}))
                 '''event: client_disconnected
                 desc: Posted on the MPF-MC only (e.g. not in MPF) when the BCP
                 client disconnects. This event is also posted when the MPF-MC
@@ -109,16 +185,16 @@ class BCPServer(threading.Thread):
                             self.log.info("Stopping BCP listener thread")
                             return
 
-                self.log.info("Received connection from: %s:%s",
-                              client_address[0], client_address[1])
+                host, port = get_host_and_port(client_address)
+                self.log.info("Received connection from: %s:%s", host, port)
 
                 # Since posting an event from a thread is not safe, we just
                 # drop the event we want into the receive queue and let the
                 # main loop pick it up
                 self.receive_queue.put(('trigger',
                                         {'name': 'client_connected',
-                                         'host': client_address[0],
-                                         'port': client_address[1]}))
+                                         'host': host,
+                                         'port': port}))
 
                 '''event: client_connected
                 desc: Posted on the MPF-MC only when a BCP client has
@@ -144,6 +220,7 @@ class BCPServer(threading.Thread):
                     if ready[0]:
                         try:
                             data_read = self.connection.recv(8192)
+                            received = time.perf_counter()
                         except socket.timeout:
                             pass
 
@@ -155,7 +232,7 @@ class BCPServer(threading.Thread):
                             socket_chars = commands.pop()
 
                             # process all complete commands
-                            self._process_receives_messages(commands)
+                            self._process_receives_messages(commands, received)
                         else:
                             # no bytes -> socket closed
                             break
@@ -175,27 +252,58 @@ class BCPServer(threading.Thread):
             msg = ''.join(line for line in lines)
             self.mc.crash_queue.put(msg)
 
-    def _process_receives_messages(self, commands):
+    def _process_receives_messages(self, commands, received=None):
         # process all complete commands
         for cmd in commands:
             if cmd:
+                self.log.debug('Received "%s"', cmd)
                 try:
-                    decoded_cmd = cmd.strip().decode()
+                    bcp_command, kwargs = self.decoder.decode(cmd)
                 except UnicodeDecodeError:
                     self.log.warning("Failed to decode BCP message: %s", cmd.strip())
                     continue
+                except ValueError:
+                    self.log.error("DECODE BCP ERROR. Message: %s", cmd)
+                    raise
 
-                self.process_received_message(decoded_cmd)
+                if received is None:
+                    self.receive_queue.put((bcp_command, kwargs))
+                else:
+                    self.receive_queue.put((bcp_command, kwargs, received))
 
     def stop(self):
         """ Stops and shuts down the BCP server."""
         if not self.done:
             self.log.info("Socket thread stopping.")
-            self.sending_queue.put('goodbye', None)
+            self.sending_queue.put(('goodbye', None))
             time.sleep(1)  # give it a chance to send goodbye before quitting
             self.done = True
             self.mc.done = True
 
+    def send(self, msg, rawbytes=None):
+        """Put an encoded BCP message into the sending queue.
+
+        Args:
+            msg: The encoded BCP command string. If rawbytes are passed this
+                is the complete encoded header line (including "&bytes=").
+            rawbytes: Optional binary payload which is sent after the header.
+
+        """
+        self.sending_queue.put((msg, rawbytes))
+
+    # pylint: disable-msg=too-many-arguments
+    def send_stream(self, stream_key, bcp_command, kwargs, rawbytes=None, merge=None):
+        """Put a streamed message into the sending queue.
+
+        A pending message of the same stream is replaced. The message is
+        encoded by the queue when it is sent.
+        """
+        self.sending_queue.put_stream(stream_key, bcp_command, kwargs, rawbytes, merge)
+
+    def get_send_queue_depth(self):
+        """Return the number of messages which wait to be sent."""
+        return self.sending_queue.qsize()
+
     def sending_loop(self):
         """Sending loop which transmits data from the sending queue to the
         remote socket.
@@ -214,6 +322,8 @@ class BCPServer(threading.Thread):
                         self.socket.shutdown(socket.SHUT_RDWR)
                         self.socket.close()
                         self.socket = None
+                        if self.socket_path:
+                            remove_unix_socket(self.socket_path)
                         return
 
                     else:
@@ -223,9 +333,7 @@ class BCPServer(threading.Thread):
                     self.connection.sendall(('{}\n'.format(msg)).encode('utf-8'))
 
                 else:
-                    self.connection.sendall('{}&bytes={}\n'.format(
-                        msg, len(rawbytes)).encode('utf-8'))
-                    self.connection.sendall(rawbytes)
+                    self._send_buffers([msg, rawbytes])
 
         except Exception:   # noqa
             exc_type, exc_value, exc_traceback = sys.exc_info()
@@ -236,18 +344,22 @@ class BCPServer(threading.Thread):
 
             # todo this does not crash mpf-mc
 
-    def process_received_message(self, message):
-        """Puts a received BCP message into the receiving queue.
-
-        Args:
-            message: The incoming BCP message
+    def _send_buffers(self, buffers):
+        """Send several buffers with one scatter/gather call per chunk.
 
+        The buffers are not copied or concatenated. Platforms without
+        socket.sendmsg (e.g. Windows) fall back to one sendall per buffer.
         """
-        self.log.debug('Received "%s"', message)
-
-        try:
-            cmd, kwargs = bcp.decode_command_string(message)
-            self.receive_queue.put((cmd, kwargs))
-        except ValueError:
-            self.log.error("DECODE BCP ERROR. Message: %s", message)
-            raise
+        if not hasattr(self.connection, 'sendmsg'):
+            for buffer in buffers:
+                self.connection.sendall(buffer)
+            return
+
+        buffers = [memoryview(buffer) for buffer in buffers]
+        while buffers:
+            sent = self.connection.sendmsg(buffers)
+            while buffers and sent >= buffers[0].nbytes:
+                sent -= buffers[0].nbytes
+                buffers.pop(0)
+            if sent:
+                buffers[0] = buffers[0][sent:]
@@ -0,0 +1,155 @@
+"""Shared memory ring buffer for binary BCP payloads.
+
+If MPF (or another client) runs on the same host it can read binary payloads
+like DMD frames from a memory mapped file instead of receiving them through
+the socket. The MC writes the payload into the ring and only sends a short
+command with the position and length of the payload::
+
+    dmd_frame?name=dmd&shm_pos=int:4096&shm_length=int:4096
+
+The file starts with a header of 64 bytes:
+
+    0   magic (8 bytes) b'MPFMCSHM'
+    8   version (uint32)
+    12  capacity of the ring in bytes (uint32)
+    16  write position (uint64). Written by the MC.
+    24  read position (uint64). Written by the client.
+
+All values are little endian. The ring data starts at offset 64. Positions
+increase forever and are mapped into the ring modulo the capacity. A payload
+is never split. If it does not fit before the end of the ring it starts at
+the beginning of the ring. The client has to advance the read position
+after it processed a payload so the MC can reuse the space. If the ring is
+full the MC sends the payload through the socket.
+"""
+import mmap
+import os
+import struct
+from typing import Optional
+
+MAGIC = b'MPFMCSHM'
+VERSION = 1
+HEADER = struct.Struct('<8sII')
+POSITION = struct.Struct('<Q')
+WRITE_POSITION_OFFSET = 16
+READ_POSITION_OFFSET = 24
+DATA_OFFSET = 64
+
+
+class SharedMemoryRing:
+
+    """Ring buffer in a memory mapped file which is written by the MC.
+
+    Args:
+        path: The file to create. On Linux this should be in /dev/shm.
+        capacity: Size of the ring in bytes.
+
+    """
+
+    def __init__(self, path: str, capacity: int) -> None:
+        """Create the file and map it."""
+        if capacity <= 0:
+            raise ValueError("Shared memory size has to be positive. Yours is {}".format(capacity))
+
+        self.path = path
+        self.capacity = capacity
+        self.write_position = 0
+        self.overflows = 0
+        """Number of payloads which did not fit into the ring."""
+
+        with open(path, 'w+b') as ring_file:
+            ring_file.truncate(DATA_OFFSET + capacity)
+            self._map = mmap.mmap(ring_file.fileno(), DATA_OFFSET + capacity)
+
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION, capacity)
+        POSITION.pack_into(self._map, WRITE_POSITION_OFFSET, 0)
+        POSITION.pack_into(self._map, READ_POSITION_OFFSET, 0)
+        self._view = memoryview(self._map)
+
+    @property
+    def read_position(self) -> int:
+        """Return the position up to which the client read the ring."""
+        return POSITION.unpack_from(self._map, READ_POSITION_OFFSET)[0]
+
+    def reset(self) -> None:
+        """Discard all payloads (e.g. when a client attaches)."""
+        self.write_position = 0
+        POSITION.pack_into(self._map, WRITE_POSITION_OFFSET, 0)
+        POSITION.pack_into(self._map, READ_POSITION_OFFSET, 0)
+
+    def write(self, data) -> Optional[int]:
+        """Write a payload and return its position.
+
+        Returns None if the ring does not have enough free space.
+        """
+        length = len(data)
+        position = self.write_position
+        offset = position % self.capacity
+        if offset + length > self.capacity:
+            # do not split the payload. skip the rest of the ring
+            position += self.capacity - offset
+            offset = 0
+
+        if position + length - self.read_position > self.capacity:
+            self.overflows += 1
+            return None
+
+        self._view[DATA_OFFSET + offset:DATA_OFFSET + offset + length] = data
+        self.write_position = position + length
+        POSITION.pack_into(self._map, WRITE_POSITION_OFFSET, self.write_position)
+        return position
+
+    def close(self) -> None:
+        """Unmap and remove the file."""
+        if self._map is None:
+            return
+
+        self._view.release()
+        self._map.close()
+        self._map = None
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class SharedMemoryRingReader:
+
+    """Reads payloads from a SharedMemoryRing in another process.
+
+    This is what a client has to implement to receive payloads through
+    shared memory.
+
+    Args:
+        path: The file of the ring.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        """Map the file."""
+        with open(path, 'r+b') as ring_file:
+            self._map = mmap.mmap(ring_file.fileno(), 0)
+
+        magic, version, self.capacity = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError("{} is not a shared memory ring of version {}".format(path, VERSION))
+
+        self._view = memoryview(self._map)
+
+    def read(self, position: int, length: int) -> memoryview:
+        """Return a view of a payload without copying it.
+
+        The view stays valid until release() is called for the payload.
+        """
+        offset = DATA_OFFSET + position % self.capacity
+        return self._view[offset:offset + length]
+
+    def release(self, position: int, length: int) -> None:
+        """Allow the MC to overwrite a payload and all payloads before it."""
+        POSITION.pack_into(self._map, READ_POSITION_OFFSET, position + length)
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._view.release()
+        self._map.close()
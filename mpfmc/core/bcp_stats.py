@@ -0,0 +1,169 @@
+"""Latency and throughput statistics for incoming BCP commands."""
+from bisect import bisect_left
+
+# upper bounds of the histogram buckets in seconds. the last bucket has no limit
+HISTOGRAM_BUCKETS = (.0001, .0005, .001, .002, .005, .01, .02, .05, .1, .2, .5)
+
+
+class TimingHistogram:
+
+    """Counts durations in fixed buckets and tracks total and maximum."""
+
+    __slots__ = ["buckets", "count", "total", "max"]
+
+    def __init__(self):
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float) -> None:
+        """Add a duration in seconds."""
+        self.buckets[bisect_left(HISTOGRAM_BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def get_summary(self) -> dict:
+        """Return count, average and maximum in ms and the histogram."""
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total / self.count * 1000, 3) if self.count else 0,
+            'max_ms': round(self.max * 1000, 3),
+            'histogram': {label: count for label, count in zip(bucket_labels(), self.buckets) if count}
+        }
+
+
+def bucket_labels() -> list:
+    """Return the labels of the histogram buckets."""
+    labels = ['<{}ms'.format(limit * 1000) for limit in HISTOGRAM_BUCKETS]
+    labels.append('>={}ms'.format(HISTOGRAM_BUCKETS[-1] * 1000))
+    return labels
+
+
+class CommandStats:
+
+    """Statistics for one BCP command."""
+
+    __slots__ = ["count", "coalesced", "queue_wait", "processing", "latency"]
+
+    def __init__(self):
+        self.count = 0
+        self.coalesced = 0
+        self.queue_wait = TimingHistogram()
+        """Time between socket receive and queue pop."""
+        self.processing = TimingHistogram()
+        """Time spent in the command handler."""
+        self.latency = TimingHistogram()
+        """Time between socket receive and handler completion."""
+
+    def get_summary(self) -> dict:
+        """Return all statistics of this command."""
+        return {
+            'count': self.count,
+            'coalesced': self.coalesced,
+            'queue_wait': self.queue_wait.get_summary(),
+            'processing': self.processing.get_summary(),
+            'latency': self.latency.get_summary(),
+        }
+
+
+class BcpStats:
+
+    """Collects timings of incoming BCP commands.
+
+    Commands are timestamped when they are received on the socket, when they
+    are taken from the receive queue and when their handler completed.
+
+    Args:
+        enabled: Statistics are only collected if this is True.
+
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialise statistics."""
+        self.enabled = enabled
+        self.commands = dict()
+        self.max_receive_queue_depth = 0
+        self.max_send_queue_depth = 0
+        self.max_frame_processing_time = 0.0
+        self.sent_messages = 0
+
+    def _get_command_stats(self, bcp_command: str) -> CommandStats:
+        try:
+            return self.commands[bcp_command]
+        except KeyError:
+            stats = CommandStats()
+            self.commands[bcp_command] = stats
+            return stats
+
+    # pylint: disable-msg=too-many-arguments
+    def record(self, bcp_command: str, received, popped: float, completed: float, started=None) -> None:
+        """Record the timestamps of a processed command.
+
+        Args:
+            bcp_command: Name of the command.
+            received: time.perf_counter() when the command was read from the
+                socket or None if unknown.
+            popped: time.perf_counter() when the command was taken from the
+                receive queue or when processing started.
+            completed: time.perf_counter() when the handler completed.
+            started: time.perf_counter() when the handler started if the
+                command waited after it was popped (coalesced variables).
+                Defaults to popped.
+        """
+        stats = self._get_command_stats(bcp_command)
+
+        if received is not None:
+            stats.queue_wait.add(popped - received)
+            stats.latency.add(completed - received)
+
+        stats.count += 1
+        stats.processing.add(completed - (popped if started is None else started))
+
+    def record_coalesced(self, bcp_command: str) -> None:
+        """Record an update which was replaced by a later one of the same variable."""
+        self._get_command_stats(bcp_command).coalesced += 1
+
+    def record_frame(self, processing_time: float, receive_queue_depth: int) -> None:
+        """Record the processing time and remaining queue depth of a frame."""
+        if processing_time > self.max_frame_processing_time:
+            self.max_frame_processing_time = processing_time
+        if receive_queue_depth > self.max_receive_queue_depth:
+            self.max_receive_queue_depth = receive_queue_depth
+
+    def record_send(self, send_queue_depth: int) -> None:
+        """Record an outgoing message and the depth of the sending queue."""
+        self.sent_messages += 1
+        if send_queue_depth > self.max_send_queue_depth:
+            self.max_send_queue_depth = send_queue_depth
+
+    def get_summary(self) -> dict:
+        """Return all statistics as dict."""
+        return {
+            'max_receive_queue_depth': self.max_receive_queue_depth,
+            'max_send_queue_depth': self.max_send_queue_depth,
+            'max_frame_processing_ms': round(self.max_frame_processing_time * 1000, 3),
+            'sent_messages': self.sent_messages,
+            'commands': {name: stats.get_summary() for name, stats in sorted(self.commands.items())},
+        }
+
+    def log_summary(self, log) -> None:
+        """Log a table of all commands."""
+        log.info("--- BCP STATS ---")
+        log.info("Max receive queue depth: %s. Max send queue depth: %s. Sent messages: %s. "
+                 "Max processing time per frame: %.3fms", self.max_receive_queue_depth,
+                 self.max_send_queue_depth, self.sent_messages, self.max_frame_processing_time * 1000)
+        for name, stats in sorted(self.commands.items()):
+            log.info("%s: count=%s coalesced=%s wait avg/max=%.3f/%.3fms "
+                     "processing avg/max=%.3f/%.3fms latency avg/max=%.3f/%.3fms",
+                     name, stats.count, stats.coalesced,
+                     *self._avg_max(stats.queue_wait), *self._avg_max(stats.processing),
+                     *self._avg_max(stats.latency))
+        log.info("--- BCP STATS END ---")
+
+    @staticmethod
+    def _avg_max(histogram: TimingHistogram):
+        avg = histogram.total / histogram.count if histogram.count else 0
+        return avg * 1000, histogram.max * 1000
@@ -0,0 +1,176 @@
+"""Shared off-screen rendering of displays."""
+from kivy.clock import Clock
+from kivy.graphics.fbo import Fbo
+from kivy.graphics.instructions import Callback
+from kivy.graphics.texture import Texture
+from kivy.uix.relativelayout import RelativeLayout
+
+from mpfmc.core.readback import FrameReadback
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.core.mc import MpfMc
+    from mpfmc.uix.display import Display
+
+
+class DisplayCapture:
+
+    """Renders a source display into an off-screen texture once per frame.
+
+    All DMDs and display light players which use the same source display
+    share one capture. The first consumer which calls update() in a frame
+    renders the display. All others reuse the texture.
+
+    If the display has a render cache (render_on_change) the capture uses
+    its texture and the display is only rendered when it changed.
+
+    Args:
+        mc: The MpfMc instance.
+        source: The display to capture.
+
+    """
+
+    def __init__(self, mc: "MpfMc", source: "Display") -> None:
+        """Initialise capture."""
+        self.mc = mc
+        self.source = source
+        self.dirty = True
+        self.frame_number = 0
+        """Increases every time the texture has been rendered."""
+        self.frames = []
+        """Pixel frames (RGBA) which became ready in the last update."""
+        self.pixel_frame_number = 0
+        """Increases every time frames has been updated."""
+
+        self._consumers = []
+        self._pixel_readback = None
+        self._rendered_frame = None
+
+        if source.render_cache:
+            self.fbo = source.render_cache
+            self.container_widget = None
+        else:
+            texture = Texture.create(size=source.native_size, colorfmt='rgba')
+            self.fbo = Fbo(size=source.native_size, texture=texture)
+
+            self.container_widget = RelativeLayout()
+            self.container_widget.size = source.native_size
+            self.fbo.add(self.container_widget.canvas)
+
+        with source.canvas:
+            self.callback = Callback(self._trigger_rendering)
+
+    @property
+    def texture(self) -> Texture:
+        """Return the texture which contains the rendered display."""
+        return self.fbo.texture
+
+    def add_consumer(self, callback) -> None:
+        """Register a callback which is called when the display changed."""
+        self._consumers.append(callback)
+
+    def remove_consumer(self, callback) -> None:
+        """Remove a consumer callback."""
+        try:
+            self._consumers.remove(callback)
+        except ValueError:
+            pass
+
+    def enable_pixels(self, latency: int = 0) -> None:
+        """Read back RGBA pixels every time the display is rendered.
+
+        The pixels are stored in frames after update(). Only the first call
+        sets the latency.
+        """
+        if not self._pixel_readback:
+            self._pixel_readback = FrameReadback(self.texture, self.source.native_size,
+                                                 'rgba', latency)
+
+    def _trigger_rendering(self, *args) -> None:
+        del args
+        self.dirty = True
+        for callback in self._consumers:
+            callback()
+
+    def poll(self) -> None:
+        """Notify the consumers if the render cache of the display changed.
+
+        The callback in the display canvas only runs while the render cache
+        is drawn. Without a DisplayOutput that only happens in update(), so
+        consumers have to poll for changes of the cache.
+        """
+        source = self.source
+        if not self.dirty and source.render_cache and source.render_cache.needs_redraw:
+            self._trigger_rendering()
+
+    def update(self) -> bool:
+        """Render the display if it changed since the last update.
+
+        The display is rendered at most once per frame. Returns True if the
+        texture has been rendered.
+        """
+        self.poll()
+        if self.dirty and self._rendered_frame != Clock.frames:
+            self._rendered_frame = Clock.frames
+            self._render()
+            return True
+
+        if not self.dirty and self._pixel_readback and self._pixel_readback.pending:
+            # nothing changed. pass on frames which are still in flight
+            self._set_frames(self._pixel_readback.flush())
+
+        return False
+
+    def _render(self) -> None:
+        self.dirty = False
+        source = self.source
+
+        if source.render_cache:
+            # the display renders itself on changes. it might have done so
+            # already in this frame
+            source.update_render_cache()
+            self._rendered()
+            return
+        fbo = self.fbo
+
+        # detach the widget from the parent
+        parent = source.parent
+        if parent and hasattr(parent, "remove_display_source"):
+            parent.remove_display_source(source)
+
+        # clear the fbo background
+        fbo.bind()
+        fbo.clear_buffer()
+        fbo.release()
+
+        self.container_widget.add_widget(source.container)
+
+        fbo.draw()
+
+        self.container_widget.remove_widget(source.container)
+
+        # reattach to the parent
+        if parent and hasattr(parent, "add_display_source"):
+            parent.add_display_source(source)
+
+        self._rendered()
+
+    def _rendered(self) -> None:
+        self.frame_number += 1
+
+        if self._pixel_readback:
+            self._set_frames(self._pixel_readback.push())
+
+    def _set_frames(self, frames: list) -> None:
+        self.frames = frames
+        self.pixel_frame_number += 1
+
+
+def get_display_capture(mc: "MpfMc", source: "Display") -> DisplayCapture:
+    """Return the shared capture for a display."""
+    try:
+        return mc.display_captures[source.name]
+    except KeyError:
+        capture = DisplayCapture(mc, source)
+        mc.display_captures[source.name] = capture
+        return capture
@@ -1,17 +1,22 @@
 """DMD (hardware device)."""
-import struct
-
+from kivy.graphics import Rectangle
 from kivy.graphics.instructions import Callback
 from kivy.uix.effectwidget import EffectWidget
+from kivy.uix.widget import Widget
 
 from kivy.clock import Clock
 from kivy.graphics.fbo import Fbo
-from kivy.graphics.opengl import glReadPixels, GL_RGB, GL_UNSIGNED_BYTE
 from kivy.graphics.texture import Texture
 
 from mpfmc.effects.gain import GainEffect
 from mpfmc.effects.flip_vertical import FlipVerticalEffect
 from mpfmc.effects.gamma import GammaEffect
+from mpfmc.effects.channel_order import ChannelOrderEffect
+from mpfmc.core.display_capture import get_display_capture
+from mpfmc.core.dmd_delta import DmdFrameEncoder
+from mpfmc.core.readback import FrameReadback, disable_blending, enable_blending
+from mpfmc.core.dmd_conversion import (convert_to_luminance, reorder_channels,
+                                       DEFAULT_LUMINOSITY)
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -22,6 +27,7 @@ class DmdBase:
     """Base class for DMD devices."""
 
     dmd_name_string = 'DMD'
+    bcp_command = None
 
     def __init__(self, mc: "MpfMc", name: str, config: dict) -> None:
         """Initialise DMD."""
@@ -34,8 +40,11 @@ class DmdBase:
         self.config = self._get_validated_config(config)
 
         self.source = self.mc.displays[self.config['source_display']]
+        self.capture = get_display_capture(self.mc, self.source)
         self.prev_data = None
         self._dirty = True
+        self.gpu_conversion = bool(self._get_rendering_setting('gpu_conversion'))
+        self.encoder = self._create_encoder()
 
         # put the widget canvas on a Fbo
         texture = Texture.create(size=self.source.size, colorfmt='rgb')
@@ -56,23 +65,85 @@ class DmdBase:
         if self.config['gamma'] != 1.0:
             effect_list.append(GammaEffect(gamma=self.config['gamma']))
 
+        effect_list.extend(self._get_conversion_effects())
+
         self.effect_widget.effects = effect_list
         self.effect_widget.size = self.source.size
 
+        # draw the shared capture of the source display. its color channels
+        # are the same as rendering the display on black
+        capture_widget = Widget(size=self.source.size)
+        with capture_widget.canvas:
+            Callback(disable_blending)
+            Rectangle(size=self.source.size, texture=self.capture.texture)
+            Callback(enable_blending)
+        self.effect_widget.add_widget(capture_widget)
+
         self.fbo.add(self.effect_widget.canvas)
 
-        with self.source.canvas:
-            self.callback = Callback(self._trigger_rendering)
+        self._setup_conversion()
+
+        self.capture.add_consumer(self._trigger_rendering)
+
+        if self.encoder:
+            # (re)connected clients need a keyframe to decode the deltas
+            self.mc.events.add_handler('client_connected', self._send_keyframe)
+            self.mc.events.add_handler('mc_reset_complete', self._send_keyframe)
 
         self._set_dmd_fps()
 
-    def _trigger_rendering(self, *args):
-        del args
+    def _trigger_rendering(self) -> None:
+        self._dirty = True
+
+    def _send_keyframe(self, **kwargs) -> None:
+        del kwargs
+        self.encoder.force_keyframe()
         self._dirty = True
 
     def _get_validated_config(self, config: dict) -> dict:
         raise NotImplementedError
 
+    def _get_rendering_setting(self, setting: str):
+        """Return a setting from the mpf-mc: dmd_rendering: section.
+
+        Settings in the devices: subsection for this DMD take precedence over
+        the global ones.
+        """
+        settings = self.mc.machine_config['mpf-mc']['dmd_rendering']
+        device_settings = (settings.get('devices') or {}).get(self.name) or {}
+        return device_settings.get(setting, settings.get(setting))
+
+    def _create_encoder(self):
+        frame_encoding = self._get_rendering_setting('frame_encoding')
+        if frame_encoding == 'raw':
+            return None
+        if frame_encoding == 'delta':
+            return DmdFrameEncoder(self._get_rendering_setting('keyframe_interval'),
+                                   self._get_rendering_setting('keyframe_time'))
+
+        raise ValueError("Invalid {} frame_encoding {}. Valid values are raw and "
+                         "delta.".format(self.dmd_name_string, frame_encoding))
+
+    def _get_conversion_effects(self) -> list:
+        """Return additional effects which convert the frame on the GPU."""
+        return []
+
+    def _setup_conversion(self) -> None:
+        """Create the readback stage after the effects are set up."""
+        self.readback = FrameReadback(self.fbo.texture, self.source.native_size,
+                                      'rgb', self._get_readback_latency())
+
+    def _get_readback_latency(self) -> int:
+        latency = self._get_rendering_setting('readback_latency')
+        if not isinstance(latency, int) or latency < 0:
+            raise ValueError("{} readback_latency should be an integer of 0 or "
+                             "more. Yours is {}".format(self.dmd_name_string, latency))
+        return latency
+
+    def _convert(self, data: bytes) -> bytes:
+        """Convert frame data which was read back from the GPU on the CPU."""
+        return data
+
     def _set_dmd_fps(self) -> None:
         # fps is the rate that the connected client requested. We'll use the
         # lower of the two
@@ -106,42 +177,51 @@ class DmdBase:
     def tick(self, *args) -> None:
         """Draw image for DMD and send it."""
         del args
+        self.capture.poll()
+        if self.encoder and self.encoder.keyframe_due(Clock.time()):
+            self._send_keyframe()
         # run this at the end of the tick to make sure all kivy bind callbacks have executed
         if self._dirty:
             Clock.schedule_once(self._render, -1)
+        elif self.readback.pending:
+            # the frame did not change. send frames which are still in flight
+            Clock.schedule_once(self._flush_readback, -1)
 
     def _render(self, dt):
         del dt
         self._dirty = False
-        widget = self.source
         fbo = self.fbo
 
-        # detach the widget from the parent
-        parent = widget.parent
-        if parent and hasattr(parent, "remove_display_source"):
-            parent.remove_display_source(widget)
+        # renders the source display unless another consumer did already
+        self.capture.update()
 
         # clear the fbo background
         fbo.bind()
         fbo.clear_buffer()
         fbo.release()
 
-        self.effect_widget.add_widget(widget.container)
-
         fbo.draw()
 
-        fbo.bind()
-        data = glReadPixels(0, 0, widget.native_size[0], widget.native_size[1],
-                            GL_RGB, GL_UNSIGNED_BYTE)
-        fbo.release()
+        for data in self.readback.push():
+            self._process_frame(data)
 
-        self.effect_widget.remove_widget(widget.container)
+    def _flush_readback(self, dt):
+        del dt
+        if self._dirty:
+            # a new frame will be rendered and pushes the pending ones out
+            return
 
-        # reattach to the parent
-        if parent and hasattr(parent, "add_display_source"):
-            parent.add_display_source(widget)
+        for data in self.readback.flush():
+            self._process_frame(data)
 
-        if not self.config['only_send_changes'] or self.prev_data != data:
+    def _process_frame(self, data: bytes) -> None:
+        data = self._convert(data)
+
+        if self.encoder:
+            frame = self.encoder.encode(data, Clock.time())
+            if frame:
+                self.send_delta(*frame)
+        elif not self.config['only_send_changes'] or self.prev_data != data:
             self.prev_data = data
             self.send(data)
 
@@ -149,64 +229,140 @@ class DmdBase:
         """Send data to DMD via BCP."""
         raise NotImplementedError
 
+    def send_delta(self, keyframe: bool, sequence: int, frame_hash: int, payload: bytes) -> None:
+        """Send a delta encoded frame via BCP.
+
+        The command is the frame command with a "_delta" suffix. Clients
+        decode it with DmdFrameDecoder. Deltas build on each other so they are
+        never replaced in the sending queue.
+        """
+        self.mc.bcp_processor.send(self.bcp_command + '_delta', rawbytes=payload, name=self.name,
+                                   keyframe=keyframe, seq=sequence, hash=frame_hash)
+
 
 class Dmd(DmdBase):
     """Monochrome DMD."""
 
+    bcp_command = 'dmd_frame'
+
     def _get_validated_config(self, config: dict) -> dict:
         return self.mc.config_validator.validate_config('dmds', config)
 
-    @classmethod
-    def _convert_to_single_bytes(cls, data, config: dict) -> bytes:
-        new_data = bytearray()
-        loops = 0
-        config.setdefault('luminosity', (.299, .587, .114))
-        luminosity = config['luminosity']
-
-        for r, g, b in struct.iter_unpack('BBB', data):
-            loops += 1
-            try:
-                pixel_weight = ((r * luminosity[0]) + (g * luminosity[1]) + (b * luminosity[2])) / 255.
-                new_data.append(int(round(pixel_weight * 15)))
-
-            except ValueError:
-                raise ValueError(loops, r, g, b)
+    def __init__(self, mc: "MpfMc", name: str, config: dict) -> None:
+        """Initialise mono DMD."""
+        self.gpu_packing = False
+        super().__init__(mc, name, config)
+
+    def _setup_conversion(self) -> None:
+        """Add a render stage which packs four luminance bytes per texel.
+
+        The frame is converted to brightness values on the GPU and only one
+        byte per pixel is transferred by glReadPixels.
+        """
+        width, height = self.source.native_size
+        if self.gpu_conversion and not width % 4:
+            self.config.setdefault('luminosity', DEFAULT_LUMINOSITY)
+            uniforms = {
+                'luminosity': tuple(float(x) for x in self.config['luminosity']),
+                'levels': 15.0,
+                'source_width': float(width)}
+
+            self.readback = FrameReadback(self.fbo.texture, (width // 4, height), 'rgba',
+                                          self._get_readback_latency(),
+                                          fs=luminance_pack_fs, uniforms=uniforms)
+            if self.readback.success:
+                self.gpu_packing = True
+                return
+
+            self.mc.log.warning("Could not compile DMD shader. Will convert "
+                                "%s frames on the CPU.", self.name)
+
+        super()._setup_conversion()
+
+    def _convert(self, data: bytes) -> bytes:
+        if self.gpu_packing:
+            return data
+
+        return self._convert_to_single_bytes(data, self.config)
 
-        return bytes(new_data)
+    @classmethod
+    def _convert_to_single_bytes(cls, data, config: dict):
+        config.setdefault('luminosity', DEFAULT_LUMINOSITY)
+        return convert_to_luminance(data, config['luminosity'])
 
     def send(self, data: bytes) -> None:
-        """Send data to DMD via BCP."""
-        data = self._convert_to_single_bytes(data, self.config)
+        """Send data to DMD via BCP.
 
-        self.mc.bcp_processor.send('dmd_frame', rawbytes=data, name=self.name)
+        Only the newest frame is sent if the client does not keep up.
+        """
+        self.mc.bcp_processor.send(self.bcp_command, rawbytes=data, name=self.name,
+                                   stream_key=self.bcp_command + ':' + self.name)
 
 
 class RgbDmd(DmdBase):
     """RGB DMD."""
 
     dmd_name_string = 'RGB DMD'
+    bcp_command = 'rgb_dmd_frame'
 
     def _get_validated_config(self, config: dict) -> dict:
         return self.mc.config_validator.validate_config('rgb_dmds', config)
 
+    def _gpu_reorders_channels(self) -> bool:
+        order = self.config['channel_order']
+        return self.gpu_conversion and len(order) == 3 and not set(order) - set('rgb')
+
+    def _get_conversion_effects(self) -> list:
+        if self.config['channel_order'] != 'rgb' and self._gpu_reorders_channels():
+            return [ChannelOrderEffect(order=self.config['channel_order'])]
+
+        return []
+
+    def _convert(self, data: bytes) -> bytes:
+        if self.config['channel_order'] != 'rgb' and not self._gpu_reorders_channels():
+            data = self._reorder_channels(data, self.config['channel_order'])
+
+        return data
+
     @staticmethod
-    def _reorder_channels(data, order):
-        new_data = bytearray()
-        for r, g, b in struct.iter_unpack('BBB', data):
-            for channel in order:
-                if channel == "r":
-                    new_data.append(r)
-                elif channel == "g":
-                    new_data.append(g)
-                elif channel == "b":
-                    new_data.append(b)
-                else:
-                    raise ValueError("Unknown channel {}".format(channel))
-
-        return bytes(new_data)
+    def _reorder_channels(data, order) -> bytearray:
+        return reorder_channels(data, order)
 
     def send(self, data: bytes) -> None:
-        """Send data to RGB DMD via BCP."""
-        if self.config['channel_order'] != 'rgb':
-            data = self._reorder_channels(data, self.config['channel_order'])
-        self.mc.bcp_processor.send('rgb_dmd_frame', rawbytes=data, name=self.name)
+        """Send data to RGB DMD via BCP.
+
+        Only the newest frame is sent if the client does not keep up.
+        """
+        self.mc.bcp_processor.send(self.bcp_command, rawbytes=data, name=self.name,
+                                   stream_key=self.bcp_command + ':' + self.name)
+
+
+luminance_pack_fs = '''
+$HEADER$
+
+uniform vec3 luminosity;
+uniform float levels;
+uniform float source_width;
+
+float round_half_even(float value)
+{
+    // rounds halves to the even level like convert_to_luminance on the CPU
+    float rounded = floor(value + 0.5);
+    if (rounded - value == 0.5 && mod(rounded, 2.0) == 1.0)
+        rounded -= 1.0;
+    return rounded;
+}
+
+float shade(float x)
+{
+    vec3 color = texture2D(texture0, vec2(x / source_width, tex_coord0.y)).rgb;
+    return round_half_even(dot(color, luminosity) * levels) / 255.0;
+}
+
+void main(void)
+{
+    // every output texel holds four source pixels in its r, g, b and a channel
+    float x = floor(tex_coord0.x * source_width / 4.0) * 4.0 + 0.5;
+    gl_FragColor = vec4(shade(x), shade(x + 1.0), shade(x + 2.0), shade(x + 3.0));
+}
+'''
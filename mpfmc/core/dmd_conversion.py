@@ -0,0 +1,123 @@
+"""Whole-frame pixel conversion for DMDs.
+
+Converts a full RGB readback from the GPU into the byte format which is sent
+to a DMD in a single pass. NumPy is used when it is installed. Otherwise the
+conversion runs through builtin ``map`` calls over a per-color cache which is
+filled from precomputed lookup tables, so no Python code runs per pixel once
+a color has been seen.
+"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DEFAULT_LUMINOSITY = (.299, .587, .114)
+
+MAX_CACHED_COLORS = 65536
+
+_luminance_tables = dict()
+
+
+class LuminanceTable(dict):
+
+    """Precomputed 3x256 table of weighted channel values.
+
+    The table also acts as cache which maps (r, g, b) tuples to their
+    brightness value. Missing colors are calculated from the lookup tables.
+
+    Args:
+        luminosity: Weights for the red, green and blue channel.
+        shades: Number of brightness levels.
+
+    """
+
+    def __init__(self, luminosity, shades):
+        super().__init__()
+        self.luminosity = tuple(luminosity)
+        self.levels = shades - 1
+        self.red = [value * self.luminosity[0] for value in range(256)]
+        self.green = [value * self.luminosity[1] for value in range(256)]
+        self.blue = [value * self.luminosity[2] for value in range(256)]
+
+        if numpy:
+            self.numpy_tables = (numpy.array(self.red, dtype=numpy.float64),
+                                 numpy.array(self.green, dtype=numpy.float64),
+                                 numpy.array(self.blue, dtype=numpy.float64))
+        else:
+            self.numpy_tables = None
+
+    def __missing__(self, key):
+        if len(self) >= MAX_CACHED_COLORS:
+            self.clear()
+
+        red, green, blue = key
+        value = round((self.red[red] + self.green[green] + self.blue[blue]) / 255. * self.levels)
+        self[key] = value
+        return value
+
+
+def get_luminance_table(luminosity, shades=16) -> LuminanceTable:
+    """Return the (cached) lookup table for these luminosity weights."""
+    key = (tuple(luminosity), shades)
+    try:
+        return _luminance_tables[key]
+    except KeyError:
+        table = LuminanceTable(luminosity, shades)
+        _luminance_tables[key] = table
+        return table
+
+
+def convert_to_luminance(data, luminosity=DEFAULT_LUMINOSITY, shades=16):
+    """Convert RGB pixel data into one brightness byte per pixel.
+
+    Args:
+        data: RGB pixel data (3 bytes per pixel).
+        luminosity: Weights for the red, green and blue channel.
+        shades: Number of brightness levels. Results are in the range
+            0 to shades - 1.
+
+    Returns bytes with one byte per pixel.
+    """
+    table = get_luminance_table(luminosity, shades)
+    if table.numpy_tables is not None:
+        return _convert_to_luminance_numpy(data, table)
+
+    return _convert_to_luminance_table(data, table)
+
+
+def _convert_to_luminance_numpy(data, table):
+    pixels = numpy.frombuffer(data, dtype=numpy.uint8)
+    red, green, blue = table.numpy_tables
+    total = red[pixels[0::3]] + green[pixels[1::3]] + blue[pixels[2::3]]
+    # numpy.rint rounds half to even just like round()
+    return numpy.rint(total / 255. * table.levels).astype(numpy.uint8).tobytes()
+
+
+def _convert_to_luminance_table(data, table):
+    data = bytes(data)
+    return bytes(map(table.__getitem__, zip(data[0::3], data[1::3], data[2::3])))
+
+
+def reorder_channels(data, order):
+    """Reorder the channels of RGB pixel data.
+
+    Args:
+        data: RGB pixel data (3 bytes per pixel).
+        order: String with one character (r, g or b) per output channel,
+            e.g. "bgr".
+
+    Returns a bytearray with len(order) bytes per pixel.
+    """
+    data = bytes(data)
+    channels = len(order)
+    new_data = bytearray(len(data) // 3 * channels)
+
+    for index, channel in enumerate(order):
+        try:
+            source = 'rgb'.index(channel)
+        except ValueError:
+            raise ValueError("Unknown channel {}".format(channel))
+
+        new_data[index::channels] = data[source::3]
+
+    return new_data
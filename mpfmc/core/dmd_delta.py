@@ -0,0 +1,190 @@
+"""Delta encoding of DMD frames.
+
+A delta frame contains only the spans which changed since the previous frame.
+Keyframes contain the complete frame and are sent periodically, when the
+delta would be larger than the frame or when the frame size changes.
+
+The payload of a delta frame is a sequence of spans. Each span starts with a
+header of the offset (4 bytes) and the length (2 bytes), both little endian,
+followed by the new bytes of the span.
+"""
+import struct
+import zlib
+from typing import Optional, Tuple
+
+SPAN_HEADER = struct.Struct('<IH')
+
+MAX_SPAN_LENGTH = 0xFFFF
+
+
+def frame_hash(data) -> int:
+    """Return the hash which is sent with every frame."""
+    return zlib.crc32(data) & 0xFFFFFFFF
+
+
+def find_changed_spans(prev_data, data, chunk_size=16):
+    """Return a list of (start, end) tuples of the spans which changed.
+
+    Frames are compared in chunks so the comparison runs in C. Neighbouring
+    changed chunks are merged into one span.
+    """
+    spans = []
+    span_start = None
+    length = len(data)
+
+    for start in range(0, length, chunk_size):
+        end = start + chunk_size
+        if prev_data[start:end] != data[start:end]:
+            if span_start is None:
+                span_start = start
+            elif start - span_start >= MAX_SPAN_LENGTH - chunk_size:
+                spans.append((span_start, start))
+                span_start = start
+        elif span_start is not None:
+            spans.append((span_start, start))
+            span_start = None
+
+    if span_start is not None:
+        spans.append((span_start, length))
+
+    return spans
+
+
+def encode_spans(data, spans) -> bytes:
+    """Encode the spans of a frame."""
+    parts = []
+    for start, end in spans:
+        parts.append(SPAN_HEADER.pack(start, end - start))
+        parts.append(data[start:end])
+
+    return b''.join(parts)
+
+
+def apply_spans(frame: bytearray, payload) -> None:
+    """Apply an encoded delta payload to a frame."""
+    payload = memoryview(payload)
+    pos = 0
+    while pos < len(payload):
+        start, length = SPAN_HEADER.unpack_from(payload, pos)
+        pos += SPAN_HEADER.size
+        if start + length > len(frame) or pos + length > len(payload):
+            raise ValueError("Invalid span {}+{} in DMD delta frame".format(start, length))
+        frame[start:start + length] = payload[pos:pos + length]
+        pos += length
+
+
+class DmdFrameEncoder:
+
+    """Encodes DMD frames as keyframes and deltas.
+
+    Args:
+        keyframe_interval: Send a keyframe after this number of frames.
+        keyframe_time: Resend a keyframe after this number of seconds even
+            if the frame did not change. 0 disables it.
+
+    """
+
+    def __init__(self, keyframe_interval: int = 60, keyframe_time: float = 0) -> None:
+        """Initialise encoder."""
+        if keyframe_interval < 1:
+            raise ValueError("DMD keyframe_interval should be at least 1. Yours is {}".format(
+                keyframe_interval))
+        if keyframe_time < 0:
+            raise ValueError("DMD keyframe_time should be 0 or more. Yours is {}".format(
+                keyframe_time))
+
+        self.keyframe_interval = keyframe_interval
+        self.keyframe_time = keyframe_time
+        self.sequence = 0
+        self._prev_data = None
+        self._prev_hash = None
+        self._frames_since_keyframe = 0
+        self._keyframe_sent_at = None
+
+    def force_keyframe(self) -> None:
+        """Send the next frame as keyframe (e.g. after a client connected)."""
+        self._prev_data = None
+        self._prev_hash = None
+        self._keyframe_sent_at = None
+
+    def keyframe_due(self, now: float) -> bool:
+        """Return True if the last keyframe is older than keyframe_time.
+
+        Unchanged frames are not sent. Call force_keyframe() when this is
+        due so clients which joined or lost a delta on a static frame
+        resync.
+        """
+        return (self.keyframe_time > 0 and self._keyframe_sent_at is not None and
+                now - self._keyframe_sent_at >= self.keyframe_time)
+
+    def encode(self, data, now: Optional[float] = None) -> Optional[Tuple[bool, int, int, bytes]]:
+        """Encode a frame.
+
+        Returns None if the frame did not change. Otherwise a tuple of
+        keyframe (bool), sequence number, frame hash and the payload. now is
+        the current time which is used by keyframe_due().
+        """
+        data = bytes(data)
+        new_hash = frame_hash(data)
+
+        # compare the hash first. only compare the data when it matches
+        if new_hash == self._prev_hash and data == self._prev_data:
+            return None
+
+        keyframe = (self._prev_data is None or len(self._prev_data) != len(data) or
+                    self._frames_since_keyframe >= self.keyframe_interval - 1)
+        payload = None
+
+        if not keyframe:
+            payload = encode_spans(data, find_changed_spans(self._prev_data, data))
+            if len(payload) >= len(data):
+                keyframe = True
+
+        if keyframe:
+            payload = data
+            self._frames_since_keyframe = 0
+            self._keyframe_sent_at = now
+        else:
+            self._frames_since_keyframe += 1
+
+        self.sequence += 1
+        self._prev_data = data
+        self._prev_hash = new_hash
+
+        return keyframe, self.sequence, new_hash, payload
+
+
+class DmdFrameDecoder:
+
+    """Decodes frames created by DmdFrameEncoder.
+
+    This is what a client has to implement to display a delta encoded DMD.
+    """
+
+    def __init__(self) -> None:
+        """Initialise decoder."""
+        self.sequence = None
+        self.frame = None
+
+    def decode(self, keyframe: bool, sequence: int, expected_hash: int, payload) -> bytes:
+        """Decode a frame and return the complete frame.
+
+        Raises ValueError if a delta frame is missing or the resulting frame
+        does not match the hash. The decoder needs a keyframe afterwards.
+        """
+        if keyframe:
+            frame = bytearray(payload)
+        elif self.frame is None or sequence != self.sequence + 1:
+            self.frame = None
+            raise ValueError("Missing DMD frame before {}. Waiting for keyframe.".format(sequence))
+        else:
+            frame = self.frame
+            apply_spans(frame, payload)
+
+        if frame_hash(frame) != expected_hash:
+            self.frame = None
+            raise ValueError("DMD frame {} does not match its hash.".format(sequence))
+
+        self.frame = frame
+        self.sequence = sequence
+        return bytes(frame)
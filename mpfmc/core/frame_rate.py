@@ -0,0 +1,108 @@
+"""Adaptive frame rate for the MC main loop."""
+from kivy.animation import Animation
+from kivy.clock import Clock
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.core.mc import MpfMc
+
+
+class AdaptiveFrameRate:
+
+    """Drops the Kivy frame rate while nothing happens in the MC.
+
+    At the end of every frame the scheduler checks whether events or BCP
+    commands were processed, animations are running or any display changed
+    (which covers videos and slide transitions). After idle_delay seconds
+    without activity the clock is limited to the idle fps. The first frame
+    with activity restores the full rate. While idle, new activity is picked
+    up with the next idle frame at the latest.
+
+    Per display settings:
+        idle_fps: The display needs at least this rate while idle.
+        track_changes: Set to false to ignore changes on this display (e.g.
+            a permanently animated background).
+
+    Args:
+        mc: The MpfMc instance.
+        config: The mpf-mc: adaptive_fps: config.
+
+    """
+
+    def __init__(self, mc: "MpfMc", config: dict) -> None:
+        """Initialise scheduler."""
+        self.mc = mc
+        # pylint: disable-msg=protected-access
+        self.full_fps = Clock._max_fps
+        self.idle_delay = float(config['idle_delay'])
+        self.idle = False
+        self._config = config
+        self._activity = False
+        self._last_activity = Clock.time()
+        self._check_event = None
+
+        self.idle_fps = float(config['idle_fps'])
+        display_configs = config.get('displays') or {}
+        for display_config in display_configs.values():
+            self.idle_fps = max(self.idle_fps, float(display_config.get('idle_fps', 0)))
+
+        if self.full_fps and self.idle_fps > self.full_fps:
+            self.idle_fps = self.full_fps
+
+    def start(self) -> None:
+        """Start checking for activity every frame."""
+        self._check_event = Clock.schedule_interval(self._tick, 0)
+
+    def stop(self) -> None:
+        """Stop the scheduler and restore the full frame rate."""
+        if self._check_event:
+            self._check_event.cancel()
+            self._check_event = None
+        self._set_idle(False)
+
+    def notify_activity(self) -> None:
+        """Keep the full frame rate because something happened in this frame."""
+        self._activity = True
+        if self.idle:
+            self._set_idle(False)
+
+    def _tick(self, dt) -> None:
+        del dt
+        # run this at the end of the tick when all changes of this frame are done
+        Clock.schedule_once(self._check_activity, -1)
+
+    def _tracks_display(self, name: str) -> bool:
+        display_config = (self._config.get('displays') or {}).get(name) or {}
+        return display_config.get('track_changes', True)
+
+    def _displays_changed(self) -> bool:
+        for display in self.mc.displays.values():
+            if not self._tracks_display(display.name):
+                continue
+            if display.container.canvas.needs_redraw:
+                return True
+
+        return False
+
+    def _check_activity(self, dt) -> None:
+        del dt
+        now = Clock.time()
+
+        # pylint: disable-msg=protected-access
+        if self._activity or Animation._instances or self._displays_changed():
+            self._activity = False
+            self._last_activity = now
+            if self.idle:
+                self._set_idle(False)
+
+        elif not self.idle and now - self._last_activity >= self.idle_delay:
+            self._set_idle(True)
+
+    def _set_idle(self, idle: bool) -> None:
+        if idle == self.idle:
+            return
+
+        self.idle = idle
+        # pylint: disable-msg=protected-access
+        Clock._max_fps = self.idle_fps if idle else self.full_fps
+        self.mc.log.debug("Setting frame rate to %sfps", Clock._max_fps)
@@ -0,0 +1,102 @@
+"""Immutable validated configs with copy-on-write overlays.
+
+Widget and player configs are validated once when the config is loaded and
+used by every widget or play call afterwards. Instead of deep copying them
+each time they are frozen after validation and users create a shallow
+overlay (a plain dict) for their own settings::
+
+    config = overlay(frozen_widget_config, play_kwargs)
+    config['color'] = RGBAColor(config['color'])   # only changes the overlay
+
+Nested dicts and lists are shared between all overlays. They are frozen so
+an accidental in-place change raises a TypeError instead of silently
+changing the config of every other widget. Copy a nested value before
+changing it.
+
+Frozen dicts and lists are still instances of dict and list. copy(),
+deepcopy() and slicing return normal mutable objects.
+"""
+from copy import deepcopy
+from typing import Any, Optional
+
+
+def _frozen(self, *args, **kwargs):
+    del args, kwargs
+    raise TypeError("{} is frozen. Copy it before changing it".format(type(self).__name__))
+
+
+class FrozenDict(dict):
+
+    """Dict which cannot be changed after it has been created."""
+
+    __slots__ = []
+
+    __setitem__ = __delitem__ = _frozen
+    clear = pop = popitem = setdefault = update = _frozen
+
+    def copy(self) -> dict:
+        """Return a mutable shallow copy."""
+        return dict(self)
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> dict:
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+
+    """List which cannot be changed after it has been created."""
+
+    __slots__ = []
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen
+    append = extend = insert = pop = remove = reverse = sort = clear = _frozen
+
+    def copy(self) -> list:
+        """Return a mutable shallow copy."""
+        return list(self)
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo) -> list:
+        return [deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    """Return a frozen version of a config value.
+
+    Dicts and lists are frozen recursively. All other values (including
+    subclasses like CaseInsensitiveDict and objects like templates) are
+    returned unchanged.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if value_type is list:
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def overlay(config: dict, overrides: Optional[dict] = None) -> dict:
+    """Return a mutable shallow copy of a (frozen) config.
+
+    Changing a key of the result does not change the config. Nested values
+    are shared.
+
+    Args:
+        config: The validated config.
+        overrides: Optional settings which replace those of the config.
+    """
+    result = dict(config)
+    if overrides:
+        result.update(overrides)
+    return result
@@ -0,0 +1,125 @@
+"""Sampling of single pixels from displays for display light maps."""
+from operator import itemgetter
+from typing import List
+
+from kivy.graphics import Mesh
+
+from mpfmc.core.readback import FrameReadback
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.core.display_capture import DisplayCapture
+
+
+class PointReadback(FrameReadback):
+
+    """Gathers a list of pixels from a texture into an N x 1 texture.
+
+    Every pixel is drawn as quad of one pixel which maps to the texture
+    coordinate of the sample point. Only 4 bytes per point are read back.
+
+    Args:
+        texture: The texture to sample.
+        texture_size: Size of the texture in pixels.
+        pixels: List of (x, y) pixel positions to sample. y counts from the
+            first row in the texture.
+        latency: Number of frames to delay the readback.
+
+    """
+
+    def __init__(self, texture, texture_size, pixels, latency=0) -> None:
+        """Initialise point readback."""
+        self.texture_size = texture_size
+        self.pixels = pixels
+        super().__init__(texture, (len(pixels), 1), 'rgba', latency)
+
+    def _draw_source(self, texture) -> None:
+        width, height = self.texture_size
+        vertices = []
+        indices = []
+        for i, (x, y) in enumerate(self.pixels):
+            u = (x + .5) / width
+            v = (y + .5) / height
+            vertices.extend((i, 0, u, v, i + 1, 0, u, v, i + 1, 1, u, v, i, 1, u, v))
+            indices.extend((i * 4, i * 4 + 1, i * 4 + 2, i * 4, i * 4 + 2, i * 4 + 3))
+
+        Mesh(vertices=vertices, indices=indices, mode='triangles', texture=texture)
+
+
+class LightMapSampler:
+
+    """Samples the pixels of a light map from a display.
+
+    Index tables for all lights are precomputed. With GPU sampling only the
+    light map pixels are read back. Otherwise the lights are picked from the
+    full RGBA frame of the capture.
+
+    Args:
+        capture: The DisplayCapture of the source display.
+        light_map: List of (x, y, name) tuples with x and y between 0 and 1.
+        latency: Number of frames to delay the readback.
+        gpu_sampling: Gather the pixels on the GPU.
+
+    """
+
+    def __init__(self, capture: "DisplayCapture", light_map, latency: int = 0,
+                 gpu_sampling: bool = False) -> None:
+        """Initialise sampler."""
+        self.capture = capture
+        width, height = capture.source.native_size
+        self.names = [name for _, _, name in light_map]
+        # rows in the texture start at the bottom of the display
+        self.pixels = [(min(int(x * width), width - 1), min(height - int(y * height), height - 1))
+                       for x, y, _ in light_map]
+        self.values = [None] * len(self.names)
+        self._prev_sample = None
+        self._getter = None
+        self.readback = None
+
+        if not self.pixels:
+            self._frame_number = None
+        elif gpu_sampling:
+            self.readback = PointReadback(capture.texture, (width, height), self.pixels, latency)
+            self._frame_number = capture.frame_number
+        else:
+            capture.enable_pixels(latency)
+            offsets = []
+            for x, y in self.pixels:
+                offset = (y * width + x) * 4
+                offsets.extend(range(offset, offset + 4))
+            self._getter = itemgetter(*offsets)
+            self._frame_number = capture.pixel_frame_number
+
+    def sample(self) -> List[bytes]:
+        """Return the RGBA bytes of all lights for every frame which became ready.
+
+        Call this after capture.update().
+        """
+        capture = self.capture
+        if self.readback:
+            if capture.frame_number != self._frame_number:
+                self._frame_number = capture.frame_number
+                return self.readback.push()
+            if not capture.dirty and self.readback.pending:
+                return self.readback.flush()
+        elif self._getter and capture.pixel_frame_number != self._frame_number:
+            self._frame_number = capture.pixel_frame_number
+            return [bytes(self._getter(frame)) for frame in capture.frames]
+
+        return []
+
+    def get_changes(self, sample: bytes) -> dict:
+        """Return a dict of all lights which changed since the last sample.
+
+        The value is a (r, g, b) tuple or -1 for transparent pixels.
+        """
+        if sample == self._prev_sample:
+            return {}
+        self._prev_sample = sample
+
+        new_values = [-1 if alpha == 0 else (red, green, blue)
+                      for red, green, blue, alpha in zip(sample[0::4], sample[1::4], sample[2::4], sample[3::4])]
+        changes = {name: value for name, value, old_value in zip(self.names, new_values, self.values)
+                   if value != old_value}
+        self.values = new_values
+        return changes
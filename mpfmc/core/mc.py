@@ -35,15 +35,20 @@ import mpfmc
 from mpfmc._version import __version__
 from mpfmc.assets.video import VideoAsset
 from mpfmc.core.bcp_processor import BcpProcessor
+from mpfmc.core.frame_rate import AdaptiveFrameRate
 from mpfmc.core.config_processor import ConfigProcessor
 from mpfmc.core.mode_controller import ModeController
 from mpfmc.uix.transitions import TransitionManager
 from mpfmc.uix.effects import EffectsManager
+from mpfmc.uix.slide_template_cache import SlideTemplateCache
+from mpfmc.uix.widget_pool import WidgetPool
+from mpfmc.uix.widget_index import WidgetKeyIndex
 from mpfmc.core.config_collection import create_config_collections
 from mpfmc.assets.image import ImageAsset
 from mpfmc.assets.bitmap_font import BitmapFontAsset
 from mpfmc.core.dmd import Dmd, RgbDmd
 from mpfmc.core.assets import ThreadedAssetManager
+from mpfmc.core.asset_cache import AssetCache, get_default_cache_path
 from mpfmc.core.mc_placeholder_manager import McPlaceholderManager
 from mpfmc.core.mc_settings_controller import McSettingsController
 
@@ -131,6 +136,8 @@ class MpfMc(App):
         self.keyboard = None
         self.dmds = []
         self.rgb_dmds = []
+        self.display_captures = dict()
+        self.frame_rate = None      # type: AdaptiveFrameRate
         self.crash_queue = queue.Queue()
         self.ticks = 0
         self.start_time = 0
@@ -168,6 +175,10 @@ class MpfMc(App):
             if self.sound_system.audio_interface is None:
                 self.sound_system = None
 
+        self.asset_cache = self._create_asset_cache()
+        self.widget_index = WidgetKeyIndex()
+        self.slide_template_cache = self._create_slide_template_cache()
+        self.widget_pool = self._create_widget_pool()
         self.asset_manager = ThreadedAssetManager(self)
         self.bcp_processor = BcpProcessor(self)
 
@@ -187,6 +198,27 @@ class MpfMc(App):
         # force setting it here so we have it before MPF connects
         self.receive_machine_var_update('mpfmc_ver', __version__, 0, True)
 
+    def _create_asset_cache(self):
+        config = self.machine_config['mpf-mc']['asset_cache']
+        if not config['enabled']:
+            return None
+
+        return AssetCache(config['path'] or get_default_cache_path())
+
+    def _create_slide_template_cache(self):
+        config = self.machine_config['mpf-mc']['slide_template_cache']
+        if not config['enabled']:
+            return None
+
+        return SlideTemplateCache(config['max_widgets'])
+
+    def _create_widget_pool(self):
+        config = self.machine_config['mpf-mc']['widget_pool']
+        if not config['enabled']:
+            return None
+
+        return WidgetPool(config['size'])
+
     def _load_named_colors(self):
         for name, color in self.machine_config.get('named_colors', {}).items():
             RGBColor.add_color(name, color)
@@ -420,6 +452,10 @@ class MpfMc(App):
         self.clock.schedule_interval(self.tick, 0)
         self.events.add_handler("debug_dump_stats", self._debug_dump_displays)
 
+        if self.machine_config['mpf-mc']['adaptive_fps']['enabled']:
+            self.frame_rate = AdaptiveFrameRate(self, self.machine_config['mpf-mc']['adaptive_fps'])
+            self.frame_rate.start()
+
     def _debug_dump_displays(self, **kwargs):
         del kwargs
         self.log.info("--- DEBUG DUMP DISPLAYS ---")
@@ -568,6 +604,8 @@ class MpfMc(App):
         """Process event queue."""
         del dt
         self.ticks += 1
+        if self.frame_rate and self.events.event_queue:
+            self.frame_rate.notify_activity()
         self.events.process_event_queue()
 
     def _load_custom_code(self):
@@ -0,0 +1,130 @@
+"""Pixel readback from rendered displays."""
+from collections import deque
+
+from kivy.graphics import Rectangle
+from kivy.graphics.fbo import Fbo
+from kivy.graphics.instructions import Callback
+from kivy.graphics.texture import Texture
+from kivy.graphics.opengl import glReadPixels, glEnable, glDisable, glFlush, \
+    GL_RGB, GL_RGBA, GL_UNSIGNED_BYTE, GL_BLEND
+
+
+def disable_blending(*args):
+    """Disable blending so textures are copied with all channels as they are."""
+    del args
+    glDisable(GL_BLEND)
+
+
+def enable_blending(*args):
+    """Enable blending again."""
+    del args
+    glEnable(GL_BLEND)
+
+
+class FrameReadback:
+
+    """Reads frames from a texture back into memory.
+
+    Every pushed frame is copied into one FBO of a ring. With a latency of 0
+    the frame is read immediately. With a latency of n the read of a frame is
+    delayed by n pushes.
+
+    This only reorders the read. Kivy does not expose pixel buffer objects
+    (GL_PIXEL_PACK_BUFFER) so glReadPixels is still synchronous and most
+    drivers block on it. A latency above 0 adds frames of delay and one FBO
+    copy per frame without removing that stall. Use a latency of 0 unless a
+    driver is known to benefit from it.
+
+    Args:
+        texture: The texture which contains the rendered frame.
+        size: Size of the data to read in pixels. This is the size of the
+            FBOs in the ring.
+        colorfmt: 'rgb' or 'rgba'.
+        latency: Number of frames to delay the readback.
+        fs: Optional fragment shader which is used to copy the texture into
+            the ring.
+        uniforms: Dict of uniforms for the fragment shader.
+
+    """
+
+    # pylint: disable-msg=too-many-arguments
+    def __init__(self, texture, size, colorfmt='rgb', latency=0, fs=None,
+                 uniforms=None) -> None:
+        """Initialise readback ring."""
+        if latency < 0:
+            raise ValueError("Readback latency cannot be negative. Yours is {}".format(latency))
+
+        self.size = tuple(size)
+        self.latency = latency
+        self.gl_format = GL_RGBA if colorfmt == 'rgba' else GL_RGB
+        self.success = True
+        self._pending = deque()
+        self._index = 0
+
+        texture.min_filter = 'nearest'
+        texture.mag_filter = 'nearest'
+
+        self.fbos = list()
+        for _ in range(latency + 1):
+            fbo = self._create_fbo(texture, colorfmt, fs, uniforms)
+            if fs and not fbo.shader.success:
+                self.success = False
+            self.fbos.append(fbo)
+
+    def _create_fbo(self, texture, colorfmt, fs, uniforms):
+        target = Texture.create(size=self.size, colorfmt=colorfmt)
+        fbo = Fbo(size=self.size, texture=target, fs=fs)
+
+        with fbo:
+            # copy all channels as they are
+            Callback(disable_blending)
+            self._draw_source(texture)
+            Callback(enable_blending)
+
+        for name, value in (uniforms or {}).items():
+            fbo[name] = value
+
+        return fbo
+
+    def _draw_source(self, texture) -> None:
+        """Add the instructions which draw the texture into a ring FBO."""
+        Rectangle(size=self.size, texture=texture)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of frames which have not been read yet."""
+        return len(self._pending)
+
+    def push(self) -> list:
+        """Copy the current frame into the ring.
+
+        Returns a list of frames which are due for readback.
+        """
+        fbo = self.fbos[self._index]
+        self._index = (self._index + 1) % len(self.fbos)
+
+        fbo.draw()
+        self._pending.append(fbo)
+
+        if self.latency:
+            # start the copy now. it will be read in one of the next frames
+            glFlush()
+
+        frames = []
+        while len(self._pending) > self.latency:
+            frames.append(self._read(self._pending.popleft()))
+
+        return frames
+
+    def flush(self) -> list:
+        """Read all pending frames."""
+        frames = [self._read(fbo) for fbo in self._pending]
+        self._pending.clear()
+        return frames
+
+    def _read(self, fbo) -> bytes:
+        fbo.bind()
+        data = glReadPixels(0, 0, self.size[0], self.size[1],
+                            self.gl_format, GL_UNSIGNED_BYTE)
+        fbo.release()
+        return data
@@ -0,0 +1,43 @@
+from kivy.uix.effectwidget import EffectBase
+from kivy.properties import StringProperty
+
+
+class ChannelOrderEffect(EffectBase):
+    """GLSL effect to reorder the color channels of a texture.
+
+    This is used by RGB DMDs so the frame can be read back from the GPU in
+    the channel order which the hardware expects.
+
+    """
+
+    order = StringProperty('rgb')
+    '''
+    Sets the order of the output channels, e.g. "bgr".
+
+    order is a :class:`~kivy.properties.StringProperty` and defaults to
+    "rgb" (which has no effect).
+    '''
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.do_glsl()
+
+    def on_order(self, *args):
+        self.do_glsl()
+
+    def do_glsl(self):
+        if len(self.order) != 3 or set(self.order) - set('rgb'):
+            raise ValueError("Invalid channel order {}".format(self.order))
+
+        self.glsl = channel_order_glsl.format(self.order)
+
+
+channel_order_glsl = '''
+vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
+{{
+    return vec4(color.{}, 1.0);
+}}
+'''
+
+effect_cls = ChannelOrderEffect
+name = 'channel_order'
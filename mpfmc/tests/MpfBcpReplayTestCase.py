@@ -0,0 +1,56 @@
+from time import perf_counter
+
+from kivy.base import EventLoop
+
+from mpfmc.core.bcp_recorder import BcpSessionPlayer
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class MpfBcpReplayTestCase(MpfMcTestCase):
+
+    """Replays recorded BCP sessions headless with simulated time.
+
+    The MC runs as fast as possible while the clock advances by one frame per
+    loop, so a replay is deterministic and can be used as load test. The
+    real time of every frame is measured.
+    """
+
+    def replay_session(self, path, speed=1.0, settle_secs=1.0):
+        """Replay a session and return the real time of every frame in seconds.
+
+        Args:
+            path: The session file.
+            speed: Replay speed in simulated time. 0 passes all commands to
+                the MC in the first frame.
+            settle_secs: Simulated seconds to run after the last command.
+        """
+        player = BcpSessionPlayer(self.mc, path, speed)
+        player.start()
+        frame_times = []
+
+        end_time = None
+        while end_time is None or self._current_time < end_time:
+            start = perf_counter()
+            EventLoop.idle()
+            frame_times.append(perf_counter() - start)
+            self._current_time += 1 / self._fps
+
+            if end_time is None and player.done and self.mc.bcp_processor.receive_queue.empty():
+                end_time = self._current_time + settle_secs
+
+        self.replayed_commands = player.commands
+        return frame_times
+
+    @staticmethod
+    def get_frame_time_stats(frame_times):
+        """Return frames, average, 95th percentile and maximum in ms."""
+        if not frame_times:
+            return {'frames': 0, 'avg_ms': 0, 'p95_ms': 0, 'max_ms': 0}
+
+        ordered = sorted(frame_times)
+        return {
+            'frames': len(ordered),
+            'avg_ms': sum(ordered) / len(ordered) * 1000,
+            'p95_ms': ordered[min(int(len(ordered) * .95), len(ordered) - 1)] * 1000,
+            'max_ms': ordered[-1] * 1000,
+        }
@@ -1,5 +1,8 @@
+import os
+import tempfile
 import time
 
+from mpfmc.core.asset_cache import AssetCache, CachedBlock
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
 
 
@@ -294,3 +297,86 @@ class TestAssets(MpfMcTestCase):
             this_set.add(self.mc.images['group6'].image)
 
             self.assertEqual(len(this_set), 3)
+
+
+class TestAssetLoaderPool(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/assets_and_image'
+
+    def get_config_file(self):
+        return 'test_asset_loader_pool.yaml'
+
+    def test_loader_threads(self):
+        asset_manager = self.mc.asset_manager
+        self.assertEqual(3, len(asset_manager.loader_threads))
+        self.assertIs(asset_manager.loader_thread, asset_manager.loader_threads[0])
+        for loader_thread in asset_manager.loader_threads:
+            self.assertTrue(loader_thread.is_alive())
+
+        # all preload assets were loaded by the pool and timed
+        loaded = [image for image in self.mc.images.values() if image.loaded]
+        self.assertTrue(loaded)
+        self.assertFalse(self.mc.images['image5'].loaded)
+        count, total, maximum = asset_manager.load_times['ImageAsset']
+        self.assertEqual(len(loaded), count)
+        self.assertGreaterEqual(total, maximum)
+
+        # on demand assets are loaded by the pool as well
+        self.mc.images['image5'].load()
+        self.advance_time(1)
+        self.assertTrue(self.mc.images['image5'].loaded)
+        self.assertEqual(len(loaded) + 1, asset_manager.load_times['ImageAsset'][0])
+
+
+class TestAssetCache(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/assets_and_image'
+
+    def get_config_file(self):
+        return 'test_asset_cache.yaml'
+
+    def test_cache_file(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = AssetCache(os.path.join(path, 'cache'))
+            asset_file = os.path.join(path, 'sound.wav')
+            with open(asset_file, 'wb') as f:
+                f.write(b'RIFF')
+
+            self.assertIsNone(cache.read(asset_file, 'pcm', '44100'))
+            cache.write(asset_file, 'pcm', [CachedBlock(0, 0, 0, 'pcm', False, b'\x01\x02' * 100)], '44100')
+            self.assertEqual([CachedBlock(0, 0, 0, 'pcm', False, b'\x01\x02' * 100)],
+                             cache.read(asset_file, 'pcm', '44100'))
+            self.assertEqual(1, cache.hits)
+            self.assertEqual(1, cache.misses)
+
+            # a different output format has another entry
+            self.assertIsNone(cache.read(asset_file, 'pcm', '22050'))
+
+            # changed assets are decoded again
+            with open(asset_file, 'ab') as f:
+                f.write(b'WAVE')
+            self.assertIsNone(cache.read(asset_file, 'pcm', '44100'))
+
+            # truncated files are ignored
+            cache.write(asset_file, 'img', [CachedBlock(2, 2, 0, 'rgba', True, b'\xff' * 16)])
+            filename = cache.get_filename(asset_file, 'img')
+            with open(filename, 'r+b') as f:
+                f.truncate(os.path.getsize(filename) - 1)
+            self.assertIsNone(cache.read(asset_file, 'img'))
+
+    def test_images_from_cache(self):
+        cache = self.mc.asset_cache
+        self.assertTrue(cache)
+        image = self.mc.images['image3']
+        self.assertTrue(image.loaded)
+        size = image.image.size
+        self.assertTrue(os.path.isfile(cache.get_filename(image.config['file'], 'img')))
+
+        # load again from the cache
+        hits = cache.hits
+        image.unload()
+        image.load()
+        self.advance_time(1)
+        self.assertTrue(image.loaded)
+        self.assertEqual(hits + 1, cache.hits)
+        self.assertEqual(size, image.image.size)
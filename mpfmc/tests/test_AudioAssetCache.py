@@ -0,0 +1,47 @@
+import logging
+import os
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestAudioAssetCache(MpfMcTestCase):
+    """
+    Tests loading in-memory sounds through the asset cache
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio_asset_cache.yaml'
+
+    def test_sound_from_cache(self):
+        """ Tests that decoded samples are cached and loaded again from the cache """
+
+        if self.mc.sound_system is None or self.mc.sound_system.audio_interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        cache = self.mc.asset_cache
+        self.assertTrue(cache)
+
+        # /sounds/voice is preloaded
+        sound = self.mc.sounds['113690_test']
+        self.assertTrue(sound.loaded)
+        samples = sound.container.get_sample_data()
+        self.assertTrue(samples)
+
+        settings = self.mc.sound_system.audio_interface.get_settings()
+        output_format = '{sample_rate}|{audio_channels}|{audio_format}'.format(**settings)
+        self.assertTrue(os.path.isfile(cache.get_filename(sound.file, 'pcm', output_format)))
+
+        # load again from the cache
+        hits = cache.hits
+        sound.unload()
+        self.assertFalse(sound.loaded)
+        sound.load()
+        self.advance_time(1)
+        self.assertTrue(sound.loaded)
+        self.assertEqual(hits + 1, cache.hits)
+        self.assertEqual(samples, sound.container.get_sample_data())
@@ -1,6 +1,19 @@
-from unittest.mock import MagicMock
+import os
+import queue
+import socket
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, ANY
+
+import mpf.core.bcp.bcp_socket_client as bcp
 
 from mpfmc._version import __version__
+from mpfmc.core.bcp_decoder import BcpDecoder
+from mpfmc.core.bcp_asyncio_server import BcpServerProtocol, AsyncioBCPServer
+from mpfmc.core.bcp_send_queue import BcpSendQueue
+from mpfmc.core.bcp_server import create_unix_socket, get_host_and_port, remove_unix_socket
+from mpfmc.core.bcp_shared_memory import SharedMemoryRing, SharedMemoryRingReader
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
 
 
@@ -93,3 +106,351 @@ class TestBcpProcessor(MpfMcTestCase):
         self.advance_time()
         self.callback.assert_called_with(value='10', prev_value='0',
                                          change='10')
+
+    def test_asyncio_protocol_parser(self):
+        server = MagicMock()
+        server.decode_line = BcpDecoder().decode_with_payload_length
+        protocol = BcpServerProtocol(server)
+
+        # partial lines are kept until the newline arrives
+        protocol.data_received(b'trigger?name=foo\nplayer_var')
+        server.commands_received.assert_called_once_with(
+            [('trigger', {'name': 'foo'})], ANY, protocol)
+
+        server.commands_received.reset_mock()
+        protocol.data_received(b'iable?name=score&value=int:10\n\n')
+        server.commands_received.assert_called_once_with(
+            [('player_variable', {'name': 'score', 'value': 10})], ANY, protocol)
+
+        # binary payloads may be split across several reads
+        server.commands_received.reset_mock()
+        protocol.data_received(b'dmd_frame?name=dmd&bytes=4\n\x00\x01')
+        server.commands_received.assert_not_called()
+        protocol.data_received(b'\x02\x0ftrigger?name=bar\n')
+        server.commands_received.assert_called_once_with(
+            [('dmd_frame', {'name': 'dmd', 'rawbytes': b'\x00\x01\x02\x0f'}),
+             ('trigger', {'name': 'bar'})], ANY, protocol)
+
+    def test_rawbytes_header_cache(self):
+        bcp_processor = self.mc.bcp_processor
+        header = bcp_processor._get_rawbytes_header('dmd_frame', 4096, {'name': 'dmd'})
+        self.assertEqual(b'dmd_frame?name=dmd&bytes=4096\n', header)
+
+        # the same command shape returns the cached header
+        self.assertIs(header, bcp_processor._get_rawbytes_header('dmd_frame', 4096, {'name': 'dmd'}))
+        self.assertEqual(b'dmd_frame?name=dmd&bytes=12288\n',
+                         bcp_processor._get_rawbytes_header('dmd_frame', 12288, {'name': 'dmd'}))
+
+    def test_time_budget(self):
+        bcp_processor = self.mc.bcp_processor
+        handler = MagicMock()
+        self.mc.events.add_handler('budget_test', handler)
+
+        # process at least one command per frame when the budget is exhausted
+        bcp_processor.time_budget = 1e-9
+        for i in range(3):
+            bcp_processor.receive_queue.put(('trigger', {'name': 'budget_test', 'num': i}))
+
+        bcp_processor._get_from_queue(0)
+        self.assertEqual(2, bcp_processor.queue_depth)
+        self.assertGreater(bcp_processor.frame_processing_time, 0)
+
+        bcp_processor._get_from_queue(0)
+        bcp_processor._get_from_queue(0)
+        self.assertEqual(0, bcp_processor.queue_depth)
+        self.advance_time()
+
+        # order is kept
+        self.assertEqual([0, 1, 2], [c[1]['num'] for c in handler.call_args_list])
+
+        # no limit
+        bcp_processor.time_budget = 0
+        for i in range(3):
+            bcp_processor.receive_queue.put(('trigger', {'name': 'budget_test', 'num': i}))
+        bcp_processor._get_from_queue(0)
+        self.assertEqual(0, bcp_processor.queue_depth)
+
+    def test_variable_coalescing(self):
+        bcp_processor = self.mc.bcp_processor
+        self.assertFalse(bcp_processor.coalesce_variables)
+        bcp_processor.coalesce_variables = True
+        var_handler = MagicMock()
+        trigger_handler = MagicMock()
+        self.mc.events.add_handler('machine_var_test_var', var_handler)
+        self.mc.events.add_handler('coalescing_test', trigger_handler)
+
+        for value in (1, 2, 5):
+            bcp_processor.receive_queue.put(('machine_variable', {
+                'name': 'test_var', 'value': value, 'prev_value': value - 1 if value < 5 else 2, 'change': 1}))
+        bcp_processor.receive_queue.put(('trigger', {'name': 'coalescing_test'}))
+        bcp_processor.receive_queue.put(('machine_variable', {
+            'name': 'test_var', 'value': 6, 'prev_value': 5, 'change': 1}))
+
+        bcp_processor._get_from_queue(0)
+        self.advance_time()
+
+        # the last value wins but updates are not moved across other commands
+        self.assertEqual(2, var_handler.call_count)
+        self.assertEqual({'value': 5, 'prev_value': 0, 'change': 5}, var_handler.call_args_list[0][1])
+        self.assertEqual({'value': 6, 'prev_value': 5, 'change': 1}, var_handler.call_args_list[1][1])
+        self.assertEqual(1, trigger_handler.call_count)
+        self.assertEqual(6, self.mc.machine_vars['test_var'])
+        self.assertEqual(2, bcp_processor.coalesced_updates)
+
+        # opt in to see all changes
+        var_handler.reset_mock()
+        bcp_processor.require_all_changes('test_var')
+        for value in (7, 8):
+            bcp_processor.receive_queue.put(('machine_variable', {
+                'name': 'test_var', 'value': value, 'prev_value': value - 1, 'change': 1}))
+        bcp_processor._get_from_queue(0)
+        self.advance_time()
+        self.assertEqual(2, var_handler.call_count)
+
+    def test_stats(self):
+        bcp_processor = self.mc.bcp_processor
+        self.assertFalse(bcp_processor.stats.enabled)
+        bcp_processor.stats.enabled = True
+        bcp_processor.coalesce_variables = True
+
+        received = time.perf_counter()
+        bcp_processor.receive_queue.put(('trigger', {'name': 'stats_test'}, received))
+        bcp_processor.receive_queue.put(('trigger', {'name': 'stats_test'}))
+        for value in (1, 2):
+            bcp_processor.receive_queue.put(('machine_variable', {'name': 'stats_var', 'value': value}, received))
+        bcp_processor._get_from_queue(0)
+
+        summary = bcp_processor.stats.get_summary()
+        trigger_stats = summary['commands']['trigger']
+        self.assertEqual(2, trigger_stats['count'])
+        # only one trigger had a receive timestamp
+        self.assertEqual(1, trigger_stats['queue_wait']['count'])
+        self.assertEqual(1, trigger_stats['latency']['count'])
+        self.assertEqual(2, trigger_stats['processing']['count'])
+        self.assertEqual(2, sum(trigger_stats['processing']['histogram'].values()))
+
+        # the first update was replaced. the applied one keeps its receive timestamp
+        variable_stats = summary['commands']['machine_variable']
+        self.assertEqual(1, variable_stats['coalesced'])
+        self.assertEqual(1, variable_stats['count'])
+        self.assertEqual(1, variable_stats['queue_wait']['count'])
+        self.assertEqual(1, variable_stats['latency']['count'])
+
+        self.send('status_request')
+        status_report = [c for c in self.sent_bcp_commands if c[0] == 'status_report'][-1]
+        self.assertEqual(2, status_report[2]['bcp_stats']['commands']['trigger']['count'])
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix domain sockets are not supported")
+    def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'bcp.sock')
+            server_socket = create_unix_socket(path, self.mc.bcp_processor.log)
+            server_socket.listen(1)
+            self.assertEqual((path, 0), get_host_and_port(server_socket.getsockname()))
+
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(path)
+            connection, client_address = server_socket.accept()
+            self.assertEqual(('', 0), get_host_and_port(client_address))
+            client.sendall(b'trigger?name=foo\n')
+            self.assertEqual(b'trigger?name=foo\n', connection.recv(100))
+            connection.close()
+            client.close()
+            server_socket.close()
+
+            # a stale socket file is replaced
+            create_unix_socket(path, self.mc.bcp_processor.log).close()
+
+            # the socket file is removed when the server stops
+            remove_unix_socket(path)
+            self.assertFalse(os.path.exists(path))
+
+        self.assertEqual(('localhost', 5050), get_host_and_port(('localhost', 5050)))
+
+    def test_shared_memory(self):
+        bcp_processor = self.mc.bcp_processor
+        bcp_processor.socket_thread = MagicMock()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bcp_processor.shared_memory = SharedMemoryRing(os.path.join(tmp_dir, 'bcp.shm'), 8)
+            reader = SharedMemoryRingReader(bcp_processor.shared_memory.path)
+
+            # payloads are only written to the ring after the client attached
+            self.send('shared_memory_attach')
+            self.assertTrue(bcp_processor.shared_memory_attached)
+
+            bcp_processor._send_shared_memory('dmd_frame', b'\x01\x02\x03\x04\x05', {'name': 'dmd'})
+            bcp_processor.socket_thread.send.assert_called_once_with(
+                'dmd_frame?shm_pos=int:0&shm_length=int:5&name=dmd')
+            self.assertEqual(b'\x01\x02\x03\x04\x05', bytes(reader.read(0, 5)))
+
+            # the ring is full until the client released the first payload
+            bcp_processor.socket_thread.send.reset_mock()
+            bcp_processor._send_shared_memory('dmd_frame', b'\x06\x07\x08\x09', {'name': 'dmd'})
+            bcp_processor.socket_thread.send.assert_called_once_with(
+                b'dmd_frame?name=dmd&bytes=4\n', b'\x06\x07\x08\x09')
+            self.assertEqual(1, bcp_processor.shared_memory.overflows)
+
+            # payloads are not split at the end of the ring
+            reader.release(0, 5)
+            bcp_processor.socket_thread.send.reset_mock()
+            bcp_processor._send_shared_memory('dmd_frame', b'\x06\x07\x08\x09', {'name': 'dmd'})
+            bcp_processor.socket_thread.send.assert_called_once_with(
+                'dmd_frame?shm_pos=int:8&shm_length=int:4&name=dmd')
+            self.assertEqual(b'\x06\x07\x08\x09', bytes(reader.read(8, 4)))
+
+            self.send('shared_memory_detach')
+            self.assertFalse(bcp_processor.shared_memory_attached)
+
+            reader.close()
+            bcp_processor._close_shared_memory()
+            self.assertFalse(os.path.exists(os.path.join(tmp_dir, 'bcp.shm')))
+
+    def test_multiple_clients(self):
+        config = self.mc.machine_config['mpf-mc']
+        bcp_port = config['bcp_port']
+        config['bcp_port'] = 0
+        config['bcp_max_clients'] = 3
+        config['bcp_client_queue_size'] = 2
+        server = AsyncioBCPServer(self.mc, self.mc.bcp_processor.receive_queue,
+                                  BcpSendQueue(self.mc.bcp_processor._encode_message))
+        config['bcp_port'] = bcp_port
+        config['bcp_max_clients'] = 1
+
+        main, monitor, rejected = MagicMock(), MagicMock(), MagicMock()
+        main_transport, monitor_transport, rejected_transport = MagicMock(), MagicMock(), MagicMock()
+        for transport in (main_transport, monitor_transport, rejected_transport):
+            transport.is_closing.return_value = False
+            transport.get_extra_info.side_effect = lambda name: None if name == 'socket' else ''
+        server.client_connected(main, main_transport)
+        server.client_connected(monitor, monitor_transport)
+        server.client_connected(rejected, rejected_transport)
+        rejected_transport.close.assert_called_once_with()
+        self.assertEqual([monitor], list(server.monitors))
+
+        # monitors subscribe to categories. their other commands are ignored
+        server.commands_received([('monitor_start', {'category': 'dmd'}),
+                                  ('trigger', {'name': 'from_monitor'})], None, monitor)
+        self.assertEqual({'dmd'}, server.monitors[monitor].categories)
+
+        server.send('trigger?name=foo')
+        server.send(b'dmd_frame?name=dmd&bytes=2\n', b'\x00\x01')
+        server._flush()
+        main_transport.writelines.assert_called_once_with(
+            [b'trigger?name=foo\n', b'dmd_frame?name=dmd&bytes=2\n', b'\x00\x01'])
+        monitor_transport.writelines.assert_called_once_with(
+            [b'dmd_frame?name=dmd&bytes=2\n', b'\x00\x01'])
+
+        # a slow monitor only keeps the latest messages and does not block the main client
+        monitor_transport.writelines.reset_mock()
+        main_transport.writelines.reset_mock()
+        server.client_writing_paused(monitor, True)
+        for i in range(3):
+            server.send(b'dmd_frame?name=dmd&bytes=1\n', bytes([i]))
+        server._flush()
+        self.assertEqual(1, main_transport.writelines.call_count)
+        monitor_transport.writelines.assert_not_called()
+        self.assertEqual(1, server.monitors[monitor].dropped)
+
+        server.client_writing_paused(monitor, False)
+        self.assertEqual([b'\x01', b'\x02'], [c[0][0][1] for c in monitor_transport.writelines.call_args_list])
+
+        # streamed frames wait while the main client is slow. only the newest one is sent
+        main_transport.writelines.reset_mock()
+        server.client_writing_paused(main, True)
+        server.send_stream('dmd_frame:dmd', 'dmd_frame', {'name': 'dmd'}, b'\x03')
+        server.send_stream('dmd_frame:dmd', 'dmd_frame', {'name': 'dmd'}, b'\x04')
+        server.send('trigger?name=bar')
+        server._flush()
+        main_transport.writelines.assert_called_once_with([b'trigger?name=bar\n'])
+        main_transport.writelines.reset_mock()
+        server.client_writing_paused(main, False)
+        main_transport.writelines.assert_called_once_with([b'dmd_frame?name=dmd&bytes=1\n', b'\x04'])
+
+        # monitor_stop without a category ends all subscriptions
+        server.commands_received([('monitor_start', {'category': 'all'}),
+                                  ('monitor_stop', {})], None, monitor)
+        self.assertFalse(server.monitors[monitor].categories)
+
+        # monitors may disconnect at any time
+        server.client_disconnected(monitor)
+        self.assertFalse(server.monitors)
+
+        server.socket.close()
+        server.loop.close()
+
+        # only commands of the main client are processed
+        self.assertEqual(1, self.mc.bcp_processor.receive_queue.qsize())
+
+    def test_send_queue(self):
+        send_queue = BcpSendQueue(self.mc.bcp_processor._encode_message)
+        send_queue.put(('hello?version=1.1', None))
+        send_queue.put_stream('dmd_frame:dmd', 'dmd_frame', {'name': 'dmd'}, b'\x01')
+        send_queue.put_stream('lights', 'trigger', {'name': 'lights', 'values': {'l1': 1, 'l2': 2}}, merge='values')
+        send_queue.put_stream('dmd_frame:dmd', 'dmd_frame', {'name': 'dmd'}, b'\x02')
+        send_queue.put_stream('lights', 'trigger', {'name': 'lights', 'values': {'l2': 3}}, merge='values')
+        send_queue.put(('reset_complete', None))
+        self.assertEqual(4, send_queue.qsize())
+
+        # control messages are sent first and never dropped. streams keep their position
+        self.assertEqual(('hello?version=1.1', None), send_queue.get())
+        self.assertEqual(('reset_complete', None), send_queue.get())
+        self.assertEqual((b'dmd_frame?name=dmd&bytes=1\n', b'\x02'), send_queue.get())
+        msg, rawbytes = send_queue.get_nowait()
+        self.assertIsNone(rawbytes)
+        self.assertEqual(('trigger', {'name': 'lights', 'values': {'l1': 1, 'l2': 3}}),
+                         bcp.decode_command_string(msg))
+
+        with self.assertRaises(queue.Empty):
+            send_queue.get(timeout=.01)
+
+        send_queue.put_stream('dmd_frame:dmd', 'dmd_frame', {'name': 'dmd'}, b'\x03')
+        send_queue.clear_streams()
+        self.assertTrue(send_queue.empty())
+        self.assertEqual({
+            'pending': 0, 'replaced': 2, 'dropped': 1,
+            'streams': {'dmd_frame:dmd': {'sent': 1, 'replaced': 1}, 'lights': {'sent': 1, 'replaced': 1}}},
+            send_queue.get_metrics())
+
+    def test_decoder(self):
+        decoder = BcpDecoder()
+        lines = [
+            b'trigger?name=foo',
+            b'player_variable?name=score&value=int:10&prev_value=int:0&change=int:10&player_num=int:1',
+            b'switch?name=s_start&state=int:1\r',
+            b'trigger?name=a%20b&x=float:1.5&y=bool:True&z=NoneType:&w=',
+            b'hello',
+            b'a?x=1&x=2&y',
+            b'a?n=%2541&m=a+b&k%20e=v',
+            b'a?json={"a": [1, 2]}',
+            bcp.encode_command_string('trigger', name='hi there', v='50%', q='a&b=c', u='\xe9').encode(),
+        ]
+
+        # decode twice to use the cached layouts
+        for _ in range(2):
+            for line in lines:
+                self.assertEqual(bcp.decode_command_string(line.strip().decode()), decoder.decode(line))
+                self.assertEqual(bcp.decode_command_string(line.strip().decode()),
+                                 decoder.decode(memoryview(bytearray(line))))
+
+        self.assertEqual(('dmd_frame', {'name': 'dmd'}, 4),
+                         decoder.decode_with_payload_length(b'dmd_frame?name=dmd&bytes=4'))
+        self.assertEqual(('dmd_frame', {}, 4096), decoder.decode_with_payload_length(b'dmd_frame&bytes=4096'))
+        with self.assertRaises(UnicodeDecodeError):
+            decoder.decode(b'trigger?name=\xff')
+
+    def test_fast_paths(self):
+        bcp_processor = self.mc.bcp_processor
+        self.mock_event('switch_s_start_active')
+        self.mock_event('fast_path_test')
+
+        bcp_processor.receive_queue.put(('switch', {'name': 's_start', 'state': 1}))
+        bcp_processor.receive_queue.put(('trigger', {'name': 'fast_path_test', 'foo': 'bar'}))
+        bcp_processor.receive_queue.put(('player_added', {'player_num': 1}))
+        bcp_processor.receive_queue.put(('player_variable', {
+            'name': 'score', 'value': 100, 'prev_value': 0, 'change': 100, 'player_num': 1}))
+        bcp_processor._get_from_queue(0)
+        self.advance_time()
+
+        self.assertEventCalled('switch_s_start_active')
+        self.assertEventCalledWith('fast_path_test', foo='bar')
+        self.assertEqual(100, self.mc.player_list[0].score)
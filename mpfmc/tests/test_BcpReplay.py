@@ -0,0 +1,72 @@
+import os
+import tempfile
+from unittest.mock import MagicMock
+
+from mpfmc.core.bcp_recorder import read_session, BcpSessionWriter
+from mpfmc.tests.MpfBcpReplayTestCase import MpfBcpReplayTestCase
+
+
+class TestBcpReplay(MpfBcpReplayTestCase):
+
+    def get_machine_path(self):
+        return 'tests/machine_files/bcp'
+
+    def get_config_file(self):
+        return 'test_bcp_processor.yaml'
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self.tmp_dir.cleanup()
+
+    def test_record(self):
+        path = os.path.join(self.tmp_dir.name, 'session.bcp')
+        bcp_processor = self.mc.bcp_processor
+        bcp_processor.start_recording(path)
+
+        bcp_processor.receive_queue.put(('trigger', {'name': 'replay_test', 'num': 1}, 100.0))
+        bcp_processor.receive_queue.put(('machine_variable', {'name': 'replay_var', 'value': 'foo'}, 100.5))
+        bcp_processor.receive_queue.put(('dmd_frame', {'name': 'dmd', 'rawbytes': b'\x00\x01\x02'}, 101.0))
+        bcp_processor._get_from_queue(0)
+        bcp_processor.stop_recording()
+
+        session = list(read_session(path))
+        self.assertEqual([
+            (0.0, 'trigger?name=replay_test&num=int:1', None),
+            (0.5, 'machine_variable?name=replay_var&value=foo', None),
+            (1.0, 'dmd_frame?name=dmd', b'\x00\x01\x02'),
+        ], session)
+
+    def test_replay(self):
+        path = os.path.join(self.tmp_dir.name, 'session.bcp')
+        writer = BcpSessionWriter(path)
+        writer.write(0.0, 'trigger?name=replay_test&num=int:1')
+        writer.write(2.0, 'machine_variable?name=replay_var&value=int:5')
+        writer.write(2.0, 'trigger?name=replay_test&num=int:2')
+        writer.close()
+
+        handler = MagicMock()
+        self.mc.events.add_handler('replay_test', handler)
+
+        start_time = self._current_time
+        frame_times = self.replay_session(path, settle_secs=.5)
+
+        # commands were passed at the recorded time
+        self.assertEqual(3, self.replayed_commands)
+        self.assertGreaterEqual(self._current_time - start_time, 2.5)
+        self.assertEqual([1, 2], [c[1]['num'] for c in handler.call_args_list])
+        self.assertEqual(5, self.mc.machine_vars['replay_var'])
+
+        stats = self.get_frame_time_stats(frame_times)
+        self.assertEqual(len(frame_times), stats['frames'])
+        self.assertGreaterEqual(stats['max_ms'], stats['p95_ms'])
+
+        # as fast as possible
+        handler.reset_mock()
+        start_time = self._current_time
+        self.replay_session(path, speed=0, settle_secs=0)
+        self.assertLess(self._current_time - start_time, 1)
+        self.assertEqual(2, handler.call_count)
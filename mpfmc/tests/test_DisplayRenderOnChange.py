@@ -0,0 +1,57 @@
+from mpfmc.core.display_capture import get_display_capture
+from mpfmc.core.dmd import Dmd
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestDisplayRenderOnChange(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/display'
+
+    def get_config_file(self):
+        return 'test_display_render_on_change.yaml'
+
+    def test_render_on_change(self):
+        window = self.mc.displays['window']
+        dmd = self.mc.displays['dmd']
+
+        self.assertIsNone(window.render_cache)
+        self.assertIsNotNone(dmd.render_cache)
+
+        self.mc.events.post('show_dmd_slide')
+        self.advance_time(.1)
+        self.assertEqual('dmd_slide', dmd.current_slide_name)
+
+        self.assertTrue(dmd.update_render_cache())
+        # nothing changed
+        self.assertFalse(dmd.update_render_cache())
+        self.advance_time(.1)
+        self.assertFalse(dmd.update_render_cache())
+
+        dmd.find_widgets_by_key('dmd_text')[0].text = 'CHANGED'
+        self.advance_time(.1)
+        self.assertTrue(dmd.update_render_cache())
+        self.assertFalse(dmd.update_render_cache())
+
+        # captures use the cached texture of the display
+        capture = get_display_capture(self.mc, dmd)
+        self.assertIs(dmd.render_cache.texture, capture.texture)
+
+    def test_dmd_without_display_output(self):
+        dmd = self.mc.displays['dmd']
+        self.mc.events.post('show_dmd_slide')
+        self.advance_time(.1)
+
+        # the dmd display is not shown in any DisplayOutput. only the DMD
+        # device renders it
+        Dmd(self.mc, 'test_dmd', dict(source_display='dmd', only_send_changes=True))
+        self.advance_time(.1)
+
+        frames = [c[2]['rawbytes'] for c in self.sent_bcp_commands if c[0] == 'dmd_frame']
+        self.assertTrue(frames)
+        first_frame = bytes(frames[-1])
+
+        dmd.find_widgets_by_key('dmd_text')[0].text = 'CHANGED'
+        self.advance_time(.1)
+
+        frames = [c[2]['rawbytes'] for c in self.sent_bcp_commands if c[0] == 'dmd_frame']
+        self.assertNotEqual(first_frame, bytes(frames[-1]))
@@ -1,3 +1,12 @@
+from kivy.graphics.texture import Texture
+
+from mpfmc.core.display_capture import get_display_capture
+from mpfmc.core.dmd import Dmd, RgbDmd
+from mpfmc.core.dmd_conversion import (DEFAULT_LUMINOSITY, get_luminance_table, numpy,
+                                       _convert_to_luminance_numpy, _convert_to_luminance_table)
+from mpfmc.core.dmd_delta import DmdFrameEncoder, DmdFrameDecoder
+from mpfmc.core.light_sampler import LightMapSampler
+from mpfmc.core.readback import FrameReadback
 from mpfmc.tests.MpfSlideTestCase import MpfSlideTestCase
 
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
@@ -57,3 +66,233 @@ class TestDmd(MpfMcTestCase, MpfSlideTestCase):
         self.mc.events.post('show_gamma_test')
         self.advance_time(.1)
         self.assertSlideOnTop("dmd_gamma_test")
+
+    def test_pixel_conversion(self):
+        data = bytes([0, 0, 0,
+                      255, 255, 255,
+                      255, 0, 0,
+                      0, 255, 0,
+                      0, 0, 255,
+                      128, 64, 32])
+
+        self.assertEqual(bytes([0, 15, 4, 9, 2, 5]),
+                         bytes(Dmd._convert_to_single_bytes(data, dict())))
+        self.assertEqual(bytes([0, 15, 15, 0, 0, 8]),
+                         bytes(Dmd._convert_to_single_bytes(data, dict(luminosity=(1, 0, 0)))))
+
+        # with and without numpy the result is bytes
+        table = get_luminance_table(DEFAULT_LUMINOSITY)
+        self.assertEqual(bytes([0, 15, 4, 9, 2, 5]), _convert_to_luminance_table(data, table))
+        self.assertIsInstance(_convert_to_luminance_table(data, table), bytes)
+        if numpy:
+            self.assertIsInstance(_convert_to_luminance_numpy(data, table), bytes)
+
+        self.assertEqual(bytes([0, 0, 0,
+                                255, 255, 255,
+                                0, 0, 255,
+                                0, 255, 0,
+                                255, 0, 0,
+                                32, 64, 128]),
+                         bytes(RgbDmd._reorder_channels(data, "bgr")))
+
+        with self.assertRaises(ValueError):
+            RgbDmd._reorder_channels(data, "rgx")
+
+    def test_gpu_conversion(self):
+        self.mc.events.post('show_gamma_test')
+        self.advance_time(.1)
+
+        self.mc.machine_config['mpf-mc']['dmd_rendering']['devices'] = {
+            'gpu_dmd': {'gpu_conversion': True},
+            'cpu_dmd': {'gpu_conversion': False}}
+        gpu_dmd = Dmd(self.mc, 'gpu_dmd', dict(source_display='dmd'))
+        cpu_dmd = Dmd(self.mc, 'cpu_dmd', dict(source_display='dmd'))
+        self.assertTrue(gpu_dmd.gpu_packing)
+        self.assertFalse(cpu_dmd.gpu_packing)
+        self.advance_time(.1)
+
+        frames = dict()
+        for command, _, kwargs in self.sent_bcp_commands:
+            if command == 'dmd_frame':
+                frames[kwargs['name']] = bytes(kwargs['rawbytes'])
+
+        # both paths result in the same brightness levels
+        self.assertEqual(128 * 32, len(frames['cpu_dmd']))
+        self.assertTrue(any(frames['cpu_dmd']))
+        self.assertEqual(frames['cpu_dmd'], frames['gpu_dmd'])
+
+    def test_readback_latency(self):
+        texture = Texture.create(size=(4, 2), colorfmt='rgba')
+        texture.blit_buffer(bytes(range(32)), colorfmt='rgba', bufferfmt='ubyte')
+
+        readback = FrameReadback(texture, (4, 2), 'rgba', latency=0)
+        self.assertEqual([bytes(range(32))], [bytes(x) for x in readback.push()])
+        self.assertEqual(0, readback.pending)
+
+        readback = FrameReadback(texture, (4, 2), 'rgba', latency=1)
+        self.assertEqual([], readback.push())
+        self.assertEqual(1, readback.pending)
+        self.assertEqual([bytes(range(32))], [bytes(x) for x in readback.push()])
+        self.assertEqual([bytes(range(32))], [bytes(x) for x in readback.flush()])
+        self.assertEqual(0, readback.pending)
+
+    def test_display_capture(self):
+        display = self.mc.displays['dmd']
+        capture = get_display_capture(self.mc, display)
+        self.assertIs(capture, get_display_capture(self.mc, display))
+
+        self.mc.events.post('dmd_slide')
+        self.advance_time(.1)
+
+        # the display is only rendered once per frame for all consumers
+        capture.dirty = True
+        self.assertTrue(capture.update())
+        self.assertFalse(capture.update())
+        frame_number = capture.frame_number
+
+        capture.enable_pixels()
+        self.advance_time(.1)
+        capture.dirty = True
+        self.assertTrue(capture.update())
+        self.assertEqual(frame_number + 1, capture.frame_number)
+        self.assertEqual(1, len(capture.frames))
+        self.assertEqual(128 * 32 * 4, len(capture.frames[0]))
+
+    def test_delta_encoding(self):
+        encoder = DmdFrameEncoder(keyframe_interval=3)
+        decoder = DmdFrameDecoder()
+
+        frame = bytearray(128 * 32)
+        keyframe, seq, frame_hash, payload = encoder.encode(frame)
+        self.assertTrue(keyframe)
+        self.assertEqual(1, seq)
+        self.assertEqual(bytes(frame), decoder.decode(keyframe, seq, frame_hash, payload))
+
+        # unchanged frames are not sent
+        self.assertIsNone(encoder.encode(frame))
+
+        frame[100] = 15
+        frame[2000:2010] = bytes([7] * 10)
+        keyframe, seq, frame_hash, payload = encoder.encode(frame)
+        self.assertFalse(keyframe)
+        self.assertEqual(2, seq)
+        self.assertLess(len(payload), 64)
+        self.assertEqual(bytes(frame), decoder.decode(keyframe, seq, frame_hash, payload))
+
+        frame[4095] = 1
+        keyframe, seq, frame_hash, payload = encoder.encode(frame)
+        self.assertFalse(keyframe)
+        self.assertEqual(bytes(frame), decoder.decode(keyframe, seq, frame_hash, payload))
+
+        # keyframe interval
+        frame[0] = 1
+        keyframe, seq, frame_hash, payload = encoder.encode(frame)
+        self.assertTrue(keyframe)
+        self.assertEqual(4, seq)
+        self.assertEqual(bytes(frame), decoder.decode(keyframe, seq, frame_hash, payload))
+
+        # a lost delta frame is detected
+        frame[1] = 1
+        encoder.encode(frame)
+        frame[2] = 1
+        keyframe, seq, frame_hash, payload = encoder.encode(frame)
+        with self.assertRaises(ValueError):
+            decoder.decode(keyframe, seq, frame_hash, payload)
+
+        # unchanged frames are sent as keyframe after keyframe_time
+        encoder = DmdFrameEncoder(keyframe_time=1.0)
+        encoder.encode(frame, 10.0)
+        self.assertFalse(encoder.keyframe_due(10.5))
+        self.assertTrue(encoder.keyframe_due(11.0))
+        encoder.force_keyframe()
+        self.assertFalse(encoder.keyframe_due(11.0))
+        self.assertTrue(encoder.encode(frame, 11.0)[0])
+
+    def test_delta_frames(self):
+        self.mc.events.post('show_gamma_test')
+        self.advance_time(.1)
+
+        self.mc.machine_config['mpf-mc']['dmd_rendering']['devices'] = {
+            'delta_dmd': {'frame_encoding': 'delta', 'keyframe_time': 1.0}}
+        Dmd(self.mc, 'delta_dmd', dict(source_display='dmd'))
+        decoder = DmdFrameDecoder()
+
+        def get_frames():
+            frames = [c[2] for c in self.sent_bcp_commands if c[0] == 'dmd_frame_delta']
+            self.sent_bcp_commands = list()
+            return [(f['keyframe'], decoder.decode(f['keyframe'], f['seq'], f['hash'], f['rawbytes']))
+                    for f in frames]
+
+        self.advance_time(.1)
+        frames = get_frames()
+        self.assertEqual(1, len(frames))
+        self.assertTrue(frames[0][0])
+        self.assertEqual(128 * 32, len(frames[0][1]))
+        first_frame = frames[0][1]
+
+        # unchanged frames are not sent
+        self.advance_time(.5)
+        self.assertEqual([], get_frames())
+
+        # until a keyframe is due
+        self.advance_time(1)
+        self.assertEqual([(True, first_frame)], get_frames())
+
+        # a reset resends a keyframe
+        self.mc.events.post('mc_reset_complete')
+        self.advance_time(.1)
+        self.assertEqual([(True, first_frame)], get_frames())
+
+    def test_light_map_sampler_gpu_and_cpu(self):
+        self.mc.events.post('show_gamma_test')
+        self.advance_time(.1)
+
+        capture = get_display_capture(self.mc, self.mc.displays['dmd'])
+        # one light in every gray bar and in the text
+        light_map = [((8 * i + 8) / 128, y, "l{}_{}".format(i, y)) for i in range(15) for y in (.1, .5, .9)]
+        gpu_sampler = LightMapSampler(capture, light_map, gpu_sampling=True)
+        cpu_sampler = LightMapSampler(capture, light_map, gpu_sampling=False)
+
+        capture.dirty = True
+        self.advance_time(.1)
+        self.assertTrue(capture.update())
+
+        gpu_samples = gpu_sampler.sample()
+        cpu_samples = cpu_sampler.sample()
+        self.assertEqual(1, len(cpu_samples))
+        self.assertEqual(cpu_samples, [bytes(x) for x in gpu_samples])
+
+        # both paths result in the same light values
+        cpu_values = cpu_sampler.get_changes(cpu_samples[0])
+        self.assertEqual(len(light_map), len(cpu_values))
+        self.assertEqual(cpu_values, gpu_sampler.get_changes(bytes(gpu_samples[0])))
+
+    def test_light_map_sampler(self):
+        self.mc.events.post('dmd_slide')
+        self.advance_time(.1)
+
+        capture = get_display_capture(self.mc, self.mc.displays['dmd'])
+        light_map = [(0, 0, "l0"), (.5, .5, "l1"), (1, 1, "l2"), (.1, .9, "l3")]
+        gpu_sampler = LightMapSampler(capture, light_map, gpu_sampling=True)
+        cpu_sampler = LightMapSampler(capture, light_map, gpu_sampling=False)
+
+        capture.dirty = True
+        self.advance_time(.1)
+        self.assertTrue(capture.update())
+
+        gpu_samples = gpu_sampler.sample()
+        cpu_samples = cpu_sampler.sample()
+        self.assertEqual(1, len(gpu_samples))
+        self.assertEqual(4 * 4, len(gpu_samples[0]))
+        self.assertEqual(cpu_samples, [bytes(x) for x in gpu_samples])
+
+        # nothing new until the capture renders again
+        self.assertEqual([], gpu_sampler.sample())
+        self.assertEqual([], cpu_sampler.sample())
+
+        changes = cpu_sampler.get_changes(b'\x00\x00\x00\x00' + b'\xff\x00\x00\xff' * 3)
+        self.assertEqual({"l0": -1, "l1": (255, 0, 0), "l2": (255, 0, 0), "l3": (255, 0, 0)}, changes)
+        changes = cpu_sampler.get_changes(b'\x00\x00\x00\x00' + b'\xff\x00\x00\xff' * 2 + b'\x00\x00\xff\xff')
+        self.assertEqual({"l3": (0, 0, 255)}, changes)
+        self.assertEqual({}, cpu_sampler.get_changes(
+            b'\x00\x00\x00\x00' + b'\xff\x00\x00\xff' * 2 + b'\x00\x00\xff\xff'))
@@ -0,0 +1,41 @@
+from kivy.clock import Clock
+
+from mpfmc.core.frame_rate import AdaptiveFrameRate
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestFrameRate(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/display'
+
+    def get_config_file(self):
+        return 'test_display_single.yaml'
+
+    def test_adaptive_fps(self):
+        full_fps = Clock._max_fps
+        frame_rate = AdaptiveFrameRate(self.mc, {
+            'idle_fps': 5,
+            'idle_delay': 1,
+            'displays': {'window': {'idle_fps': 10, 'track_changes': False}}})
+
+        # the highest idle_fps wins
+        self.assertEqual(10, frame_rate.idle_fps)
+
+        frame_rate.notify_activity()
+        frame_rate._check_activity(0)
+        self.assertFalse(frame_rate.idle)
+
+        # hysteresis
+        self.advance_time(.5)
+        frame_rate._check_activity(0)
+        self.assertFalse(frame_rate.idle)
+
+        self.advance_time(1)
+        frame_rate._check_activity(0)
+        self.assertTrue(frame_rate.idle)
+        self.assertEqual(10, Clock._max_fps)
+
+        # back to full rate with the next activity
+        frame_rate.notify_activity()
+        self.assertFalse(frame_rate.idle)
+        self.assertEqual(full_fps, Clock._max_fps)
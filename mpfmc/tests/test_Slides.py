@@ -121,3 +121,61 @@ class TestSlides(MpfMcTestCase):
 
         self.assertEventNotCalled('slide_slide1_active')
         self.assertEventCalled('slide_slide2_active', 1)
+
+
+class TestSlideTemplateCache(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/slide'
+
+    def get_config_file(self):
+        return 'test_slide_template_cache.yaml'
+
+    def test_reuse_widgets(self):
+        display = self.mc.targets['display1']
+        cache = self.mc.slide_template_cache
+
+        display.show_slide('award_slide', award='JACKPOT')
+        self.advance_time(.5)
+        slide = display.current_slide
+        text = slide.children[0].widget
+        self.assertEqual('AWARD JACKPOT', text.text)
+        self.assertLess(text.opacity, 1)
+        self.assertEqual(1, cache.misses)
+
+        display.remove_slide('award_slide')
+        self.advance_time()
+        self.assertEqual([], slide.children)
+        self.assertEqual(2, cache.widget_count)
+
+        # the same widgets are reset and shown again
+        display.show_slide('award_slide', award='EXTRA BALL')
+        self.advance_time()
+        self.assertIsNot(slide, display.current_slide)
+        self.assertIs(text, display.current_slide.children[0].widget)
+        self.assertEqual('AWARD EXTRA BALL', text.text)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(0, cache.widget_count)
+
+        # the animation is registered again
+        self.advance_time(.5)
+        self.assertLess(text.opacity, 1)
+
+        # removing widgets by key leaves an incomplete tree which is dropped
+        display.current_slide.children[-1].widget.remove()
+        display.remove_slide('award_slide')
+        self.advance_time()
+        self.assertEqual(0, cache.widget_count)
+
+        # least recently used trees are dropped when the cache is full
+        display.show_slide('award_slide', award='JACKPOT')
+        self.advance_time()
+        display.remove_slide('award_slide')
+        display.show_slide('other_slide')
+        self.advance_time()
+        display.remove_slide('other_slide')
+        self.advance_time()
+        self.assertEqual(3, cache.widget_count)
+
+        display.show_slide('award_slide', award='JACKPOT')
+        self.advance_time()
+        self.assertEqual(1, cache.hits)
@@ -1,4 +1,7 @@
+from unittest.mock import patch
+
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+from mpfmc.widgets.text import compile_text
 
 
 class TestText(MpfMcTestCase):
@@ -122,6 +125,35 @@ class TestText(MpfMcTestCase):
         self.assertEqual(self.get_widget().text, '100')
         self.assertGreater(self.get_widget().width, old_width)
 
+    def test_compiled_text(self):
+        template = compile_text('SCORE (player|score) (machine|credits) (player2|score) (name)!')
+        self.assertEqual(('SCORE ', '(player|score)', ' ', '(machine|credits)', ' ', '(player2|score)', ' ',
+                          '(name)', '!'), template.parts)
+        self.assertEqual(['player', 'machine', 'numbered', 'any'], [slot.source for slot in template.slots])
+        self.assertEqual(2, template.slots[2].player_num)
+        self.assertIs(template, compile_text('SCORE (player|score) (machine|credits) (player2|score) (name)!'))
+
+        self.mc.game_start()
+        self.mc.add_player(1)
+        self.mc.player_start_turn(1)
+        self.advance_time()
+        self.mc.player.test_var = 1
+
+        self.mc.events.post('text_with_player_var1')
+        self.advance_time()
+        widget = self.get_widget()
+        self.assertEqual('1', widget.text)
+
+        with patch.object(widget._label, 'texture_update') as texture_update:
+            # kwargs which are not in the text do not render it again
+            widget.update_kwargs(other_param=5)
+            texture_update.assert_not_called()
+
+            self.mc.player.test_var = 2
+            self.advance_time()
+            self.assertEqual('2', widget.text)
+            texture_update.assert_called_once_with()
+
     def test_player_var2(self):
         # 'player' specified
         self.mc.game_start()
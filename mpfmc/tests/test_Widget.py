@@ -918,6 +918,58 @@ class TestWidget(MpfMcTestCase):
         self.assertAlmostEqual(-310, w8.anchor_offset_pos[0], delta=20)
         self.assertEqual(790, w8.x)  # anchor_x: right, x: right-10
 
+    def test_config_overlay(self):
+        self.mc.targets['default'].add_slide(name='slide1')
+        self.mc.targets['default'].show_slide('slide1')
+        library_config = self.mc.widgets['widget8'][0]
+        original_config = dict(library_config)
+
+        # validated configs are frozen
+        with self.assertRaises(TypeError):
+            library_config['font_size'] = 10
+        with self.assertRaises(TypeError):
+            library_config['_default_settings'].append('font_size')
+
+        self.mc.events.post('add_widget8_custom_settings')
+        self.advance_time()
+
+        w8 = [x.widget for x in self.mc.targets[
+              'default'].current_slide.widgets
+              if x.widget.key == '_global-widget8'][0]
+
+        # widget settings only change the config of the widget
+        self.assertEqual(70, w8.config['font_size'])
+        self.assertEqual(original_config, dict(library_config))
+        self.assertIs(library_config['_default_settings'], w8.config['_default_settings'])
+
+    def test_find_widgets_by_key(self):
+        display = self.mc.targets['default']
+        slide1 = display.add_slide(name='slide1')
+        display.show_slide('slide1')
+        self.mc.events.post('add_widget1_to_current')
+        self.advance_time()
+
+        w1 = slide1.children[0].widget
+        self.assertEqual([w1], self.mc.widget_index.get('_global-widget1'))
+        self.assertEqual([w1], display.find_widgets_by_key('_global-widget1'))
+        self.assertEqual([w1], slide1.find_widgets_by_key('_global-widget1'))
+        self.assertEqual([w1], w1.find_widgets_by_key('_global-widget1'))
+
+        # widgets on slides which are not shown are still found
+        slide2 = display.add_slide(name='slide2', priority=100)
+        display.show_slide('slide2', priority=100)
+        self.advance_time()
+        self.assertEqual([w1], display.find_widgets_by_key('_global-widget1'))
+        self.assertEqual([], slide2.find_widgets_by_key('_global-widget1'))
+
+        # the index follows key changes and removals
+        w1.key = 'new_key'
+        self.assertEqual([], display.find_widgets_by_key('_global-widget1'))
+        self.assertEqual([w1], display.find_widgets_by_key('new_key'))
+
+        display.remove_widgets_by_key('new_key')
+        self.assertEqual([], display.find_widgets_by_key('new_key'))
+
     def test_widget_removal_from_slide_player(self):
         # tests that we can remove a widget by key that was shown via the
         # slide player instead of the widget player
@@ -1302,3 +1354,61 @@ class TestWidget(MpfMcTestCase):
         self.mc.bcp_processor.send.assert_any_call('trigger', name='text_on_new_slide2_removed')
 
 
+class TestWidgetPool(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/widgets'
+
+    def get_config_file(self):
+        return 'test_widget_pool.yaml'
+
+    def _get_widgets(self):
+        return [x.widget for x in self.mc.targets['default'].current_slide.widgets]
+
+    def test_recycle_expired_widget(self):
+        self.mc.targets['default'].add_slide(name='slide1')
+        self.mc.targets['default'].show_slide('slide1')
+        pool = self.mc.widget_pool
+
+        self.mc.events.post('add_popup', points=100)
+        self.advance_time()
+        popup = self._get_widgets()[0]
+        self.assertEqual('+100', popup.text)
+        self.assertEqual(1, pool.misses)
+
+        self.advance_time(1)
+        self.assertEqual([], self._get_widgets())
+
+        # the expired widget is reset and shown again
+        self.mc.events.post('add_popup', points=200)
+        self.advance_time()
+        self.assertEqual([popup], self._get_widgets())
+        self.assertEqual('+200', popup.text)
+        self.assertEqual(1, pool.hits)
+
+        # and expires again
+        self.advance_time(1)
+        self.assertEqual([], self._get_widgets())
+
+    def test_pool_per_widget_settings(self):
+        self.mc.targets['default'].add_slide(name='slide1')
+        self.mc.targets['default'].show_slide('slide1')
+        pool = self.mc.widget_pool
+
+        self.mc.events.post('add_dot_left')
+        self.advance_time()
+        dot_left = self._get_widgets()[0]
+        self.mc.events.post('remove_dots')
+        self.advance_time()
+        self.assertEqual([], self._get_widgets())
+
+        # different widget_settings do not use the pooled widget
+        self.mc.events.post('add_dot_right')
+        self.advance_time()
+        self.assertIsNot(dot_left, self._get_widgets()[0])
+        self.assertEqual(0, pool.hits)
+
+        self.mc.events.post('add_dot_left')
+        self.advance_time()
+        self.assertIn(dot_left, self._get_widgets())
+        self.assertEqual('dot_left', dot_left.key)
+        self.assertEqual(1, pool.hits)
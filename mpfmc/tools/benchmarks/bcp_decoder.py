@@ -0,0 +1,58 @@
+"""Throughput benchmark for decoding incoming BCP commands.
+
+Compares mpfmc.core.bcp_decoder with decode_command_string from MPF on a
+mix of the most frequent commands.
+
+Run with: python -m mpfmc.tools.benchmarks.bcp_decoder
+"""
+import timeit
+
+import mpf.core.bcp.bcp_socket_client as bcp
+
+from mpfmc.core.bcp_decoder import BcpDecoder
+
+LINES = [
+    b'trigger?name=ball_save_active',
+    b'switch?name=s_left_flipper&state=int:1',
+    b'switch?name=s_left_flipper&state=int:0',
+    b'player_variable?name=score&value=int:125430&prev_value=int:124430&change=int:1000&player_num=int:1',
+    b'player_variable?name=ramps_made&value=int:4&prev_value=int:3&change=int:1&player_num=int:1',
+    b'machine_variable?name=credits_string&value=FREE%20PLAY&prev_value=&change=bool:True',
+    b'trigger?name=light_show_step&priority=int:200&show_tokens=%7B%7D',
+    b'mode_start?name=multiball&priority=int:500',
+]
+
+
+def reference_decode(lines):
+    """Decode like the MC did before mpfmc.core.bcp_decoder."""
+    return [bcp.decode_command_string(line.strip().decode()) for line in lines]
+
+
+def _run(name, func, number, count):
+    seconds = timeit.timeit(func, number=number) / number
+    print("  {:<24} {:>9.2f} us/command {:>12.0f} commands/s".format(
+        name, seconds / count * 1e6, count / seconds))
+
+
+def main(number=200, repeat=125):
+    """Run the benchmark."""
+    lines = LINES * repeat
+    buffer = memoryview(bytearray(b'\n'.join(lines)))
+    offsets = []
+    pos = 0
+    for line in lines:
+        offsets.append((pos, pos + len(line)))
+        pos += len(line) + 1
+
+    decoder = BcpDecoder()
+    assert reference_decode(lines) == [decoder.decode(line) for line in lines]
+
+    print("{} commands".format(len(lines)))
+    _run("decode_command_string", lambda: reference_decode(lines), number, len(lines))
+    _run("BcpDecoder (bytes)", lambda: [decoder.decode(line) for line in lines], number, len(lines))
+    _run("BcpDecoder (memoryview)",
+         lambda: [decoder.decode(buffer[start:end]) for start, end in offsets], number, len(lines))
+
+
+if __name__ == '__main__':
+    main()
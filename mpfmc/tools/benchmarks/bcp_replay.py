@@ -0,0 +1,53 @@
+"""Load test which replays a recorded BCP session headless.
+
+Record a session with "mpf mc --record-bcp session.bcp" while playing a game.
+The replay runs the MC with the machine config and simulated time and
+reports the real time of every frame.
+
+Run with: python -m mpfmc.tools.benchmarks.bcp_replay <machine_path> <session_file> [-c config] [-s speed]
+"""
+import argparse
+import os
+import unittest
+
+from mpfmc.tests.MpfBcpReplayTestCase import MpfBcpReplayTestCase
+
+
+def create_test_case(machine_path, config_file, session_file, speed):
+    """Return a test case class which replays the session."""
+    class BcpReplayBenchmark(MpfBcpReplayTestCase):
+
+        def get_machine_path(self):
+            return machine_path
+
+        def get_config_file(self):
+            return config_file
+
+        def test_replay(self):
+            frame_times = self.replay_session(session_file, speed)
+            print("Replayed {} commands".format(self.replayed_commands))
+            print("{frames} frames. Frame time avg {avg_ms:.3f} ms, p95 {p95_ms:.3f} ms, max {max_ms:.3f} ms".format(
+                **self.get_frame_time_stats(frame_times)))
+
+    return BcpReplayBenchmark
+
+
+def main():
+    """Run the replay."""
+    parser = argparse.ArgumentParser(description='Replays a recorded BCP session into the MPF-MC')
+    parser.add_argument("machine_path", help="Path of the machine folder")
+    parser.add_argument("session_file", help="The recorded BCP session")
+    parser.add_argument("-c", dest="configfile", default="config.yaml",
+                        help="The config file to load. Default is config.yaml")
+    parser.add_argument("-s", dest="speed", type=float, default=0,
+                        help="Replay speed. 1 replays at recorded speed. Default is 0 (as fast as possible)")
+    args = parser.parse_args()
+
+    test_case = create_test_case(os.path.abspath(args.machine_path), args.configfile,
+                                 os.path.abspath(args.session_file), args.speed)
+    suite = unittest.TestSuite([test_case('test_replay')])
+    unittest.TextTestRunner(verbosity=0).run(suite)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Micro benchmark for the DMD pixel conversion.
+
+Compares the whole-frame conversion in mpfmc.core.dmd_conversion with the
+previous per-pixel implementation for common DMD sizes.
+
+Run with: python -m mpfmc.tools.benchmarks.dmd_conversion
+"""
+import os
+import random
+import struct
+import timeit
+
+from mpfmc.core import dmd_conversion
+
+SIZES = ((128, 32), (192, 64), (256, 64))
+LUMINOSITY = (.299, .587, .114)
+
+
+def reference_luminance(data, luminosity):
+    """Per pixel implementation used before mpfmc.core.dmd_conversion."""
+    new_data = bytearray()
+    for r, g, b in struct.iter_unpack('BBB', data):
+        pixel_weight = ((r * luminosity[0]) + (g * luminosity[1]) + (b * luminosity[2])) / 255.
+        new_data.append(int(round(pixel_weight * 15)))
+
+    return new_data
+
+
+def reference_reorder(data, order):
+    """Per pixel implementation used before mpfmc.core.dmd_conversion."""
+    new_data = bytearray()
+    for r, g, b in struct.iter_unpack('BBB', data):
+        for channel in order:
+            if channel == "r":
+                new_data.append(r)
+            elif channel == "g":
+                new_data.append(g)
+            else:
+                new_data.append(b)
+
+    return new_data
+
+
+def _run(name, func, number):
+    seconds = timeit.timeit(func, number=number) / number
+    print("  {:<28} {:>9.3f} ms/frame {:>9.1f} fps".format(name, seconds * 1000, 1 / seconds))
+
+
+def main(number=50):
+    """Run the benchmark."""
+    print("NumPy available: {}".format(dmd_conversion.numpy is not None))
+    table = dmd_conversion.get_luminance_table(LUMINOSITY)
+
+    for width, height in SIZES:
+        # rendered slides only use a limited number of colors
+        palette = [os.urandom(3) for _ in range(64)]
+        data = b''.join(random.choice(palette) for _ in range(width * height))
+        print("{}x{}".format(width, height))
+
+        assert bytes(reference_luminance(data, LUMINOSITY)) == bytes(
+            dmd_conversion.convert_to_luminance(data, LUMINOSITY))
+        assert reference_reorder(data, 'bgr') == dmd_conversion.reorder_channels(data, 'bgr')
+
+        _run("luminance (per pixel)", lambda: reference_luminance(data, LUMINOSITY), number)
+        _run("luminance (lookup table)",
+             lambda: dmd_conversion._convert_to_luminance_table(data, table), number)
+        if dmd_conversion.numpy is not None:
+            _run("luminance (numpy)",
+                 lambda: dmd_conversion._convert_to_luminance_numpy(data, table), number)
+        _run("reorder bgr (per pixel)", lambda: reference_reorder(data, 'bgr'), number)
+        _run("reorder bgr (slices)", lambda: dmd_conversion.reorder_channels(data, 'bgr'), number)
+
+
+if __name__ == '__main__':
+    main()
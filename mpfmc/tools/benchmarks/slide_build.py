@@ -0,0 +1,131 @@
+"""Benchmark for building slides with copy-on-write widget configs.
+
+Without arguments it compares deep copying a slide of typical validated
+widget configs (like the MC did before mpfmc.core.frozen_config) with
+creating overlays. With a machine folder and a slide name it builds that
+slide headless in the MC with both strategies and with the slide template
+cache and reports the build time.
+
+Run with: python -m mpfmc.tools.benchmarks.slide_build [machine_path slide_name] [-c config] [-n count]
+"""
+import argparse
+import os
+import time
+import timeit
+import unittest
+from copy import deepcopy
+from unittest.mock import patch
+
+from mpfmc.core.frozen_config import freeze, overlay
+
+
+def reference_overlay(config, overrides=None):
+    """Copy configs like the MC did before mpfmc.core.frozen_config."""
+    result = deepcopy(config)
+    if overrides:
+        result.update(overrides)
+    return result
+
+
+def get_widget_config(index):
+    """Return a config which looks like a validated text widget."""
+    config = {
+        'type': 'text', 'text': 'PLAYER {} SCORE (score)'.format(index), 'key': None, 'z': index,
+        'x': None, 'y': 'top-{}%'.format(index), 'anchor_x': None, 'anchor_y': None,
+        'round_anchor_x': None, 'round_anchor_y': None, 'adjust_top': None, 'adjust_bottom': None,
+        'adjust_left': None, 'adjust_right': None, 'opacity': 1.0, 'rotation': 0, 'scale': 1.0,
+        'color': [1.0, 1.0, 1.0, 1.0], 'font_name': None, 'font_size': 15, 'bold': False,
+        'italic': False, 'halign': 'center', 'valign': 'middle', 'padding_x': 0, 'padding_y': 0,
+        'text_size': None, 'shorten': True, 'mipmap': False, 'markup': False, 'line_height': 1.0,
+        'max_lines': 0, 'strip': True, 'shorten_from': 'center', 'split_str': '',
+        'unicode_errors': 'replace', 'casing': None, 'number_grouping': True, 'min_digits': 1,
+        'style': ['score', 'dmd_small'], 'expire': None, 'events_when_added': None,
+        'events_when_removed': None, 'reset_animations_events': ['remove_from_slide'],
+        '_default_settings': ['text', 'y', 'z'],
+        'animations': {
+            'show_slide': [
+                {'property': ['y'], 'value': ['-10'], 'relative': True, 'duration': 0.25,
+                 'easing': 'out_quad', 'timing': 'after_previous', 'repeat': False},
+                {'property': ['opacity'], 'value': ['1'], 'relative': False, 'duration': 0.25,
+                 'easing': 'linear', 'timing': 'with_previous', 'repeat': False}],
+            'score_changed': [
+                {'property': ['scale'], 'value': ['1.2'], 'relative': False, 'duration': 0.1,
+                 'easing': 'linear', 'timing': 'after_previous', 'repeat': False}],
+        },
+    }
+    return config
+
+
+def _run(name, func, number, count):
+    seconds = timeit.timeit(func, number=number) / number
+    print("  {:<24} {:>9.2f} us/slide {:>9.2f} us/widget".format(name, seconds * 1e6, seconds / count * 1e6))
+
+
+def run_config_copies(widgets=30, number=1000):
+    """Compare the config copies of a slide with many widgets."""
+    configs = [get_widget_config(index) for index in range(widgets)]
+    frozen_configs = freeze(configs)
+    assert [reference_overlay(config) for config in configs] == [overlay(config) for config in frozen_configs]
+
+    print("Config copies for a slide with {} widgets".format(widgets))
+    _run("deepcopy", lambda: [reference_overlay(config) for config in configs], number, widgets)
+    _run("overlay", lambda: [overlay(config) for config in frozen_configs], number, widgets)
+
+
+def create_test_case(machine_path, config_file, slide_name, count):
+    """Return a test case class which builds the slide."""
+    # pylint: disable-msg=import-outside-toplevel
+    from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+    from mpfmc.uix import widget
+    from mpfmc.uix.slide_template_cache import SlideTemplateCache
+
+    class SlideBuildBenchmark(MpfMcTestCase):
+
+        def get_machine_path(self):
+            return machine_path
+
+        def get_config_file(self):
+            return config_file
+
+        def _build_slides(self):
+            display = self.mc.targets['default']
+            config = self.mc.slides[slide_name]
+            start = time.perf_counter()
+            for index in range(count):
+                display.add_slide('slide_build_benchmark_{}'.format(index), config=config).remove()
+            return (time.perf_counter() - start) / count
+
+        def test_build(self):
+            self.mc.slide_template_cache = None
+            with patch.object(widget, 'overlay', reference_overlay):
+                before = self._build_slides()
+            after = self._build_slides()
+            self.mc.slide_template_cache = SlideTemplateCache(1000)
+            cached = self._build_slides()
+            print("Slide {} with {} widgets: deepcopy {:.3f} ms, overlay {:.3f} ms, template cache {:.3f} ms "
+                  "({} hits)".format(slide_name, len(self.mc.slides[slide_name]['widgets']), before * 1000,
+                                     after * 1000, cached * 1000, self.mc.slide_template_cache.hits))
+
+    return SlideBuildBenchmark
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark for building slides')
+    parser.add_argument("machine_path", nargs='?', help="Path of the machine folder")
+    parser.add_argument("slide_name", nargs='?', help="The slide to build")
+    parser.add_argument("-c", dest="configfile", default="config.yaml",
+                        help="The config file to load. Default is config.yaml")
+    parser.add_argument("-n", dest="count", type=int, default=100,
+                        help="Number of slides to build. Default is 100")
+    args = parser.parse_args()
+
+    run_config_copies()
+    if args.machine_path and args.slide_name:
+        test_case = create_test_case(os.path.abspath(args.machine_path), args.configfile, args.slide_name,
+                                     args.count)
+        unittest.TextTestRunner(verbosity=0).run(unittest.TestSuite([test_case('test_build')]))
+
+
+if __name__ == '__main__':
+    main()
@@ -13,9 +13,10 @@ from kivy.uix.screenmanager import (ScreenManager, NoTransition,
 from kivy.uix.widget import Widget as KivyWidget, WidgetException as KivyWidgetException
 from kivy.uix.scatter import Scatter
 from kivy.graphics import (
-    Translate, Fbo, ClearColor, ClearBuffers, Scale)
+    Translate, Fbo, ClearColor, ClearBuffers, Scale, Rectangle)
 from kivy.properties import ObjectProperty
 
+from mpfmc.core.frozen_config import overlay
 from mpfmc.uix.widget import WidgetContainer, Widget
 from mpfmc.uix.slide import Slide
 
@@ -84,6 +85,10 @@ class Display(ScreenManager):
         self.container.z = 0
         self.container.add_widget(self)
 
+        self.render_cache = None
+        if self._get_rendering_setting('render_on_change'):
+            self._create_render_cache()
+
         self._display_created()
 
     def __repr__(self):
@@ -113,6 +118,41 @@ class Display(ScreenManager):
 
         return data
 
+    def _get_rendering_setting(self, setting: str):
+        """Return a setting from the mpf-mc: display_rendering: section.
+
+        Settings in the displays: subsection for this display take precedence
+        over the global ones.
+        """
+        settings = self.mc.machine_config['mpf-mc']['display_rendering']
+        display_settings = (settings.get('displays') or {}).get(self.name) or {}
+        return display_settings.get(setting, settings.get(setting))
+
+    def _create_render_cache(self) -> None:
+        """Composite the display into a texture which is only re-rendered on changes.
+
+        The Fbo is only drawn again when an instruction in the display canvas
+        changed, e.g. because a widget property, an animation, a video
+        texture or a slide transition changed. Until then all outputs of this
+        display reuse the texture.
+        """
+        self.render_cache = Fbo(size=self.native_size, with_stencilbuffer=True)
+        with self.render_cache:
+            ClearColor(0, 0, 0, 0)
+            ClearBuffers()
+        self.render_cache.add(self.container.canvas)
+
+    def update_render_cache(self) -> bool:
+        """Render the cached texture now if the display changed.
+
+        Returns True if the texture has been rendered.
+        """
+        if not self.render_cache.needs_redraw:
+            return False
+
+        self.render_cache.draw()
+        return True
+
     @property
     def ready(self):
         """Return true if display is ready."""
@@ -343,7 +383,7 @@ class Display(ScreenManager):
         if not play_kwargs:
             play_kwargs = kwargs
         else:
-            play_kwargs.update(kwargs)
+            play_kwargs = overlay(play_kwargs, kwargs)
 
         if self.has_screen(slide_name):
             slide = self.get_screen(slide_name)
@@ -360,11 +400,7 @@ class Display(ScreenManager):
 
         # update the widgets with whatever kwargs came through here
         if play_kwargs:
-            for widget in slide.walk():
-                try:
-                    widget.update_kwargs(**play_kwargs)
-                except AttributeError:
-                    pass
+            slide.update_kwargs(**play_kwargs)
 
         if not transition:
             try:  # anon slides are in the collection
@@ -424,7 +460,7 @@ class Display(ScreenManager):
         if not play_kwargs:
             play_kwargs = kwargs
         else:
-            play_kwargs.update(kwargs)
+            play_kwargs = overlay(play_kwargs, kwargs)
 
         slide_obj = self.add_slide(name=slide_name,
                                    config=dict(widgets=widgets, background_color=background_color),
@@ -498,6 +534,7 @@ class Display(ScreenManager):
         except ScreenManagerException:
             return False
 
+        slide.release_widgets()
         return True
 
     def _remove_transition(self, transition):
@@ -577,23 +614,26 @@ class Display(ScreenManager):
             widget.prepare_for_removal()
             if isinstance(widget, Widget) and widget.container and widget.container.parent:
                 widget.container.parent.remove_widget(widget.container)
+                widget.return_to_pool()
             elif widget.parent:
                 widget.parent.remove_widget(widget)
 
     def find_widgets_by_key(self, key: str) -> List["KivyWidget"]:
         """Retrieves a list of all widgets with the specified key value."""
-        widgets = []
-
-        # First find all matching widgets owned by the slide parent
-        for child in self.parent_widgets:
-            widgets.extend([x for x in child.walk(restrict=True, loopback=False)
-                            if hasattr(x, "key") and x.key == key])
+        return [widget for widget in self.mc.widget_index.get(key) if self._owns_widget(widget)]
 
-        # Finally find all matching widgets owned by each slide
-        for slide in self.slides:
-            widgets.extend(slide.find_widgets_by_key(key))
+    def _owns_widget(self, widget: "KivyWidget") -> bool:
+        """Return true if the widget is owned by the slide parent or a slide of this display."""
+        parent = widget.parent
+        while parent is not None:
+            if parent is self.container:
+                return True
+            if isinstance(parent, Slide):
+                # slides which are not shown have no parent
+                return parent.manager is self
+            parent = parent.parent
 
-        return widgets
+        return False
 
     def _post_active_slide_event(self, dt) -> None:
         """Posts an event that a new slide is now active."""
@@ -627,6 +667,7 @@ class DisplayOutput(Scatter):
         super().__init__(**kwargs)
 
         self.key = None
+        self._cache_rectangle = None
 
         # It is important that the content of this display output does not contain any
         # circular references to the same display (cannot do a recursive
@@ -665,7 +706,14 @@ class DisplayOutput(Scatter):
         widget.parents.append(self)
 
         canvas = self.canvas
-        canvas.add(widget.container.canvas)
+        if widget.render_cache:
+            # the fbo renders the display when it changed. the rectangle shows it
+            canvas.add(widget.render_cache)
+            self._cache_rectangle = Rectangle(size=widget.native_size,
+                                              texture=widget.render_cache.texture)
+            canvas.add(self._cache_rectangle)
+        else:
+            canvas.add(widget.container.canvas)
 
     def remove_display_source(self, widget):
         """Remove a display."""
@@ -675,7 +723,12 @@ class DisplayOutput(Scatter):
                 ' of the Display class.')
         widget.parents.remove(self)
         widget.parent = None
-        self.canvas.remove(widget.container.canvas)
+        if widget.render_cache:
+            self.canvas.remove(widget.render_cache)
+            self.canvas.remove(self._cache_rectangle)
+            self._cache_rectangle = None
+        else:
+            self.canvas.remove(widget.container.canvas)
 
     def __repr__(self) -> str:  # pragma: no cover
         try:
@@ -1,6 +1,7 @@
 """A slide which can show widgets."""
 from bisect import bisect
 from typing import List, Optional
+from weakref import WeakSet
 
 from kivy.graphics.vertex_instructions import Rectangle
 from kivy.uix.screenmanager import Screen
@@ -11,6 +12,7 @@ from kivy.properties import ListProperty, AliasProperty
 
 from mpfmc.uix.widget import (WidgetContainer, Widget,
                               create_widget_objects_from_config)
+from mpfmc.uix.widget_index import is_in_tree
 from mpfmc.core.mc import MpfMc
 
 
@@ -44,6 +46,8 @@ class Slide(Screen, StencilView):
         self.priority = priority
         self.pending_widgets = set()
         self.key = key
+        self._kwargs_widgets = WeakSet()
+        # widgets on this slide with an update_kwargs method
         self.mc.track_leak_reference(self)
 
         if not config:
@@ -60,11 +64,25 @@ class Slide(Screen, StencilView):
         self.orig_w, self.orig_h = self.size
         self.z = 0
 
+        # widgets built from the slide config which are returned to the
+        # slide template cache when the slide is removed
+        self._template = None
+        self._template_widgets = None
+
         if 'widgets' in config:  # don't want try, swallows too much
-            widgets = create_widget_objects_from_config(
-                mc=self.mc,
-                config=config['widgets'], key=self.key,
-                play_kwargs=play_kwargs)
+            widgets = None
+            if self.mc.slide_template_cache and config['widgets']:
+                self._template = config['widgets']
+                widgets = self.mc.slide_template_cache.acquire(self._template, self.key, play_kwargs)
+
+            if widgets is None:
+                widgets = create_widget_objects_from_config(
+                    mc=self.mc,
+                    config=config['widgets'], key=self.key,
+                    play_kwargs=play_kwargs)
+
+            if self._template is not None:
+                self._template_widgets = widgets
 
             self.add_widgets(widgets)
 
@@ -179,6 +197,13 @@ class Slide(Screen, StencilView):
         # Insert the widget in the proper position in the z-order
         super().add_widget(widget, bisect(self.children, widget))
 
+        self._kwargs_widgets.update(x for x in widget.walk(restrict=True) if hasattr(x, 'update_kwargs'))
+
+    def update_kwargs(self, **kwargs) -> None:
+        """Pass play kwargs to the widgets on this slide which use them."""
+        for widget in [x for x in self._kwargs_widgets if is_in_tree(x, self)]:
+            widget.update_kwargs(**kwargs)
+
     def remove_widgets_by_key(self, key: str) -> None:
         """Removes all widgets from this slide with the specified key value."""
         for widget in self.find_widgets_by_key(key):
@@ -188,10 +213,9 @@ class Slide(Screen, StencilView):
                 self.remove_widget(widget)
 
     def find_widgets_by_key(self, key: str) -> List["Widget"]:
-        """Return a list of widgets with the matching key value by searching
-        the tree of children belonging to this slide."""
-        return [w for child in self.children
-                for w in child.walk(restrict=True, loopback=False) if hasattr(w, "key") and w.key == key]
+        """Return a list of widgets with the matching key value in the tree
+        of children belonging to this slide."""
+        return [w for w in self.mc.widget_index.get(key) if is_in_tree(w, self)]
 
     def add_widget_to_parent_frame(self, widget: "KivyWidget"):
         """Adds this widget to this slide's parent instead of to this slide.
@@ -254,6 +278,39 @@ class Slide(Screen, StencilView):
 
         """
 
+    def release_widgets(self) -> None:
+        """Return the widgets of this removed slide to the slide template cache.
+
+        The widgets stay on the slide until it is no longer drawn (e.g. when
+        the transition out has finished).
+        """
+        if not self._template_widgets:
+            return
+
+        if self.parent:
+            self.fbind('parent', self._release_widgets_when_detached)
+        else:
+            self._release_widgets()
+
+    def _release_widgets_when_detached(self, instance, parent):
+        del instance
+        if not parent:
+            self.funbind('parent', self._release_widgets_when_detached)
+            self._release_widgets()
+
+    def _release_widgets(self):
+        widgets = self._template_widgets
+        self._template_widgets = None
+
+        # widgets which have been removed by key leave an incomplete tree
+        if any(widget.parent is not self for widget in widgets):
+            return
+
+        for widget in widgets:
+            self.remove_widget(widget)
+
+        self.mc.slide_template_cache.release(self._template, widgets)
+
     def on_pre_enter(self, *args):
         del args
         for widget in self.children:
@@ -0,0 +1,127 @@
+"""Pool of built widget trees for slides which are shown again and again.
+
+Building a slide creates all its widgets, their containers and animation
+event handlers. Slides like shot awards or jackpot splashes are shown
+hundreds of times per game with the same widgets. When such a slide is
+removed (and its transition out has finished) its top level widget
+containers are detached and kept in this cache. The next slide built from
+the same widgets config takes them from the cache and resets them instead
+of creating new widgets.
+
+Entries are keyed by the (validated and unchanged) widgets list of the slide
+config so named slides and the anonymous slides of slide players both use
+the cache. Only trees where all widgets are :attr:`Widget.reusable` are
+kept. The cache is a LRU which is limited by the total number of pooled
+widgets.
+"""
+from collections import OrderedDict
+from typing import List, Optional
+
+from kivy.uix.widget import Widget as KivyWidget
+
+from mpfmc.uix.widget import Widget
+
+
+class SlideTemplateCache:
+
+    """LRU pool of detached widget trees of removed slides.
+
+    Args:
+        max_widgets: Maximum number of widgets in all pooled trees. The least
+            recently used trees are dropped when there are more.
+
+    """
+
+    def __init__(self, max_widgets: int) -> None:
+        """Initialise slide template cache."""
+        self.max_widgets = max_widgets
+        self.widget_count = 0
+        self.hits = 0
+        self.misses = 0
+        self._pool = OrderedDict()  # id(template) -> (template, list of (containers, widgets))
+
+    @staticmethod
+    def is_cacheable(template: list) -> bool:
+        """Return true if slides with this widgets config can use the cache.
+
+        Library widgets with a placeholder name may result in different
+        widgets per play so those slides are always built from scratch.
+        """
+        return not any(hasattr(config.get('widget'), 'evaluate') for config in template)
+
+    def acquire(self, template: list, key: Optional[str] = None,
+                play_kwargs: Optional[dict] = None) -> Optional[List[KivyWidget]]:
+        """Return reset top level widgets for a new slide or None.
+
+        Args:
+            template: The widgets list of the slide config.
+            key: The key of the new slide.
+            play_kwargs: The play kwargs of the new slide.
+
+        Returns:
+            The widgets in the order they have been created or None if there
+            is no pooled tree for this config.
+        """
+        # the pool references the template so its id cannot be reused
+        entry = self._pool.get(id(template))
+        if entry is None:
+            self.misses += 1
+            return None
+
+        containers, widgets = entry[1][-1]
+        if key and "." not in key and any(widget.config.get('key') and widget.config['key'] != key
+                                          for widget in widgets):
+            # building the slide raises an error for this key
+            self.misses += 1
+            return None
+
+        entry[1].pop()
+        if entry[1]:
+            self._pool.move_to_end(id(template))
+        else:
+            del self._pool[id(template)]
+        self.widget_count -= len(widgets)
+        self.hits += 1
+
+        for widget in widgets:
+            widget.reset(key=widget.config.get('key') or key, play_kwargs=play_kwargs)
+
+        return containers
+
+    def release(self, template: list, containers: List[KivyWidget]) -> None:
+        """Add the detached top level widgets of a removed slide to the pool.
+
+        The widgets have to be prepared for removal already. Trees with
+        widgets which are not reusable are dropped.
+
+        Args:
+            template: The widgets list of the slide config.
+            containers: The top level widgets in the order they have been
+                created.
+        """
+        widgets = []
+        for container in containers:
+            for widget in container.walk(restrict=True):
+                if isinstance(widget, Widget):
+                    if not widget.reusable:
+                        return
+                    widgets.append(widget)
+
+        if not widgets or len(widgets) > self.max_widgets or not self.is_cacheable(template):
+            return
+
+        entry = self._pool.pop(id(template), None) or (template, [])
+        entry[1].append((containers, widgets))
+        self._pool[id(template)] = entry
+        self.widget_count += len(widgets)
+
+        while self.widget_count > self.max_widgets:
+            oldest_template, trees = next(iter(self._pool.values()))
+            self.widget_count -= len(trees.pop(0)[1])
+            if not trees:
+                del self._pool[id(oldest_template)]
+
+    def clear(self) -> None:
+        """Drop all pooled trees."""
+        self._pool.clear()
+        self.widget_count = 0
@@ -1,7 +1,6 @@
 # pylint: disable-msg=too-many-lines
 """A widget on a slide."""
 from typing import Union, Optional, List, Tuple
-from copy import deepcopy
 from functools import reduce
 import math
 
@@ -15,6 +14,8 @@ from kivy.properties import (NumericProperty, ReferenceListProperty,
 from mpf.core.rgba_color import RGBAColor
 
 from mpfmc.uix.relative_animation import RelativeAnimation
+from mpfmc.uix.widget_index import is_in_tree
+from mpfmc.core.frozen_config import overlay
 from mpfmc.core.utils import percent_to_float
 
 MYPY = False
@@ -69,14 +70,24 @@ class Widget(KivyWidget):
     animation_properties = list()
     """List of properties for this widget that may be animated using widget animations."""
 
+    reusable = False
+    """True if removed widgets of this class can be shown again after
+    :meth:`reset`. Widgets which play media or hold other external state
+    are always created from scratch."""
+
     def __init__(self, mc: "MpfMc", config: Optional[dict] = None,
                  key: Optional[str] = None, **kwargs) -> None:
         del kwargs
         self._container = None
+        self._key = None
+        self.pool_key = None
+        # key in the widget pool (see mpfmc.uix.widget_pool) or None if this
+        # widget is not recycled
         self.size_hint = (None, None)
 
-        # Needs to be deepcopy since configs can have nested dicts
-        self.config = deepcopy(config)
+        # Copy-on-write overlay of the validated config. Only top level keys
+        # are changed per widget. Nested values are shared (and frozen).
+        self.config = overlay(config)
 
         super().__init__(**self.pass_to_kivy_widget_init())
 
@@ -119,19 +130,26 @@ class Widget(KivyWidget):
         # Has to be after we set the attributes since it could be in the config
         self.key = key
 
-        # Build animations
-        if 'animations' in self.config and self.config['animations']:
-            for k, v in self.config['animations'].items():
-                if k.split("{")[0] == 'add_to_slide':
-                    # needed because the initial properties of the widget
-                    # aren't set yet
-                    Clock.schedule_once(self.on_add_to_slide, -1)
-
-                elif k not in magic_events:
-                    self._register_animation_events(k)
-        else:
+        if not self.config.get('animations'):
             self.config['animations'] = dict()
 
+        self.expire = config.get('expire', None)
+
+        self._activate()
+
+    def _activate(self) -> None:
+        """Register the animation events, schedule the expiration and post
+        the events_when_added of this widget."""
+        # Build animations
+        for k in self.config['animations'].keys():
+            if k.split("{")[0] == 'add_to_slide':
+                # needed because the initial properties of the widget
+                # aren't set yet
+                Clock.schedule_once(self.on_add_to_slide, -1)
+
+            elif k not in magic_events:
+                self._register_animation_events(k)
+
         # why is this needed? Why is it not config validated by here? todo
         if 'reset_animations_events' in self.config:
             for event in [x for x in self.config['reset_animations_events'] if x not in magic_events]:
@@ -139,7 +157,6 @@ class Widget(KivyWidget):
                     event=event, handler=self.reset_animations))
 
         # Set widget expiration (if configured)
-        self.expire = config.get('expire', None)
         if self.expire:
             self.schedule_removal(self.expire)
 
@@ -148,6 +165,22 @@ class Widget(KivyWidget):
             for event in self.config['events_when_added']:
                 self.mc.post_mc_native_event(event)
 
+    def reset(self, key: Optional[str] = None, play_kwargs: Optional[dict] = None) -> None:
+        """Prepare a removed widget to be added to a slide again.
+
+        Restores all animated properties and registers the event handlers
+        again. Only called for widgets with :attr:`reusable` set.
+
+        Args:
+            key: The new key of the widget.
+            play_kwargs: The play kwargs of the new slide or widget player.
+        """
+        del play_kwargs
+        self.stop_animation()
+        self.reset_animations()
+        self.key = key
+        self._activate()
+
     def __repr__(self) -> str:  # pragma: no cover
         return '<{} Widget id={}>'.format(self.widget_type_name, id(self))
 
@@ -447,6 +480,12 @@ class Widget(KivyWidget):
             pass
 
         self.on_remove_from_slide()
+        self.return_to_pool()
+
+    def return_to_pool(self) -> None:
+        """Add this removed widget to the widget pool if it is recycled."""
+        if self.pool_key is not None and not self._container.parent:
+            self.mc.widget_pool.release(self)
 
     def _convert_animation_value_to_float(self, prop: str,
                                           val: Union[str, int, float], event_args) -> Union[float, int]:
@@ -726,14 +765,26 @@ class Widget(KivyWidget):
             self.start_animation_from_event('slide_play')
 
     def find_widgets_by_key(self, key: str) -> List["KivyWidget"]:
-        """Return a list of widgets with the matching key value by searching
-        the tree of children belonging to this widget."""
-        return [x for x in self.walk(restrict=True, loopback=False) if hasattr(x, 'key') and x.key == key]
+        """Return a list of widgets with the matching key value in the tree
+        of children belonging to this widget (including this widget)."""
+        return [x for x in self.mc.widget_index.get(key) if is_in_tree(x, self)]
 
     #
     # Properties
     #
 
+    def _get_key(self) -> Optional[str]:
+        return self._key
+
+    def _set_key(self, key: Optional[str]) -> None:
+        self.mc.widget_index.update(self, self._key, key)
+        self._key = key
+
+    key = property(_get_key, _set_key)
+    """Widget keys are used to uniquely identify instances of widgets which you can later
+    use to update or remove the widget. Widgets are indexed by key to find them without
+    walking the widget tree (see mpfmc.uix.widget_index)."""
+
     def _get_container(self) -> KivyWidget:
         return self._container
 
@@ -741,11 +792,6 @@ class Widget(KivyWidget):
     '''The widget container is a special container/parent widget that manages this widget.
     It has no graphical representation.'''
 
-    key = StringProperty(None, allownone=True)
-    '''Widget keys are used to uniquely identify instances of widgets which you can later
-    use to update or remove the widget.
-    '''
-
     color = ListProperty([1.0, 1.0, 1.0, 1.0])
     '''The color of the widget, in the (r, g, b, a) format.
 
@@ -886,12 +932,16 @@ def create_widget_objects_from_config(mc: "MpfMc", config: Union[dict, list],
                                                                 play_kwargs=play_kwargs,
                                                                 widget_settings=widget_settings)
             continue
+        widget_cls = mc.widgets.type_map[widget['type']]
         if widget_settings:
             widget_settings = mc.config_validator.validate_config(
                 'widgets:{}'.format(widget['type']), widget_settings,
                 base_spec='widgets:common', add_missing_keys=False)
 
-            widget.update(widget_settings)
+        pool_key = mc.widget_pool.get_key(widget_cls, widget, widget_settings) if mc.widget_pool else None
+
+        if widget_settings:
+            widget = overlay(widget, widget_settings)
 
         configured_key = widget.get('key', None)
 
@@ -905,8 +955,10 @@ def create_widget_objects_from_config(mc: "MpfMc", config: Union[dict, list],
         else:
             this_key = key
 
-        widget_obj = mc.widgets.type_map[widget['type']](
-            mc=mc, config=widget, key=this_key, play_kwargs=play_kwargs)
+        widget_obj = mc.widget_pool.acquire(pool_key, this_key, play_kwargs) if pool_key else None
+        if widget_obj is None:
+            widget_obj = widget_cls(mc=mc, config=widget, key=this_key, play_kwargs=play_kwargs)
+            widget_obj.pool_key = pool_key
 
         top_widget = widget_obj
 
@@ -0,0 +1,76 @@
+"""Index of widgets by key.
+
+Finding widgets by key used to walk the widget tree of every slide on every
+display. Widgets now register their key in this index when it is set (see
+:attr:`Widget.key`) so lookups only look at the widgets with that key. The
+display, slide and widget lookups filter the matches by their position in
+the widget tree.
+"""
+import weakref
+from typing import List, Optional
+
+from kivy.uix.widget import Widget as KivyWidget
+
+
+def is_in_tree(widget: KivyWidget, root: KivyWidget) -> bool:
+    """Return true if the widget is the root or one of its descendants."""
+    while widget is not None:
+        if widget is root:
+            return True
+        widget = widget.parent
+
+    return False
+
+
+class WidgetKeyIndex:
+
+    """Live widgets per key.
+
+    Only weak references are held so removed widgets drop out once they are
+    garbage collected. Widgets of a key are returned in the order their key
+    has been set.
+    """
+
+    def __init__(self) -> None:
+        """Initialise widget key index."""
+        self._widgets = dict()  # key -> list of weak references
+
+    def update(self, widget: KivyWidget, old_key: Optional[str], new_key: Optional[str]) -> None:
+        """Move a widget from its old key to its new key.
+
+        Args:
+            widget: The widget.
+            old_key: The previous key or None.
+            new_key: The new key or None.
+        """
+        if old_key == new_key:
+            return
+
+        if old_key is not None and old_key in self._widgets:
+            self._prune(old_key, widget)
+
+        if new_key is not None:
+            if new_key in self._widgets:
+                self._prune(new_key)
+            self._widgets.setdefault(new_key, []).append(weakref.ref(widget))
+
+    def get(self, key: str) -> List[KivyWidget]:
+        """Return all live widgets with a key."""
+        refs = self._widgets.get(key)
+        if not refs:
+            return []
+
+        widgets = [ref() for ref in refs]
+        if any(widget is None for widget in widgets):
+            self._prune(key)
+            widgets = [widget for widget in widgets if widget is not None]
+
+        return widgets
+
+    def _prune(self, key: str, removed_widget: Optional[KivyWidget] = None) -> None:
+        """Drop dead references and the removed widget from a key."""
+        refs = [ref for ref in self._widgets[key] if ref() is not None and ref() is not removed_widget]
+        if refs:
+            self._widgets[key] = refs
+        else:
+            del self._widgets[key]
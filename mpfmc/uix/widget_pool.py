@@ -0,0 +1,106 @@
+"""Pool of removed widgets which are recycled for new widgets of the same config.
+
+Score popups, shot indicators and other widgets added by the widget player
+are created and removed all the time. Each of them allocates Kivy
+properties, canvas instructions and a WidgetContainer. When many of them
+expire at once (e.g. during multiball) the garbage collector pauses the MC.
+
+With the pool, removed widgets of :attr:`Widget.reusable` classes are kept
+per widget class and config. The next widget created from the same config
+takes one from the pool and resets it (see :meth:`Widget.reset`) instead of
+constructing a new one.
+
+Only frozen configs (those of the config collections and config players
+which live as long as the MC) are pooled so the config can be identified by
+its id. Widgets created with widget_settings are pooled per settings.
+"""
+from typing import Optional
+
+from mpfmc.core.frozen_config import FrozenDict
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.uix.widget import Widget
+
+
+def _get_hashable(value):
+    if isinstance(value, dict):
+        return tuple(sorted((key, _get_hashable(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_get_hashable(item) for item in value)
+    return value
+
+
+class WidgetPool:
+
+    """Removed widgets per widget class and config.
+
+    Args:
+        size: Maximum number of pooled widgets per widget class and config.
+            Widgets removed when the pool is full are dropped.
+
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialise widget pool."""
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._pool = dict()     # pool key -> list of widgets
+
+    @staticmethod
+    def get_key(widget_cls, config: dict, widget_settings: Optional[dict] = None) -> Optional[tuple]:
+        """Return the pool key for a widget or None if it cannot be pooled.
+
+        Args:
+            widget_cls: The widget class.
+            config: The validated widget config (before widget_settings are
+                applied).
+            widget_settings: Optional validated widget settings which
+                override the config.
+        """
+        if not widget_cls.reusable or not isinstance(config, FrozenDict):
+            return None
+
+        key = (widget_cls, id(config), _get_hashable(widget_settings) if widget_settings else None)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    def acquire(self, pool_key: tuple, key: Optional[str] = None,
+                play_kwargs: Optional[dict] = None) -> Optional["Widget"]:
+        """Return a reset widget from the pool or None if the pool is empty.
+
+        Args:
+            pool_key: The key from :meth:`get_key`.
+            key: The key of the new widget.
+            play_kwargs: The play kwargs of the new widget.
+        """
+        widgets = self._pool.get(pool_key)
+        if not widgets:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        widget = widgets.pop()
+        widget.reset(key=key, play_kwargs=play_kwargs)
+        return widget
+
+    def release(self, widget: "Widget") -> None:
+        """Add a removed widget to the pool.
+
+        The widget has to be prepared for removal and its container must not
+        have a parent anymore.
+        """
+        widgets = self._pool.setdefault(widget.pool_key, [])
+        if len(widgets) >= self.size or any(pooled is widget for pooled in widgets):
+            return
+
+        widgets.append(widget)
+
+    def clear(self) -> None:
+        """Drop all pooled widgets."""
+        self._pool.clear()
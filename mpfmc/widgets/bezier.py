@@ -19,6 +19,7 @@ class Bezier(Widget):
 
     widget_type_name = 'Bezier'
     animation_properties = ('color', 'thickness', 'opacity', 'points', 'rotation', 'scale')
+    reusable = True
 
     def __init__(self, mc: "MpfMc", config: dict, key: Optional[str] = None, **kwargs) -> None:
         """Initialise bezier."""
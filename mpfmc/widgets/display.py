@@ -4,6 +4,7 @@ from kivy.uix.effectwidget import EffectWidget
 
 from kivy.uix.relativelayout import RelativeLayout
 
+from mpfmc.core.frozen_config import overlay
 from mpfmc.uix.widget import Widget
 from mpfmc.uix.display import DisplayOutput
 
@@ -61,8 +62,7 @@ class DisplayWidget(Widget, RelativeLayout):
         if config:
             effects_list = list()
             for effect_config in config:
-                effect_config['width'] = self.width
-                effect_config['height'] = self.height
+                effect_config = overlay(effect_config, dict(width=self.width, height=self.height))
                 effects_list.extend(self.mc.effects_manager.get_effect(effect_config))
 
             self.effects.effects = effects_list
@@ -18,6 +18,7 @@ class Ellipse(Widget):
     widget_type_name = 'Ellipse'
     animation_properties = ('x', 'y', 'width', 'pos', 'height', 'size', 'color',
                             'angle_start', 'angle_end', 'opacity', 'rotation', 'scale')
+    reusable = True
     merge_settings = ('width', 'height')
 
     def __init__(self, mc: "MpfMc", config: dict, key: Optional[str] = None, **kwargs) -> None:
@@ -20,6 +20,7 @@ class Line(Widget):
 
     widget_type_name = 'Line'
     animation_properties = ('color', 'thickness', 'opacity', 'points', 'rotation', 'scale')
+    reusable = True
 
     def __init__(self, mc: "MpfMc", config: dict, key: Optional[str] = None, **kwargs) -> None:
         del kwargs
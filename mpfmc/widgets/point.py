@@ -19,6 +19,7 @@ class Point(Widget):
 
     widget_type_name = 'Point'
     animation_properties = ('points', 'pointsize', 'color', 'opacity', 'rotation', 'scale')
+    reusable = True
 
     def __init__(self, mc: "MpfMc", config: dict, key: Optional[str] = None, **kwargs) -> None:
         del kwargs
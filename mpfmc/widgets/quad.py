@@ -19,6 +19,7 @@ class Quad(Widget):
 
     widget_type_name = 'Quad'
     animation_properties = ('points', 'color', 'opacity', 'rotation', 'scale')
+    reusable = True
 
     def __init__(self, mc: "MpfMc", config: dict, key: Optional[str] = None, **kwargs) -> None:
         del kwargs
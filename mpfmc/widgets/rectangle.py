@@ -18,6 +18,7 @@ class Rectangle(Widget):
     widget_type_name = 'Rectangle'
     animation_properties = ('x', 'y', 'width', 'height', 'color', 'opacity', 'corner_radius',
                             'rotation', 'scale')
+    reusable = True
 
     def __init__(self, mc: "MpfMc", config: dict, key: Optional[str] = None, **kwargs) -> None:
         del kwargs
@@ -1,5 +1,7 @@
 """A text widget on a slide."""
 import re
+from collections import namedtuple
+from functools import lru_cache
 from typing import Optional
 
 from kivy.uix.label import Label
@@ -49,9 +51,62 @@ class BitmapFontLabel(Label):
         self._label = LabelBitmapFont(self.mc, **dkw)
 
 
-var_finder = re.compile(r"(?<=\()[a-zA-Z_0-9|]+(?=\))")
+var_splitter = re.compile(r"\(([a-zA-Z_0-9|]+)\)")
 string_finder = re.compile(r"(?<=\$)[a-zA-Z_0-9]+")
 
+TextSlot = namedtuple('TextSlot', ['index', 'variable', 'source', 'name', 'player_num'])
+"""A (variable) in a text. source is "machine" for (machine|name), "player"
+for (player|name), "numbered" for (playerX|name), "any" for (name) which
+may be a player variable or a kwarg and None for everything else."""
+
+
+def _compile_slot(index: int, variable: str) -> TextSlot:
+    if variable.startswith('machine|'):
+        return TextSlot(index, variable, 'machine', variable.split('|')[1], None)
+    if variable.startswith('player|'):
+        return TextSlot(index, variable, 'player', variable.split('|')[1], None)
+    if '|' not in variable:
+        return TextSlot(index, variable, 'any', variable, None)
+
+    source, _, name = variable.partition('|')
+    player_num = source.lstrip('player')
+    if source.startswith('player') and player_num.isdigit():
+        return TextSlot(index, variable, 'numbered', name, int(player_num))
+
+    return TextSlot(index, variable, None, name, None)
+
+
+class CompiledText:
+
+    """Text of a text widget split into literal parts and variable slots.
+
+    parts contains the literal text and the unresolved "(variable)" at the
+    index of every slot. Widgets copy the parts, replace the slots with
+    their values and join them to render the text.
+    """
+
+    __slots__ = ["parts", "slots"]
+
+    def __init__(self, text: str) -> None:
+        """Compile text."""
+        parts = []
+        slots = []
+        for position, part in enumerate(var_splitter.split(text)):
+            if position % 2:
+                slots.append(_compile_slot(len(parts), part))
+                parts.append('({})'.format(part))
+            elif part:
+                parts.append(part)
+
+        self.parts = tuple(parts)
+        self.slots = tuple(slots)
+
+
+@lru_cache(maxsize=1024)
+def compile_text(text: str) -> CompiledText:
+    """Return the (shared) compiled template of a text."""
+    return CompiledText(text)
+
 
 class Text(Widget):
 
@@ -64,6 +119,7 @@ class Text(Widget):
                       'max_lines', 'strip', 'shorten_from', 'split_str',
                       'unicode_errors', 'color', 'casing')
     animation_properties = ('x', 'y', 'font_size', 'color', 'opacity', 'rotation', 'scale')
+    reusable = True
 
     def __init__(self, mc: "MpfMc", config: dict, key: Optional[str] = None,
                  play_kwargs: Optional[dict] = None, **kwargs) -> None:
@@ -78,6 +134,8 @@ class Text(Widget):
         self.rectangle = None
         self.rotate = None
         self.scale_instruction = None
+        self._rendered_text = None
+        self._variable_handler_keys = dict()
 
         super().__init__(mc=mc, config=config, key=key)
 
@@ -87,13 +145,14 @@ class Text(Widget):
             self.adjust_bottom = self._label.get_label().get_descent() * -1
 
         self.original_text = self._get_text_string(config.get('text', ''))
+        self._compiled_text = compile_text(self.original_text)
+        self._text_parts = list(self._compiled_text.parts)
 
-        self.text_variables = dict()
         if play_kwargs:
             self.event_replacements = play_kwargs
         else:
             self.event_replacements = kwargs
-        self._process_text(self.original_text)
+        self._process_text()
 
         # Bind to all properties that when changed need to force
         # the widget to be redrawn
@@ -166,9 +225,14 @@ class Text(Widget):
             if self.config['anchor_y'] == 'baseline':
                 self.adjust_bottom = self._label.get_label().get_descent() * -1
 
+    def reset(self, key: Optional[str] = None, play_kwargs: Optional[dict] = None) -> None:
+        super().reset(key, play_kwargs)
+        self.event_replacements = dict(play_kwargs) if play_kwargs else dict()
+        self._process_text()
+
     def update_kwargs(self, **kwargs) -> None:
         self.event_replacements.update(kwargs)
-        self._process_text(self.original_text)
+        self._update_slots(self._compiled_text.slots)
 
     def _get_text_string(self, text: str) -> str:
         if '$' not in text:
@@ -187,62 +251,66 @@ class Text(Widget):
             # if the text string is not found, put the $ back on
             return '${}'.format(text_string)
 
-    @staticmethod
-    def _get_text_vars(text: str):
-        return var_finder.findall(text)
+    def _process_text(self) -> None:
+        """Resolve all variables of the text and watch those which may change."""
+        for slot in self._compiled_text.slots:
+            self._update_slot(slot)
+            if slot.variable not in self.event_replacements:
+                self._setup_variable_monitor(slot)
 
-    def _process_text(self, text: str) -> None:
-        for var_string in self._get_text_vars(text):
-            if var_string in self.event_replacements:
-                text = text.replace('({})'.format(var_string),
-                                    str(self.event_replacements[var_string]))
+        self.update_text(''.join(self._text_parts))
 
-        if self._get_text_vars(text):
-            # monitors won't be added twice, so it's ok to blindly call this
-            self._setup_variable_monitors(text)
+    def _get_slot_value(self, slot: TextSlot) -> Optional[str]:
+        """Return the value of a variable or None if it is unknown."""
+        if slot.variable in self.event_replacements:
+            return str(self.event_replacements[slot.variable])
 
-        self.update_vars_in_text(text)
+        if slot.source == 'machine':
+            try:
+                return str(self.mc.machine_vars[slot.name])
+            except KeyError:
+                return ''
 
-    def update_vars_in_text(self, text: str) -> None:
-        for var_string in self._get_text_vars(text):
-            if var_string.startswith('machine|'):
+        if self.mc.player:
+            if slot.source == 'player':
+                return str(self.mc.player[slot.name])
+
+            if slot.source == 'numbered':
                 try:
-                    text = text.replace('(' + var_string + ')',
-                                        str(self.mc.machine_vars[var_string.split('|')[1]]))
-                except KeyError:
-                    text = text.replace('(' + var_string + ')', '')
-
-            elif self.mc.player:
-                if var_string.startswith('player|'):
-                    text = text.replace('(' + var_string + ')',
-                                        str(self.mc.player[var_string.split('|')[1]]))
-                    continue
-                elif var_string.startswith('player') and '|' in var_string:
-                    player_num, var_name = var_string.lstrip('player').split('|')
-                    try:
-                        value = self.mc.player_list[int(player_num) - 1][
-                            var_name]
-
-                        if value is not None:
-                            text = text.replace('(' + var_string + ')',
-                                                str(value))
-                        else:
-                            text = text.replace('(' + var_string + ')', '')
-                    except IndexError:
-                        text = text.replace('(' + var_string + ')', '')
-                    continue
-                elif self.mc.player.is_player_var(var_string):
-                    text = text.replace('(' + var_string + ')',
-                                        str(self.mc.player[var_string]))
-                    continue
-
-            if var_string in self.event_replacements:
-                text = text.replace('({})'.format(var_string),
-                                    str(self.event_replacements[var_string]))
-
-        self.update_text(text)
+                    value = self.mc.player_list[slot.player_num - 1][slot.name]
+                except IndexError:
+                    return ''
+                return str(value) if value is not None else ''
+
+            if slot.source == 'any' and self.mc.player.is_player_var(slot.name):
+                return str(self.mc.player[slot.name])
+
+        return None
+
+    def _update_slot(self, slot: TextSlot) -> bool:
+        """Update the text part of a variable and return true if it changed."""
+        value = self._get_slot_value(slot)
+        if value is None:
+            value = self._compiled_text.parts[slot.index]
+
+        if self._text_parts[slot.index] == value:
+            return False
+
+        self._text_parts[slot.index] = value
+        return True
+
+    def _update_slots(self, slots) -> None:
+        """Update some variables and render the text if one of them changed."""
+        changed = False
+        for slot in slots:
+            if self._update_slot(slot):
+                changed = True
+
+        if changed:
+            self.update_text(''.join(self._text_parts))
 
     def update_text(self, text: str) -> None:
+        """Format and show a text. Nothing is rendered if the text did not change."""
         if text:
             if self.config['min_digits']:
                 text = text.zfill(self.config['min_digits'])
@@ -260,51 +328,55 @@ class Text(Widget):
             if self.config.get('casing', None) in ('lower', 'upper', 'title', 'capitalize'):
                 text = getattr(text, self.config['casing'])()
 
+        if text == self._rendered_text:
+            return
+
         self._label.text = text
+        self._rendered_text = text
         self._label.texture_update()
         self._draw_widget()
 
-    def _player_var_change(self, **kwargs) -> None:
+    def _player_var_change(self, text_variable: str, **kwargs) -> None:
+        del kwargs
+        self._update_slots([slot for slot in self._compiled_text.slots
+                            if slot.name == text_variable and slot.source in ('player', 'numbered', 'any')])
+
+    def _current_player_change(self, **kwargs) -> None:
         del kwargs
-        self.update_vars_in_text(self.original_text)
+        self._update_slots([slot for slot in self._compiled_text.slots if slot.source in ('player', 'any')])
 
-    def _machine_var_change(self, **kwargs) -> None:
+    def _machine_var_change(self, text_variable: str, **kwargs) -> None:
         del kwargs
-        self.update_vars_in_text(self.original_text)
-
-    def _setup_variable_monitors(self, text: str) -> None:
-        for var_string in self._get_text_vars(text):
-            if '|' not in var_string:
-                self.add_player_var_handler(name=var_string)
-                self.add_current_player_handler()
-            else:
-                source, variable_name = var_string.split('|')
-                if source.lower().startswith('player'):
-
-                    if source.lstrip('player'):  # we have player num
-                        self.add_player_var_handler(name=variable_name)
-                    else:  # no player num
-                        self.add_player_var_handler(name=variable_name)
-                        self.add_current_player_handler()
-                elif source.lower() == 'machine':
-                    self.add_machine_var_handler(name=variable_name)
+        self._update_slots([slot for slot in self._compiled_text.slots
+                            if slot.name == text_variable and slot.source == 'machine'])
+
+    def _setup_variable_monitor(self, slot: TextSlot) -> None:
+        if slot.source in ('player', 'any'):
+            self.add_player_var_handler(name=slot.name)
+            self.add_current_player_handler()
+        elif slot.source == 'numbered':
+            self.add_player_var_handler(name=slot.name)
+        elif slot.source == 'machine':
+            self.add_machine_var_handler(name=slot.name)
+
+    def _add_variable_handler(self, event: str, handler, **kwargs) -> None:
+        # monitors won't be added twice
+        if event not in self._variable_handler_keys:
+            self._variable_handler_keys[event] = self.mc.events.add_handler(event, handler, **kwargs)
 
     def add_player_var_handler(self, name: str) -> None:
-        self.mc.events.replace_handler('player_{}'.format(name),
-                                       self._player_var_change)
+        self._add_variable_handler('player_{}'.format(name), self._player_var_change, text_variable=name)
 
     def add_current_player_handler(self) -> None:
-        self.mc.events.replace_handler('player_turn_start',
-                                       self._player_var_change)
+        self._add_variable_handler('player_turn_start', self._current_player_change)
 
     def add_machine_var_handler(self, name: str) -> None:
-        self.mc.events.add_handler('machine_var_{}'.format(name),
-                                   self._machine_var_change)
+        self._add_variable_handler('machine_var_{}'.format(name), self._machine_var_change, text_variable=name)
 
     def prepare_for_removal(self) -> None:
         super().prepare_for_removal()
-        self.mc.events.remove_handler(self._player_var_change)
-        self.mc.events.remove_handler(self._machine_var_change)
+        self.mc.events.remove_handlers_by_keys(self._variable_handler_keys.values())
+        self._variable_handler_keys = dict()
 
     @staticmethod
     def group_digits(text: str, separator: str = ',', group_size: int = 3) -> str:
@@ -351,6 +423,7 @@ class Text(Widget):
 
     def _set_text(self, text: str) -> None:
         self._label.text = text
+        self._rendered_text = None
 
     text = AliasProperty(_get_text, _set_text)
     '''Text of the label.
@@ -19,6 +19,7 @@ class Triangle(Widget):
 
     widget_type_name = 'Triangle'
     animation_properties = ('points', 'color', 'opacity', 'rotation', 'scale')
+    reusable = True
 
     def __init__(self, mc: "MpfMc", config: dict, key: Optional[str] = None, **kwargs) -> None:
         del kwargs